@@ -1,5 +1,29 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optional: compile the selector's and dashboard's signal-handling glue with Cython.
+# Opt in with ENVSTARTER_CYTHON=1; plain Python is used otherwise.
+ext_modules = []
+if os.environ.get("ENVSTARTER_CYTHON") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("⚠️  ENVSTARTER_CYTHON=1 but Cython is not installed - building pure Python")
+    else:
+        ext_modules = cythonize(
+            [
+                "src/envstarter/gui/environment_selector.py",
+                "src/envstarter/gui/multi_environment_dashboard.py",
+            ],
+            compiler_directives={
+                "language_level": "3",
+                # Keep slots as real Python functions so PyQt can still drop
+                # extra signal arguments such as clicked(bool)
+                "binding": True,
+            },
+        )
+
 setup(
     name="envstarter",
     version="1.0.0",
@@ -19,6 +43,7 @@ setup(
             "envstarter=envstarter.main:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "envstarter": ["resources/*"],
@@ -13,7 +13,7 @@ from typing import Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.envstarter.core.models import Environment
 from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
@@ -85,7 +85,8 @@ class ConcurrentLauncher(QObject):
     launch_progress = pyqtSignal(str, int, str)  # container_id, percentage, status
     batch_started = pyqtSignal(int)  # batch_size
     batch_completed = pyqtSignal(int, int)  # successful_count, total_count
-    all_launches_completed = pyqtSignal(list)  # list of LaunchResult
+    launch_counts_updated = pyqtSignal(int, int)  # successful_count, completed_count
+    all_launches_completed = pyqtSignal(int, int)  # successful_count, total_count
     queue_updated = pyqtSignal(int)  # queue_size
     
     def __init__(self):
@@ -104,12 +105,12 @@ class ConcurrentLauncher(QObject):
         
         # Threading and async
         self.is_launching = False
-        self.launch_thread: Optional[QThread] = None
         self.manager = get_multi_environment_manager()
         
         # Progress tracking
         self.total_jobs = 0
         self.completed_jobs = 0
+        self.successful_jobs = 0
         
         print("⚡ Concurrent Launcher initialized!")
         print(f"   🚀 Max concurrent: {self.max_concurrent_launches}")
@@ -119,8 +120,13 @@ class ConcurrentLauncher(QObject):
                       container_id: Optional[str] = None,
                       switch_to: bool = False,
                       priority: int = 1,
-                      delay_seconds: float = 0.0) -> str:
-        """Add an environment to the launch queue."""
+                      delay_seconds: float = 0.0,
+                      emit: bool = True) -> str:
+        """Add an environment to the launch queue.
+        
+        Pass emit=False when adding several jobs in a row and emit
+        queue_updated once afterwards.
+        """
         
         # Generate container ID if not provided
         if not container_id:
@@ -140,7 +146,8 @@ class ConcurrentLauncher(QObject):
         self.launch_queue.append(job)
         self.launch_queue.sort(key=lambda x: x.priority)
         
-        self.queue_updated.emit(len(self.launch_queue))
+        if emit:
+            self.queue_updated.emit(len(self.launch_queue))
         
         print(f"📋 Added to launch queue: '{container_id}' (priority: {priority})")
         return container_id
@@ -165,10 +172,14 @@ class ConcurrentLauncher(QObject):
                 environment=env,
                 switch_to=switch_to,
                 priority=1,  # All equal priority for batch launches
-                delay_seconds=delay
+                delay_seconds=delay,
+                emit=False
             )
             container_ids.append(container_id)
         
+        if container_ids:
+            self.queue_updated.emit(len(self.launch_queue))
+        
         print(f"📋 Added {len(environments)} environments to launch queue")
         return container_ids
     
@@ -192,6 +203,7 @@ class ConcurrentLauncher(QObject):
         self.is_launching = True
         self.total_jobs = total_jobs
         self.completed_jobs = 0
+        self.successful_jobs = 0
         self.launch_results.clear()
         
         try:
@@ -207,11 +219,10 @@ class ConcurrentLauncher(QObject):
             else:
                 raise Exception(f"Unsupported launch mode: {mode}")
             
-            self.all_launches_completed.emit([r.to_dict() for r in results])
+            self.all_launches_completed.emit(self.successful_jobs, self.completed_jobs)
             
             # Summary
-            successful = len([r for r in results if r.success])
-            print(f"✅ Launch complete: {successful}/{len(results)} successful")
+            print(f"✅ Launch complete: {self.successful_jobs}/{self.completed_jobs} successful")
             
             return results
             
@@ -239,8 +250,6 @@ class ConcurrentLauncher(QObject):
             
             result = await self._launch_single_job(job)
             results.append(result)
-            
-            self.completed_jobs += 1
         
         return results
     
@@ -248,63 +257,37 @@ class ConcurrentLauncher(QObject):
         """Launch all environments simultaneously."""
         print("⚡ Concurrent launch mode")
         
-        # Group jobs into batches based on max concurrent limit
-        batches = []
-        current_batch = []
+        jobs = list(self.launch_queue)
         
-        for job in self.launch_queue:
-            current_batch.append(job)
-            if len(current_batch) >= self.max_concurrent_launches:
-                batches.append(current_batch)
-                current_batch = []
+        # At most max_concurrent_launches run at once; the next job starts
+        # as soon as any running one finishes
+        semaphore = asyncio.Semaphore(self.max_concurrent_launches)
+        
+        async def launch_limited(job: LaunchJob) -> LaunchResult:
+            async with semaphore:
+                return await self._launch_single_job(job)
+        
+        self.batch_started.emit(len(jobs))
         
-        # Add remaining jobs as final batch
-        if current_batch:
-            batches.append(current_batch)
+        results = await asyncio.gather(*(launch_limited(job) for job in jobs), return_exceptions=True)
         
+        # Process results
         all_results = []
+        successful_count = 0
+        for job, result in zip(jobs, results):
+            if isinstance(result, Exception):
+                # Handle exception
+                result = LaunchResult(
+                    container_id=job.container_id,
+                    environment_name=job.environment.name,
+                    success=False,
+                    error_message=str(result)
+                )
+            elif result.success:
+                successful_count += 1
+            all_results.append(result)
         
-        # Process each batch
-        for batch_num, batch in enumerate(batches):
-            print(f"  🔥 Batch {batch_num + 1}/{len(batches)}: {len(batch)} environments")
-            
-            self.batch_started.emit(len(batch))
-            
-            # Launch all jobs in batch concurrently
-            tasks = []
-            for job in batch:
-                task = self._launch_single_job(job)
-                tasks.append(task)
-            
-            # Wait for all jobs in batch to complete
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            successful_count = 0
-            for i, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    # Handle exception
-                    job = batch[i]
-                    error_result = LaunchResult(
-                        container_id=job.container_id,
-                        environment_name=job.environment.name,
-                        success=False,
-                        error_message=str(result)
-                    )
-                    all_results.append(error_result)
-                else:
-                    all_results.append(result)
-                    if result.success:
-                        successful_count += 1
-                
-                self.completed_jobs += 1
-            
-            self.batch_completed.emit(successful_count, len(batch))
-            
-            # Small delay between batches
-            if batch_num < len(batches) - 1:
-                print("    ⏱️  Brief pause between batches...")
-                await asyncio.sleep(1.0)
+        self.batch_completed.emit(successful_count, len(jobs))
         
         return all_results
     
@@ -344,8 +327,6 @@ class ConcurrentLauncher(QObject):
                     results.append(result)
                     if result.success:
                         successful_count += 1
-                
-                self.completed_jobs += 1
             
             self.batch_completed.emit(successful_count, len(batch))
             
@@ -383,8 +364,6 @@ class ConcurrentLauncher(QObject):
                 final_results.append(error_result)
             else:
                 final_results.append(result)
-            
-            self.completed_jobs += 1
         
         return final_results
     
@@ -438,6 +417,12 @@ class ConcurrentLauncher(QObject):
             # Clean up
             if job.container_id in self.active_launches:
                 del self.active_launches[job.container_id]
+            
+            # Running totals, so completion needs no second pass over the results
+            self.completed_jobs += 1
+            if result.success:
+                self.successful_jobs += 1
+            self.launch_counts_updated.emit(self.successful_jobs, self.completed_jobs)
         
         return result
     
@@ -499,37 +484,6 @@ class ConcurrentLauncher(QObject):
         print("🛑 All launches stopped")
 
 
-# Thread wrapper for running async launches
-class LaunchThread(QThread):
-    """Thread for running async launch operations."""
-    
-    finished_signal = pyqtSignal(list)  # results
-    error_signal = pyqtSignal(str)  # error message
-    
-    def __init__(self, launcher: ConcurrentLauncher, launch_mode: LaunchMode):
-        super().__init__()
-        self.launcher = launcher
-        self.launch_mode = launch_mode
-    
-    def run(self):
-        """Run the async launch in a thread."""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            results = loop.run_until_complete(
-                self.launcher.launch_all_queued(self.launch_mode)
-            )
-            
-            self.finished_signal.emit([r.to_dict() for r in results])
-            
-        except Exception as e:
-            self.error_signal.emit(str(e))
-        
-        finally:
-            loop.close()
-
-
 # Global launcher instance
 _launcher_instance: Optional[ConcurrentLauncher] = None
 
@@ -9,6 +9,7 @@ running simultaneously like a hypervisor managing VMs!
 import sys
 import asyncio
 import threading
+from concurrent.futures import Future
 from typing import Optional, List, Dict
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication, QMessageBox
 from PyQt6.QtGui import QIcon, QAction
@@ -23,6 +24,31 @@ from src.envstarter.utils.system_integration import SystemIntegration
 from src.envstarter.utils.icons import get_tray_icon
 
 
+# One background event loop runs every container coroutine the controller starts
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the controller's background event loop, starting it on first use."""
+    global _loop
+    
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="controller-loop", daemon=True).start()
+    
+    return _loop
+
+
+def submit(coro):
+    """Run a coroutine on the controller's background loop and return its future.
+
+    Shared by every window that acts on the container manager.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+
 class EnhancedAppController(QObject):
     """
     🎯 ENHANCED APPLICATION CONTROLLER
@@ -367,11 +393,13 @@ class EnhancedAppController(QObject):
             print(f"❌ Failed to launch environment '{environment.name}': {e}")
             raise e
     
-    def launch_environment_quick(self, environment: Environment):
-        """Quick launch an environment from tray menu using VM-like isolation."""
-        def launch_vm_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+    def launch_environment_quick(self, environment: Environment) -> Future:
+        """Quick launch an environment from tray menu using VM-like isolation.
+
+        Returns the future of the launch; it resolves to True once the
+        VM environment is up.
+        """
+        async def launch_vm_async() -> bool:
             try:
                 from src.envstarter.core.vm_environment_manager import get_vm_environment_manager
                 from src.envstarter.gui.environment_header_widget import show_environment_header
@@ -383,9 +411,7 @@ class EnhancedAppController(QObject):
                 print(f"🚀 Creating VM-isolated environment: {environment.name}")
                 
                 # Create isolated VM environment
-                vm_env = loop.run_until_complete(
-                    vm_manager.create_vm_environment(environment, container_id)
-                )
+                vm_env = await vm_manager.create_vm_environment(environment, container_id)
                 
                 if vm_env:
                     print(f"✅ VM environment created: {environment.name}")
@@ -396,17 +422,17 @@ class EnhancedAppController(QObject):
                     show_environment_header(environment.name, container_id)
                     
                     # Switch to the new VM environment
-                    vm_manager.switch_to_vm_environment(container_id)
-                else:
-                    print(f"❌ Failed to create VM environment: {environment.name}")
+                    await vm_manager.switch_to_vm_environment_async(container_id)
+                    return True
+                
+                print(f"❌ Failed to create VM environment: {environment.name}")
+                return False
                     
             except Exception as e:
                 print(f"❌ VM launch failed: {e}")
-            finally:
-                loop.close()
+                return False
         
-        thread = threading.Thread(target=launch_vm_async, daemon=True)
-        thread.start()
+        return submit(launch_vm_async())
     
     def launch_all_environments(self):
         """Launch all environments concurrently."""
@@ -439,111 +465,97 @@ class EnhancedAppController(QObject):
         )
         
         # Launch the queue
-        def launch_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        async def launch_async():
             try:
-                results = loop.run_until_complete(
-                    self.launcher.launch_all_queued(LaunchMode.CONCURRENT)
-                )
-                successful = len([r for r in results if r.success])
+                results = await self.launcher.launch_all_queued(LaunchMode.CONCURRENT)
+                successful = sum(1 for r in results if r.success)
                 print(f"🎉 Batch launch complete: {successful}/{len(results)} successful")
             except Exception as e:
                 print(f"❌ Batch launch failed: {e}")
-            finally:
-                loop.close()
         
-        thread = threading.Thread(target=launch_async, daemon=True)
-        thread.start()
+        submit(launch_async())
         
         print(f"🚀 Starting batch launch of {len(environments)} environments...")
     
     def switch_to_container(self, container_id: str):
         """Switch to a specific VM container like switching between VMs."""
-        def switch_async():
+        async def switch_async():
             from src.envstarter.core.vm_environment_manager import get_vm_environment_manager
             
             try:
                 # Use VM manager for desktop switching
                 vm_manager = get_vm_environment_manager()
-                vm_success = vm_manager.switch_to_vm_environment(container_id)
+                vm_success = await vm_manager.switch_to_vm_environment_async(container_id)
                 
                 if vm_success:
                     print(f"💻 Switched to VM environment: {container_id}")
                     
                     # Also update multi-environment manager
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        success = loop.run_until_complete(self.manager.switch_to_container(container_id))
-                        if success:
-                            print(f"🔄 Container tracking updated: {container_id}")
-                    finally:
-                        loop.close()
+                    success = await self.manager.switch_to_container(container_id)
+                    if success:
+                        print(f"🔄 Container tracking updated: {container_id}")
                 else:
                     print(f"❌ Failed to switch to VM environment: {container_id}")
                     
             except Exception as e:
                 print(f"❌ Error switching to VM environment: {e}")
         
-        thread = threading.Thread(target=switch_async, daemon=True)
-        thread.start()
+        submit(switch_async())
     
     def stop_container(self, container_id: str):
         """Stop a specific VM container and destroy its virtual desktop."""
-        def stop_async():
+        async def stop_async():
             from src.envstarter.core.vm_environment_manager import get_vm_environment_manager
             
             try:
                 # Use VM manager to properly destroy the VM environment
                 vm_manager = get_vm_environment_manager()
                 
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                # Destroy VM environment (includes stopping container and cleaning up desktop)
+                vm_success = await vm_manager.destroy_vm_environment(container_id, cleanup_desktop=True)
                 
-                try:
-                    # Destroy VM environment (includes stopping container and cleaning up desktop)
-                    vm_success = loop.run_until_complete(
-                        vm_manager.destroy_vm_environment(container_id, cleanup_desktop=True)
-                    )
+                if vm_success:
+                    print(f"💻 VM environment destroyed: {container_id}")
                     
-                    if vm_success:
-                        print(f"💻 VM environment destroyed: {container_id}")
-                        
-                        # Also update multi-environment manager
-                        success = loop.run_until_complete(self.manager.stop_environment_container(container_id))
-                        if success:
-                            print(f"🛑 Container tracking updated: {container_id}")
-                    else:
-                        print(f"❌ Failed to destroy VM environment: {container_id}")
-                        
-                finally:
-                    loop.close()
+                    # Also update multi-environment manager
+                    success = await self.manager.stop_environment_container(container_id)
+                    if success:
+                        print(f"🛑 Container tracking updated: {container_id}")
+                else:
+                    print(f"❌ Failed to destroy VM environment: {container_id}")
                     
             except Exception as e:
                 print(f"❌ Error stopping VM environment: {e}")
         
-        thread = threading.Thread(target=stop_async, daemon=True)
-        thread.start()
+        submit(stop_async())
     
     def pause_container(self, container_id: str):
         """Pause a specific container."""
-        def pause_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        async def pause_async():
             try:
-                success = loop.run_until_complete(self.manager.pause_container(container_id))
+                success = await self.manager.pause_container(container_id)
                 if success:
                     print(f"⏸️ Paused container: {container_id}")
                 else:
                     print(f"❌ Failed to pause container: {container_id}")
             except Exception as e:
                 print(f"❌ Error pausing container: {e}")
-            finally:
-                loop.close()
         
-        thread = threading.Thread(target=pause_async, daemon=True)
-        thread.start()
+        submit(pause_async())
+    
+    def resume_container(self, container_id: str):
+        """Resume a paused container."""
+        async def resume_async():
+            try:
+                success = await self.manager.resume_container(container_id)
+                if success:
+                    print(f"▶️ Resumed container: {container_id}")
+                else:
+                    print(f"❌ Failed to resume container: {container_id}")
+            except Exception as e:
+                print(f"❌ Error resuming container: {e}")
+        
+        submit(resume_async())
     
     def stop_all_containers(self):
         """Stop all running containers."""
@@ -560,19 +572,14 @@ class EnhancedAppController(QObject):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            def stop_all_async():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            async def stop_all_async():
                 try:
-                    count = loop.run_until_complete(self.manager.stop_all_containers())
+                    count = await self.manager.stop_all_containers()
                     print(f"🛑 Stopped {count} containers")
                 except Exception as e:
                     print(f"❌ Error stopping all containers: {e}")
-                finally:
-                    loop.close()
             
-            thread = threading.Thread(target=stop_all_async, daemon=True)
-            thread.start()
+            submit(stop_all_async())
     
     # ======================================
     # LEGACY COMPATIBILITY METHODS
@@ -752,11 +759,8 @@ class EnhancedAppController(QObject):
         # Container started/stopped events will handle notifications
         pass
     
-    def _on_all_launches_completed(self, results: List[Dict]):
+    def _on_all_launches_completed(self, successful: int, total: int):
         """Handle all launches completed event."""
-        successful = len([r for r in results if r.get("success", False)])
-        total = len(results)
-        
         if self.tray_icon:
             self.tray_icon.showMessage(
                 "🎉 Batch Launch Complete",
@@ -3,6 +3,7 @@ Data models for EnvStarter environments and applications.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import uuid
@@ -137,9 +138,46 @@ class Environment:
             close_apps_on_stop=data.get("close_apps_on_stop", False)
         )
     
+    @cached_property
+    def app_count(self) -> int:
+        """Number of applications; call invalidate_counts() after editing the list."""
+        return len(self.applications)
+    
+    @cached_property
+    def website_count(self) -> int:
+        """Number of websites; call invalidate_counts() after editing the list."""
+        return len(self.websites)
+    
+    def invalidate_counts(self):
+        """Drop the cached app_count / website_count."""
+        self.__dict__.pop("app_count", None)
+        self.__dict__.pop("website_count", None)
+    
+    def add_application(self, app: Application):
+        """Append an application and refresh the cached counts."""
+        self.applications.append(app)
+        self.invalidate_counts()
+    
+    def remove_application(self, index: int) -> Application:
+        """Remove the application at index and refresh the cached counts."""
+        app = self.applications.pop(index)
+        self.invalidate_counts()
+        return app
+    
+    def add_website(self, website: Website):
+        """Append a website and refresh the cached counts."""
+        self.websites.append(website)
+        self.invalidate_counts()
+    
+    def remove_website(self, index: int) -> Website:
+        """Remove the website at index and refresh the cached counts."""
+        website = self.websites.pop(index)
+        self.invalidate_counts()
+        return website
+    
     def get_total_items(self) -> int:
         """Get total number of items (apps + websites) in this environment."""
-        return len(self.applications) + len(self.websites)
+        return self.app_count + self.website_count
     
     def is_valid(self) -> bool:
         """Check if environment has valid items."""
@@ -16,7 +16,7 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from concurrent.futures import ThreadPoolExecutor
 
 from src.envstarter.core.models import Environment
-from src.envstarter.core.simple_environment_container import SimpleEnvironmentContainer as EnvironmentContainer, EnvironmentState
+from src.envstarter.core.simple_environment_container import SimpleEnvironmentContainer as EnvironmentContainer, EnvironmentState, ContainerView
 from src.envstarter.core.storage import ConfigManager
 
 
@@ -43,7 +43,7 @@ class SystemResources:
             "total_processes": self.total_processes,
             "total_memory_mb": round(self.total_memory_mb, 1),
             "total_cpu_percent": round(self.total_cpu_percent, 1),
-            "active_desktops": self.active_desktops
+            "active_desktops": list(self.active_desktops)
         }
 
 
@@ -66,12 +66,17 @@ class MultiEnvironmentManager(QObject):
     resources_updated = pyqtSignal(dict)  # system_resources
     max_containers_reached = pyqtSignal(int)  # max_limit
     environment_conflict = pyqtSignal(str, str)  # env1, env2
+    container_state_changed = pyqtSignal(str, str)  # container_id, new_state
+    stats_updated = pyqtSignal(str, dict)  # container_id, stats_dict
     
     def __init__(self):
         super().__init__()
         
         # Container management
         self.containers: Dict[str, EnvironmentContainer] = {}
+        # Guards adding/removing containers, which happens on loop threads,
+        # against snapshots taken on the GUI and worker threads
+        self._containers_lock = threading.Lock()
         self.active_container_id: Optional[str] = None
         self.config_manager = ConfigManager()
         
@@ -83,6 +88,7 @@ class MultiEnvironmentManager(QObject):
         # Resource monitoring
         self.system_resources = SystemResources()
         self.resource_monitor_active = False
+        self._last_resources: Optional[Dict] = None
         
         # Async event loop for container operations
         self.loop: Optional[asyncio.AbstractEventLoop] = None
@@ -103,10 +109,19 @@ class MultiEnvironmentManager(QObject):
         
         print("📊 System resource monitoring started")
     
+    def _container_items(self) -> List[tuple]:
+        """Snapshot the registry's (container_id, container) pairs."""
+        with self._containers_lock:
+            return list(self.containers.items())
+    
+    def get_containers(self) -> Dict[str, EnvironmentContainer]:
+        """Snapshot the registry; safe to read from any thread."""
+        return dict(self._container_items())
+    
     def get_running_containers(self) -> List[str]:
         """Get list of currently running container IDs."""
         return [
-            container_id for container_id, container in self.containers.items()
+            container_id for container_id, container in self._container_items()
             if container.state == EnvironmentState.RUNNING
         ]
     
@@ -114,7 +129,14 @@ class MultiEnvironmentManager(QObject):
         """Get information about all containers."""
         return {
             container_id: container.get_container_info()
-            for container_id, container in self.containers.items()
+            for container_id, container in self._container_items()
+        }
+    
+    def get_container_views(self) -> Dict[str, ContainerView]:
+        """Get a flat display snapshot of every container."""
+        return {
+            container_id: container.get_container_view()
+            for container_id, container in self._container_items()
         }
     
     def can_start_container(self) -> bool:
@@ -154,7 +176,8 @@ class MultiEnvironmentManager(QObject):
             self._connect_container_signals(container)
             
             # Add to our container registry
-            self.containers[container_id] = container
+            with self._containers_lock:
+                self.containers[container_id] = container
             
             # Start the container (this is async and VM-like)
             success = await container.start_container()
@@ -174,13 +197,14 @@ class MultiEnvironmentManager(QObject):
                 return container_id
             else:
                 # Cleanup on failure
-                del self.containers[container_id]
+                with self._containers_lock:
+                    self.containers.pop(container_id, None)
                 raise Exception("Container failed to start")
                 
         except Exception as e:
             print(f"❌ Failed to start container '{container_id}': {e}")
-            if container_id in self.containers:
-                del self.containers[container_id]
+            with self._containers_lock:
+                self.containers.pop(container_id, None)
             raise e
     
     async def stop_environment_container(self, container_id: str, force: bool = False) -> bool:
@@ -204,7 +228,8 @@ class MultiEnvironmentManager(QObject):
                     self.used_desktop_indices.discard(container.desktop_index)
                 
                 # Remove from registry
-                del self.containers[container_id]
+                with self._containers_lock:
+                    self.containers.pop(container_id, None)
                 
                 # If this was the active container, clear it
                 if self.active_container_id == container_id:
@@ -316,11 +341,12 @@ class MultiEnvironmentManager(QObject):
     def _on_container_state_changed(self, container_id: str, new_state: str):
         """Handle container state changes."""
         print(f"📊 Container '{container_id}' state: {new_state}")
+        self.container_state_changed.emit(container_id, new_state)
     
     def _on_container_stats_updated(self, container_id: str, stats: Dict):
         """Handle container stats updates."""
-        # This gets called frequently, so we just update our internal tracking
-        pass
+        # This gets called frequently; listeners should only refresh text
+        self.stats_updated.emit(container_id, stats)
     
     def _on_container_error(self, container_id: str, error_message: str):
         """Handle container errors."""
@@ -342,7 +368,7 @@ class MultiEnvironmentManager(QObject):
             self.system_resources.active_desktops.clear()
             
             # Aggregate stats from all containers
-            for container in self.containers.values():
+            for _container_id, container in self._container_items():
                 if container.state == EnvironmentState.RUNNING:
                     self.system_resources.running_containers += 1
                     self.system_resources.total_processes += container.stats.total_processes
@@ -355,8 +381,11 @@ class MultiEnvironmentManager(QObject):
                 elif container.state == EnvironmentState.PAUSED:
                     self.system_resources.paused_containers += 1
             
-            # Emit updated resources
-            self.resources_updated.emit(self.system_resources.to_dict())
+            # Emit updated resources, skipping ticks where nothing changed
+            resources = self.system_resources.to_dict()
+            if resources != self._last_resources:
+                self._last_resources = resources
+                self.resources_updated.emit(resources)
             
         except Exception as e:
             print(f"Error updating system resources: {e}")
@@ -391,7 +420,7 @@ class MultiEnvironmentManager(QObject):
         """Get comprehensive system status."""
         
         container_details = {}
-        for container_id, container in self.containers.items():
+        for container_id, container in self._container_items():
             container_details[container_id] = {
                 "environment_name": container.environment.name,
                 "state": container.state.value,
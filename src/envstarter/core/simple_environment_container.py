@@ -8,10 +8,11 @@ without relying on Windows virtual desktop creation.
 
 import os
 import sys
-import time
+import asyncio
 import psutil
 import threading
 from enum import Enum
+from functools import partial
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional, Callable
 from datetime import datetime
@@ -79,6 +80,24 @@ class EnvironmentStats:
         }
 
 
+@dataclass(frozen=True)
+class ContainerView:
+    """Flat, read-only snapshot of a container for display."""
+    # Explicit slots keep the snapshot small on Python < 3.10
+    __slots__ = (
+        "container_id", "environment_name", "state", "desktop_index",
+        "uptime_seconds", "total_processes", "total_memory_mb", "total_cpu_percent",
+    )
+    container_id: str
+    environment_name: str
+    state: str
+    desktop_index: int
+    uptime_seconds: int
+    total_processes: int
+    total_memory_mb: float
+    total_cpu_percent: float
+
+
 class SimpleEnvironmentContainer(QObject):
     """
     🎯 SIMPLIFIED ENVIRONMENT CONTAINER
@@ -142,7 +161,7 @@ class SimpleEnvironmentContainer(QObject):
             # Apply startup delay if specified
             if self.environment.startup_delay > 0:
                 print(f"⏱️  Waiting {self.environment.startup_delay} seconds...")
-                time.sleep(self.environment.startup_delay)
+                await asyncio.sleep(self.environment.startup_delay)
             
             # Launch all applications
             await self._launch_container_applications()
@@ -194,7 +213,7 @@ class SimpleEnvironmentContainer(QObject):
                     print(f"    ❌ Failed to start: {app.name}")
                 
                 # Small delay between launches
-                time.sleep(0.3)
+                await asyncio.sleep(0.3)
                 
             except Exception as e:
                 print(f"    ❌ Error launching {app.name}: {e}")
@@ -213,7 +232,7 @@ class SimpleEnvironmentContainer(QObject):
                 else:
                     print(f"    ❌ Failed to open: {website.name}")
                 
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
                 
             except Exception as e:
                 print(f"    ❌ Error opening {website.name}: {e}")
@@ -231,15 +250,17 @@ class SimpleEnvironmentContainer(QObject):
                 'ENVSTARTER_ISOLATED': 'true'
             }
             
-            # Launch using robust launcher
+            # Launch using robust launcher; it blocks while it resolves and spawns the
+            # process, so run it on the default executor and let other launches proceed
             print(f"🚀 LAUNCHING {app.name} IN ENVIRONMENT: {self.environment.name.upper()}")
-            process = launcher.launch_application(
+            process = await asyncio.get_running_loop().run_in_executor(None, partial(
+                launcher.launch_application,
                 app_name=app.name,
                 app_path=app.path,
                 arguments=app.arguments or "",
                 working_dir=app.working_directory or "",
                 environment_vars=env_vars
-            )
+            ))
             
             if process and process.pid:
                 pid = process.pid
@@ -265,6 +286,12 @@ class SimpleEnvironmentContainer(QObject):
     
     async def _launch_website_in_container(self, website: Website) -> bool:
         """Launch a website within the container."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._open_website, website
+        )
+    
+    def _open_website(self, website: Website) -> bool:
+        """Open a website in its browser; blocks until the browser has been spawned."""
         try:
             import webbrowser
             
@@ -429,7 +456,7 @@ class SimpleEnvironmentContainer(QObject):
         
         # Wait for processes to actually terminate
         if not force:
-            time.sleep(2)
+            await asyncio.sleep(2)
             # Force kill any remaining processes
             await self._terminate_container_processes(force=True)
         
@@ -518,6 +545,20 @@ class SimpleEnvironmentContainer(QObject):
             "is_running": self.state == EnvironmentState.RUNNING
         }
     
+    def get_container_view(self) -> ContainerView:
+        """Get a flat display snapshot of this container."""
+        stats = self.stats
+        return ContainerView(
+            container_id=self.container_id,
+            environment_name=self.environment.name,
+            state=self.state.value,
+            desktop_index=self.desktop_index,
+            uptime_seconds=stats.uptime_seconds,
+            total_processes=stats.total_processes,
+            total_memory_mb=stats.total_memory_mb,
+            total_cpu_percent=stats.total_cpu_percent,
+        )
+    
     def _set_state(self, new_state: EnvironmentState):
         """Update container state and emit signal."""
         old_state = self.state
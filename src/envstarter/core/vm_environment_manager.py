@@ -183,8 +183,12 @@ class VMEnvironmentManager(QObject):
         
         print(f"💻 Creating VM environment: {environment.name}")
         
+        # Desktop and notification calls shell out synchronously; they run
+        # on the default executor so other launches on this loop keep going
+        loop = asyncio.get_running_loop()
+        
         # Step 1: Create virtual desktop for complete isolation
-        desktop_id = VirtualDesktopAPI.create_virtual_desktop()
+        desktop_id = await loop.run_in_executor(None, VirtualDesktopAPI.create_virtual_desktop)
         if not desktop_id:
             print("⚠️ Failed to create virtual desktop, using current desktop")
             desktop_id = f"fallback_{container_id}"
@@ -210,7 +214,7 @@ class VMEnvironmentManager(QObject):
         try:
             # Switch to the new desktop for launching
             if desktop_id and desktop_id != "fallback":
-                VirtualDesktopAPI.switch_to_desktop(desktop_id)
+                await loop.run_in_executor(None, VirtualDesktopAPI.switch_to_desktop, desktop_id)
                 await asyncio.sleep(1)  # Wait for desktop switch
             
             # Launch the environment
@@ -230,7 +234,7 @@ class VMEnvironmentManager(QObject):
                 self.environment_created.emit(container_id, desktop_id)
                 
                 # Show desktop notification
-                self._show_desktop_notification(vm_env)
+                await loop.run_in_executor(None, self._show_desktop_notification, vm_env)
                 
                 return vm_env
             else:
@@ -275,6 +279,12 @@ class VMEnvironmentManager(QObject):
             print(f"⚠️ No isolated desktop for environment: {vm_env.environment.name}")
             return False
     
+    async def switch_to_vm_environment_async(self, container_id: str) -> bool:
+        """Switch to a VM environment without blocking the running event loop."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.switch_to_vm_environment, container_id
+        )
+    
     async def destroy_vm_environment(self, container_id: str, cleanup_desktop: bool = True) -> bool:
         """Destroy a VM environment like shutting down a VM."""
         if container_id not in self.vm_environments:
@@ -302,7 +312,9 @@ class VMEnvironmentManager(QObject):
             
             # Switch back to original desktop if this was current
             if self.current_desktop == vm_env.desktop_id and self.original_desktop:
-                VirtualDesktopAPI.switch_to_desktop(self.original_desktop)
+                await asyncio.get_running_loop().run_in_executor(
+                    None, VirtualDesktopAPI.switch_to_desktop, self.original_desktop
+                )
                 self.current_desktop = self.original_desktop
             
             return True
@@ -6,8 +6,6 @@ This provides full CRUD operations for environments, applications, and settings.
 """
 
 import os
-import asyncio
-import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from PyQt6.QtWidgets import (
@@ -652,6 +650,7 @@ class EnvironmentEditDialog(QDialog):
         self.environment.startup_delay = self.startup_delay_spin.value()
         self.environment.applications = applications
         self.environment.websites = websites
+        self.environment.invalidate_counts()
         self.environment.use_virtual_desktop = self.use_vd_check.isChecked()
         self.environment.desktop_name = self.desktop_name_edit.text() or None
         self.environment.auto_switch_desktop = self.auto_switch_check.isChecked()
@@ -1389,16 +1388,7 @@ class EnhancedSettingsDialog(QDialog):
     
     def resume_container(self, container_id: str):
         """Resume container."""
-        def resume_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.manager.resume_container(container_id))
-            finally:
-                loop.close()
-        
-        thread = threading.Thread(target=resume_async, daemon=True)
-        thread.start()
+        self.controller.resume_container(container_id)
         QTimer.singleShot(1000, self.refresh_containers)  # Refresh after 1 second
     
     def stop_container(self, container_id: str):
@@ -3,10 +3,93 @@
 MASSIVE VISIBLE HEADERS SHOWING WHICH ENVIRONMENT IS RUNNING!
 """
 
+import html
+import threading
+import time
+from collections import OrderedDict, deque
+from statistics import mean
+from typing import Callable, Dict, List, Optional, Tuple
+
 from PyQt6.QtWidgets import (QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
-                            QFrame, QPushButton, QGraphicsDropShadowEffect)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QRect
-from PyQt6.QtGui import QFont, QColor, QPalette, QLinearGradient, QPainter, QBrush
+                            QFrame, QPushButton, QApplication)
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, pyqtSlot, QPropertyAnimation, QRect, QRectF,
+                          QObject, QThread)
+from PyQt6.QtGui import QFont, QColor, QPalette, QLinearGradient, QPainter, QBrush, QPixmap
+
+
+# Drop shadow drawn behind floating headers. Rendered once per header size
+# instead of using QGraphicsDropShadowEffect, which re-rasterizes and blurs
+# the whole frame offscreen on every paint.
+_SHADOW_SPREAD = 10
+_SHADOW_OFFSET_Y = 5
+_SHADOW_COLOR = QColor(0, 0, 0, 160)
+_SHADOW_CACHE: Dict[Tuple[int, int], QPixmap] = {}
+
+# Header stylesheet, shared by every header. The pulse toggles the
+# "pulse" dynamic property instead of rewriting the stylesheet.
+_HEADER_QSS = """
+    QFrame {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #667eea, stop: 1 #764ba2);
+        border: 3px solid #FFD700;
+        border-radius: 15px;
+        color: white;
+    }
+    EnvironmentHeaderWidget[pulse="true"] {
+        border: 5px solid #FFA500;
+    }
+    QLabel {
+        color: white;
+        background: transparent;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
+    }
+    QPushButton {
+        background-color: rgba(255, 255, 255, 0.2);
+        color: white;
+        border: 2px solid white;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 0.3);
+        border-color: #FFD700;
+    }
+"""
+
+
+def _shadow_pixmap(width: int, height: int) -> QPixmap:
+    """Get the cached shadow pixmap for a header of the given size."""
+    key = (width, height)
+    pixmap = _SHADOW_CACHE.get(key)
+    if pixmap is not None:
+        return pixmap
+    
+    pixmap = QPixmap(width + 2 * _SHADOW_SPREAD, height + 2 * _SHADOW_SPREAD)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    # Stack faint rounded rects, shrinking inwards, to approximate a blur
+    color = QColor(_SHADOW_COLOR)
+    color.setAlpha(max(1, _SHADOW_COLOR.alpha() // _SHADOW_SPREAD))
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(color)
+    for inset in range(_SHADOW_SPREAD):
+        radius = 15 + _SHADOW_SPREAD - inset
+        painter.drawRoundedRect(
+            QRectF(inset, inset,
+                   pixmap.width() - 2 * inset, pixmap.height() - 2 * inset),
+            radius, radius
+        )
+    painter.end()
+    
+    if len(_SHADOW_CACHE) >= 8:
+        _SHADOW_CACHE.clear()
+    _SHADOW_CACHE[key] = pixmap
+    return pixmap
 
 
 class EnvironmentHeaderWidget(QFrame):
@@ -19,6 +102,9 @@ class EnvironmentHeaderWidget(QFrame):
     environment_switched = pyqtSignal(str)  # environment_name
     close_requested = pyqtSignal()
     
+    _STATUS_MAP = {"running": "🟢 RUNNING", "paused": "⏸️ PAUSED"}
+    _STATUS_DEFAULT = "🔴 STOPPED"
+    
     def __init__(self, environment_name: str, container_id: str = None, parent=None):
         super().__init__(parent)
         self.environment_name = environment_name
@@ -42,50 +128,16 @@ class EnvironmentHeaderWidget(QFrame):
         top_bar.setSpacing(15)
         
         # Environment label - HUGE AND VISIBLE
-        env_label = QLabel(f"🚀 ENVIRONMENT: {self.environment_name.upper()} 🚀")
+        self.env_label = QLabel(f"🚀 ENVIRONMENT: {self.environment_name.upper()} 🚀")
         env_font = QFont("Arial", 24, QFont.Weight.Bold)
-        env_label.setFont(env_font)
-        env_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.env_label.setFont(env_font)
+        self.env_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Apply gradient effect
-        self.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #667eea, stop: 1 #764ba2);
-                border: 3px solid #FFD700;
-                border-radius: 15px;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                background: transparent;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-            }
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: 2px solid white;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.3);
-                border-color: #FFD700;
-            }
-        """)
-        
-        # Add drop shadow for depth
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(5)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        self.setGraphicsEffect(shadow)
+        self.setStyleSheet(_HEADER_QSS)
         
         top_bar.addStretch()
-        top_bar.addWidget(env_label)
+        top_bar.addWidget(self.env_label)
         top_bar.addStretch()
         
         # Close button
@@ -97,42 +149,56 @@ class EnvironmentHeaderWidget(QFrame):
         
         main_layout.addLayout(top_bar)
         
-        # Status information
+        # Status information: container, state, uptime and stats share one
+        # rich-text label so each tick costs at most a single setText
         status_layout = QHBoxLayout()
         status_layout.setSpacing(20)
         
-        # Container ID
-        if self.container_id:
-            container_label = QLabel(f"📦 Container: {self.container_id}")
-            container_label.setStyleSheet("font-size: 12px; font-weight: 500;")
-            status_layout.addWidget(container_label)
-        
-        # Status indicator
-        self.status_label = QLabel("🟢 RUNNING")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold;")
-        status_layout.addWidget(self.status_label)
-        
-        # Time running
-        self.time_label = QLabel("⏱️ Time: 00:00:00")
-        self.time_label.setStyleSheet("font-size: 12px;")
-        status_layout.addWidget(self.time_label)
-        
-        # Stats
-        self.stats_label = QLabel("📊 Loading stats...")
-        self.stats_label.setStyleSheet("font-size: 12px;")
-        status_layout.addWidget(self.stats_label)
+        self.status_line = QLabel()
+        self.status_line.setTextFormat(Qt.TextFormat.RichText)
+        self.status_line.setStyleSheet("font-size: 12px;")
+        status_layout.addWidget(self.status_line)
         
         status_layout.addStretch()
         main_layout.addLayout(status_layout)
         
         self.setLayout(main_layout)
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_stats)
-        self.update_timer.start(1000)  # Update every second
+        # Stats are refreshed by the EnvironmentHeaderManager tick
+        self._t0 = time.monotonic()
+        self._reset_status_parts()
+        
+    def _reset_status_parts(self):
+        """Reset the status line to its initial text."""
+        self._status_text = "🟢 RUNNING"
+        self._time_text = "⏱️ Time: 00:00:00"
+        self._stats_text = "📊 Loading stats..."
+        self._status_line_text = None
+        self._refresh_status_line()
+        
+    def _refresh_status_line(self):
+        """Compose the status line and set it only if it changed."""
+        parts = [
+            f"<b style='font-size: 14px;'>{self._status_text}</b>",
+            self._time_text,
+            self._stats_text,
+        ]
+        if self.container_id:
+            parts.insert(0, f"📦 Container: {html.escape(self.container_id)}")
+            
+        text = " &nbsp;|&nbsp; ".join(parts)
+        if text != self._status_line_text:
+            self.status_line.setText(text)
+            self._status_line_text = text
+        
+    def retarget(self, environment_name: str, container_id: str = None):
+        """Point this header at another environment so it can be reused."""
+        self.environment_name = environment_name
+        self.container_id = container_id
         
-        self.start_time = 0
+        self.env_label.setText(f"🚀 ENVIRONMENT: {environment_name.upper()} 🚀")
+        self._t0 = time.monotonic()
+        self._reset_status_parts()
         
     def start_animations(self):
         """Start attention-grabbing animations."""
@@ -144,57 +210,65 @@ class EnvironmentHeaderWidget(QFrame):
     def pulse_effect(self):
         """Create a pulsing effect."""
         # This would ideally use QPropertyAnimation for smooth pulsing
-        # For now, we'll just update the border
-        current_style = self.styleSheet()
-        if "border: 3px solid #FFD700" in current_style:
-            self.setStyleSheet(current_style.replace("border: 3px solid #FFD700", "border: 5px solid #FFA500"))
-        else:
-            self.setStyleSheet(current_style.replace("border: 5px solid #FFA500", "border: 3px solid #FFD700"))
+        # For now, we'll just flip the border via the "pulse" property
+        self.setProperty("pulse", not self.property("pulse"))
+        self.style().unpolish(self)
+        self.style().polish(self)
             
     def update_stats(self):
-        """Update the statistics display."""
-        self.start_time += 1
-        
-        # Update time
-        hours = self.start_time // 3600
-        minutes = (self.start_time % 3600) // 60
-        seconds = self.start_time % 60
-        self.time_label.setText(f"⏱️ Time: {hours:02d}:{minutes:02d}:{seconds:02d}")
-        
-        # Try to get real stats
+        """Update the statistics display, fetching container info directly."""
+        containers = {}
         try:
             if self.container_id:
                 from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
-                manager = get_multi_environment_manager()
-                containers = manager.get_all_containers()
+                containers = get_multi_environment_manager().get_all_containers()
+        except Exception:
+            self._stats_text = "📊 Stats unavailable"
+            
+        self.update_stats_with(containers)
+        
+    def update_stats_with(self, containers: Dict[str, Dict]):
+        """Update the statistics display from already-fetched container info."""
+        # Derive elapsed time from a monotonic anchor so skipped or
+        # delayed ticks don't make the clock drift
+        elapsed = int(time.monotonic() - self._t0)
+        
+        # Update time
+        minutes, seconds = divmod(elapsed, 60)
+        hours, minutes = divmod(minutes, 60)
+        self._time_text = "⏱️ Time: %02d:%02d:%02d" % (hours, minutes, seconds)
+        
+        # Show real stats when we have them
+        info = containers.get(self.container_id) if self.container_id else None
+        if info is not None:
+            try:
+                stats = info.get("stats", {})
                 
-                if self.container_id in containers:
-                    info = containers[self.container_id]
-                    stats = info.get("stats", {})
-                    
-                    processes = stats.get("total_processes", 0)
-                    memory = stats.get("total_memory_mb", 0)
-                    cpu = stats.get("total_cpu_percent", 0)
-                    
-                    self.stats_label.setText(
-                        f"📊 Apps: {processes} | RAM: {memory:.0f}MB | CPU: {cpu:.1f}%"
-                    )
-                    
-                    # Update status
-                    state = info.get("state", "unknown")
-                    if state == "running":
-                        self.status_label.setText("🟢 RUNNING")
-                    elif state == "paused":
-                        self.status_label.setText("⏸️ PAUSED")
-                    else:
-                        self.status_label.setText("🔴 STOPPED")
-                        
-        except Exception as e:
-            self.stats_label.setText(f"📊 Stats unavailable")
+                processes = stats.get("total_processes", 0)
+                memory = stats.get("total_memory_mb", 0)
+                cpu = stats.get("total_cpu_percent", 0)
+                
+                self._stats_text = f"📊 Apps: {processes} | RAM: {memory:.0f}MB | CPU: {cpu:.1f}%"
+                self._status_text = self._STATUS_MAP.get(info.get("state"), self._STATUS_DEFAULT)
+                
+            except Exception:
+                self._stats_text = "📊 Stats unavailable"
+                
+        self._refresh_status_line()
+            
+    def showEvent(self, event):
+        """Resume pulsing when shown."""
+        super().showEvent(event)
+        if not self.pulse_timer.isActive():
+            self.pulse_timer.start(2000)
             
+    def hideEvent(self, event):
+        """Stop pulsing while hidden (e.g. while pooled)."""
+        super().hideEvent(event)
+        self.pulse_timer.stop()
+        
     def closeEvent(self, event):
         """Clean up when closing."""
-        self.update_timer.stop()
         self.pulse_timer.stop()
         event.accept()
 
@@ -207,6 +281,9 @@ class FloatingEnvironmentHeader(QWidget):
     Can be positioned at the top of the screen.
     """
     
+    dragging_changed = pyqtSignal(bool)  # is_dragging
+    close_requested = pyqtSignal(str)  # container_id
+    
     def __init__(self, environment_name: str, container_id: str = None):
         super().__init__()
         self.environment_name = environment_name
@@ -233,23 +310,35 @@ class FloatingEnvironmentHeader(QWidget):
             self
         )
         
-        # Layout
+        # Layout (margins leave room for the drop shadow)
         layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setContentsMargins(
+            _SHADOW_SPREAD, _SHADOW_SPREAD - _SHADOW_OFFSET_Y,
+            _SHADOW_SPREAD, _SHADOW_SPREAD + _SHADOW_OFFSET_Y
+        )
         layout.addWidget(self.header_widget)
         self.setLayout(layout)
         
         # Connect signals
-        self.header_widget.close_requested.connect(self.hide)
+        self.header_widget.close_requested.connect(self._on_close_requested)
         
         # Make draggable
         self.dragging = False
         self.drag_position = None
         
+    def _on_close_requested(self):
+        """Hide and let the manager release this header."""
+        self.hide()
+        self.close_requested.emit(self.container_id)
+        
+    def retarget(self, environment_name: str, container_id: str = None):
+        """Reuse this header for another environment."""
+        self.environment_name = environment_name
+        self.container_id = container_id
+        self.header_widget.retarget(environment_name, container_id)
+        
     def position_at_top(self):
         """Position the header at the top of the screen."""
-        from PyQt6.QtWidgets import QApplication
-        
         screen = QApplication.primaryScreen()
         if screen:
             screen_rect = screen.availableGeometry()
@@ -258,11 +347,23 @@ class FloatingEnvironmentHeader(QWidget):
             self.resize(screen_rect.width() - 100, 120)
             self.move(50, 10)
             
+    def paintEvent(self, event):
+        """Paint the cached drop shadow behind the header."""
+        geometry = self.header_widget.geometry()
+        painter = QPainter(self)
+        painter.drawPixmap(
+            geometry.x() - _SHADOW_SPREAD,
+            geometry.y() - _SHADOW_SPREAD + _SHADOW_OFFSET_Y,
+            _shadow_pixmap(geometry.width(), geometry.height())
+        )
+        painter.end()
+        
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
         if event.button() == Qt.MouseButton.LeftButton:
             self.dragging = True
             self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self.dragging_changed.emit(True)
             
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging."""
@@ -271,23 +372,164 @@ class FloatingEnvironmentHeader(QWidget):
             
     def mouseReleaseEvent(self, event):
         """Handle mouse release."""
-        self.dragging = False
+        if self.dragging:
+            self.dragging = False
+            self.dragging_changed.emit(False)
         
 
-class EnvironmentHeaderManager:
+class ContainerStatsWorker(QObject):
+    """
+    Fetches container information on a background thread.
+    """
+    
+    containers_ready = pyqtSignal(dict)  # container_id -> container_info
+    fetch_failed = pyqtSignal()
+    
+    def __init__(self, fetch_containers: Callable[[], Dict[str, Dict]]):
+        super().__init__()
+        self.fetch_containers = fetch_containers
+        
+    @pyqtSlot()
+    def fetch(self):
+        """Fetch all container info and hand it to the GUI thread."""
+        try:
+            containers = self.fetch_containers()
+        except Exception as e:
+            # No snapshot is better than an empty one, which would read as
+            # "every container is gone"; the caller retries on its next tick
+            print(f"⚠️ Container fetch failed: {e}")
+            self.fetch_failed.emit()
+            return
+        self.containers_ready.emit(containers)
+
+
+class EnvironmentHeaderManager(QObject):
     """
     Manages environment headers for all running environments.
+    
+    A single shared tick drives the stats of every header. Container info
+    is fetched on a worker thread; applying it to the headers is timed and
+    the tick backs off when the host is busy, so idle headers cost less
+    and loaded ones don't pile up.
     """
     
+    fetch_requested = pyqtSignal()
+    
+    BASE_INTERVAL_MS = 1000  # Also the floor: the update cost only adds to it
+    MAX_INTERVAL_MS = 5000   # Never slower than a human notices
+    
+    # Upper bound on live headers; the least recently shown one is
+    # released when exceeded. Well above the manager's concurrent limit.
+    MAX_HEADERS = 32
+    
+    # Hidden headers kept for reuse; any beyond this are destroyed
+    MAX_POOL = 8
+    
     def __init__(self):
-        self.headers = {}  # container_id -> FloatingEnvironmentHeader
+        super().__init__()
+        # container_id -> FloatingEnvironmentHeader, least recently shown first
+        self.headers: "OrderedDict[str, FloatingEnvironmentHeader]" = OrderedDict()
+        
+        # Hidden headers kept around for reuse instead of rebuilding widgets
+        self._pool: List[FloatingEnvironmentHeader] = []
+        
+        # Headers waiting to be built: (environment_name, container_id)
+        self._pending = deque()
+        
+        # Recent update durations in seconds
+        self._net_delays = deque(maxlen=10)
+        
+        self._tick = QTimer()
+        self._tick.timeout.connect(self._on_tick)
+        # Stats updates stay paused while a header is being dragged
+        self._dragging = False
+        
+        self._setup_stats_worker()
+        
+    def _setup_stats_worker(self):
+        """Start the background thread that fetches container stats."""
+        try:
+            from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
+            self._fetch_containers = get_multi_environment_manager().get_all_containers
+        except Exception as e:
+            print(f"⚠️ Container stats unavailable for headers: {e}")
+            self._fetch_containers = dict
+            
+        self._fetch_inflight = False
+        self._worker_thread = QThread()
+        self._worker = ContainerStatsWorker(self._fetch_containers)
+        self._worker.moveToThread(self._worker_thread)
+        
+        self.fetch_requested.connect(self._worker.fetch, Qt.ConnectionType.QueuedConnection)
+        self._worker.containers_ready.connect(
+            self._on_containers_ready, Qt.ConnectionType.QueuedConnection
+        )
+        self._worker.fetch_failed.connect(
+            self._on_fetch_failed, Qt.ConnectionType.QueuedConnection
+        )
+        
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._stop_stats_worker)
+            
+        self._worker_thread.start()
+        
+    def _stop_stats_worker(self):
+        """Stop the stats worker thread."""
+        self._tick.stop()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
         
     def show_header(self, environment_name: str, container_id: str):
-        """Show a header for an environment."""
-        if container_id not in self.headers:
+        """
+        Show a header for an environment.
+        
+        Headers are built one per event-loop cycle, so a burst of
+        environment starts doesn't block the GUI thread.
+        """
+        if container_id in self.headers:
+            self.headers.move_to_end(container_id)
+            self.headers[container_id].show()
+            return
+        if any(cid == container_id for _, cid in self._pending):
+            return
+            
+        self._pending.append((environment_name, container_id))
+        if len(self._pending) == 1:
+            QTimer.singleShot(0, self._drain_pending)
+            
+    def _drain_pending(self):
+        """Build and show the next queued header."""
+        if not self._pending:
+            return
+            
+        environment_name, container_id = self._pending.popleft()
+        if self._pool:
+            header = self._pool.pop()
+            header.retarget(environment_name, container_id)
+        else:
             header = FloatingEnvironmentHeader(environment_name, container_id)
-            self.headers[container_id] = header
-            header.show()
+            header.dragging_changed.connect(self._on_dragging_changed)
+            header.close_requested.connect(self.remove_header)
+        self.headers[container_id] = header
+        header.show()
+        
+        while len(self.headers) > self.MAX_HEADERS:
+            self.remove_header(next(iter(self.headers)))
+        
+        if not self._dragging and not self._tick.isActive():
+            self._tick.start(self.BASE_INTERVAL_MS)
+            
+        if self._pending:
+            QTimer.singleShot(16, self._drain_pending)  # ~one per 60 Hz frame
+            
+    def _on_dragging_changed(self, dragging: bool):
+        """Pause stats updates while a header is being dragged."""
+        self._dragging = dragging
+        if dragging:
+            self._tick.stop()
+        elif self.headers:
+            self._tick.start()
             
     def hide_header(self, container_id: str):
         """Hide a header for an environment."""
@@ -295,30 +537,120 @@ class EnvironmentHeaderManager:
             self.headers[container_id].hide()
             
     def remove_header(self, container_id: str):
-        """Remove and destroy a header."""
+        """Remove a header, pooling it for reuse while the pool has room."""
+        self._pending = deque(
+            item for item in self._pending if item[1] != container_id
+        )
+        
         if container_id in self.headers:
-            self.headers[container_id].close()
-            del self.headers[container_id]
+            header = self.headers.pop(container_id)
+            if len(self._pool) < self.MAX_POOL:
+                header.hide()
+                self._pool.append(header)
+            else:
+                header.close()
+                header.deleteLater()
+            
+        if not self.headers:
+            self._tick.stop()
+            self._net_delays.clear()
             
-    def update_all(self):
-        """Update all headers."""
+    def update_all(self, containers: Optional[Dict[str, Dict]] = None):
+        """Update all headers, fetching container info if none is given."""
+        if containers is None:
+            try:
+                containers = self._fetch_containers()
+            except Exception as e:
+                # Keep the stats on screen rather than zeroing them
+                print(f"⚠️ Container fetch failed: {e}")
+                return
+                
         for header in self.headers.values():
             if header.isVisible():
-                header.header_widget.update_stats()
+                header.header_widget.update_stats_with(containers)
+                
+    def _on_tick(self):
+        """Ask the worker for fresh container info."""
+        if self._fetch_inflight:
+            return
+        self._fetch_inflight = True
+        self.fetch_requested.emit()
+        
+    @pyqtSlot()
+    def _on_fetch_failed(self):
+        """Let the next tick retry a failed fetch."""
+        self._fetch_inflight = False
+        
+    @pyqtSlot(dict)
+    def _on_containers_ready(self, containers: Dict[str, Dict]):
+        """Update all headers and adapt the tick rate to the measured cost."""
+        self._fetch_inflight = False
+        if not self.headers:
+            return
+            
+        t0 = time.perf_counter()
+        self.update_all(containers)
+        self._net_delays.append(time.perf_counter() - t0)
+        
+        self._tick.setInterval(self._next_interval())
+        
+    def _next_interval(self) -> int:
+        """Calculate the next tick interval in milliseconds."""
+        interval = int(self.BASE_INTERVAL_MS + 1000 * mean(self._net_delays))
+        return min(interval, self.MAX_INTERVAL_MS)
                 
 
+class _HeaderDispatcher(QObject):
+    """Carries show requests from any thread to the GUI thread."""
+    
+    show_requested = pyqtSignal(str, str)  # environment_name, container_id
+    
+    def __init__(self):
+        super().__init__()
+        self.show_requested.connect(self._show, Qt.ConnectionType.QueuedConnection)
+        
+    @pyqtSlot(str, str)
+    def _show(self, environment_name: str, container_id: str):
+        """Show a header; runs on the GUI thread."""
+        get_header_manager().show_header(environment_name, container_id)
+
+
 # Global header manager
 _header_manager = None
 
+# Created on whichever thread asks first, then moved to the GUI thread
+_dispatcher: Optional[_HeaderDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
 def get_header_manager() -> EnvironmentHeaderManager:
-    """Get the global header manager."""
+    """Get the global header manager. Call only on the GUI thread."""
     global _header_manager
     if _header_manager is None:
         _header_manager = EnvironmentHeaderManager()
     return _header_manager
 
 
+def _get_dispatcher() -> _HeaderDispatcher:
+    """Get the dispatcher that forwards show requests to the GUI thread."""
+    global _dispatcher
+    
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = _HeaderDispatcher()
+            app = QApplication.instance()
+            if app is not None:
+                _dispatcher.moveToThread(app.thread())
+    
+    return _dispatcher
+
+
 def show_environment_header(environment_name: str, container_id: str = None):
-    """Quick function to show an environment header."""
-    manager = get_header_manager()
-    manager.show_header(environment_name, container_id or f"env_{environment_name.lower()}")
\ No newline at end of file
+    """Quick function to show an environment header.
+
+    Safe to call from any thread: the header manager, its timers and
+    its widgets all live on the GUI thread.
+    """
+    _get_dispatcher().show_requested.emit(
+        environment_name, container_id or f"env_{environment_name.lower()}"
+    )
\ No newline at end of file
@@ -2,231 +2,310 @@
 Main environment selector GUI for EnvStarter.
 """
 
+import html
+from concurrent.futures import Future
+from typing import Dict
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QListWidget, QListWidgetItem,
                             QProgressBar, QTextEdit, QSplitter, QFrame,
-                            QMessageBox, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPalette, QIcon
+                            QMessageBox, QSizePolicy, QStyledItemDelegate, QStyle)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRect, QSize, QSignalBlocker
+from PyQt6.QtGui import (QFont, QPalette, QIcon, QColor, QPainter, QPen, QFontMetrics,
+                         QAction, QKeySequence)
 
 from src.envstarter.core.models import Environment
 from src.envstarter.core.enhanced_app_controller import EnhancedAppController
+from src.envstarter.gui.styles import STYLESHEET
+
+
+# Shared fonts; QFont is a cheap value type, so one instance serves every row
+_NAME_FONT = QFont()
+_NAME_FONT.setBold(True)
+_NAME_FONT.setPointSize(14)  # Larger for better readability
+
+_DESCRIPTION_FONT = QFont()
+_DESCRIPTION_FONT.setPixelSize(12)
+
+_BADGE_FONT = QFont()
+_BADGE_FONT.setPixelSize(11)
+_BADGE_FONT.setWeight(QFont.Weight.Medium)
 
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(28)  # Larger for better readability
+_TITLE_FONT.setBold(True)
 
-class EnvironmentListItem(QFrame):
-    """Custom widget for environment list items."""
+
+class EnvironmentDelegate(QStyledItemDelegate):
+    """
+    Paints environment list rows directly.
     
-    def __init__(self, environment: Environment):
-        super().__init__()
-        self.environment = environment
-        self.setup_ui()
+    Rows hold their Environment under Qt.ItemDataRole.UserRole; drawing them
+    here avoids building a frame, layouts and labels for every row.
+    """
     
-    def setup_ui(self):
-        """Set up the UI for the list item."""
-        self.setFrameStyle(QFrame.Shape.Box)
-        # WCAG AA compliant colors and improved accessibility
-        self.setStyleSheet("""
-            EnvironmentListItem {
-                background-color: #ffffff;
-                border: 2px solid #e1e4e8;
-                border-radius: 8px;
-                margin: 4px;
-                padding: 8px;
-                min-height: 80px;
-            }
-            EnvironmentListItem:hover {
-                background-color: #f6f8fa;
-                border-color: #0366d6;
-                border-width: 3px;
-            }
-            EnvironmentListItem:focus {
-                outline: 3px solid #0366d6;
-                outline-offset: 2px;
-            }
-        """)
+    ROW_HEIGHT = 90
+    
+    # WCAG AA compliant colors
+    _BORDER = QColor("#e1e4e8")
+    _BORDER_ACTIVE = QColor("#0366d6")
+    _BACKGROUND = QColor("#ffffff")
+    _BACKGROUND_ACTIVE = QColor("#f6f8fa")
+    _NAME_COLOR = QColor("#24292e")
+    _DESCRIPTION_COLOR = QColor("#586069")  # 4.54:1 contrast ratio
+    
+    # Badge colors: (text, background, border)
+    _APPS_BADGE = (QColor("#0366d6"), QColor("#f1f8ff"), QColor("#c8e1ff"))
+    _SITES_BADGE = (QColor("#28a745"), QColor("#f0fff4"), QColor("#c3e6cb"))
+    
+    def sizeHint(self, option, index):
+        """All rows share the same height."""
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        """Paint an environment row."""
+        environment = index.data(Qt.ItemDataRole.UserRole)
+        if environment is None:
+            super().paint(painter, option, index)
+            return
         
-        layout = QVBoxLayout()
-        layout.setContentsMargins(10, 8, 10, 8)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card background; hover and selection share the highlight style
+        active = bool(option.state & (QStyle.StateFlag.State_MouseOver |
+                                      QStyle.StateFlag.State_Selected))
+        card = option.rect.adjusted(4, 4, -4, -4)
+        painter.setPen(QPen(self._BORDER_ACTIVE if active else self._BORDER, 3 if active else 2))
+        painter.setBrush(self._BACKGROUND_ACTIVE if active else self._BACKGROUND)
+        painter.drawRoundedRect(card, 8, 8)
+        
+        content = card.adjusted(12, 8, -12, -8)
         
         # Environment name
-        name_label = QLabel(self.environment.name)
-        name_font = QFont()
-        name_font.setBold(True)
-        name_font.setPointSize(14)  # Larger for better readability
-        name_label.setFont(name_font)
-        name_label.setStyleSheet("color: #24292e; margin-bottom: 4px;")  # WCAG AA compliant contrast
-        layout.addWidget(name_label)
+        metrics = QFontMetrics(_NAME_FONT)
+        painter.setFont(_NAME_FONT)
+        painter.setPen(self._NAME_COLOR)
+        painter.drawText(
+            QRect(content.left(), content.top(), content.width(), metrics.height()),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            metrics.elidedText(environment.name, Qt.TextElideMode.ElideRight, content.width())
+        )
         
         # Description
-        if self.environment.description:
-            desc_label = QLabel(self.environment.description)
-            desc_label.setStyleSheet("""
-                color: #586069; 
-                font-size: 12px; 
-                margin-bottom: 6px;
-                line-height: 1.4;
-            """)  # Better contrast ratio (4.54:1)
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
-        
-        # Stats with better visual hierarchy
-        stats_layout = QHBoxLayout()
-        stats_layout.setContentsMargins(0, 6, 0, 0)
-        
-        app_count = len(self.environment.applications)
-        website_count = len(self.environment.websites)
-        
-        # Create individual badges for better readability
-        apps_badge = QLabel(f"📱 {app_count} Apps")
-        apps_badge.setStyleSheet("""
-            color: #0366d6;
-            background-color: #f1f8ff;
-            border: 1px solid #c8e1ff;
-            border-radius: 12px;
-            padding: 4px 8px;
-            font-size: 11px;
-            font-weight: 500;
-        """)
-        
-        websites_badge = QLabel(f"🌐 {website_count} Sites")
-        websites_badge.setStyleSheet("""
-            color: #28a745;
-            background-color: #f0fff4;
-            border: 1px solid #c3e6cb;
-            border-radius: 12px;
-            padding: 4px 8px;
-            font-size: 11px;
-            font-weight: 500;
-        """)
-        
-        stats_layout.addWidget(apps_badge)
-        stats_layout.addWidget(websites_badge)
-        stats_layout.addStretch()
-        layout.addLayout(stats_layout)
+        if environment.description:
+            top = content.top() + metrics.height() + 4
+            metrics = QFontMetrics(_DESCRIPTION_FONT)
+            painter.setFont(_DESCRIPTION_FONT)
+            painter.setPen(self._DESCRIPTION_COLOR)
+            painter.drawText(
+                QRect(content.left(), top, content.width(), metrics.height()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                metrics.elidedText(environment.description, Qt.TextElideMode.ElideRight,
+                                   content.width())
+            )
         
-        self.setLayout(layout)
+        # Stats badges along the bottom
+        x = content.left()
+        x += self._draw_badge(painter, x, content.bottom(),
+                              f"📱 {environment.app_count} Apps", self._APPS_BADGE) + 8
+        self._draw_badge(painter, x, content.bottom(),
+                         f"🌐 {environment.website_count} Sites", self._SITES_BADGE)
+        
+        painter.restore()
+    
+    def _draw_badge(self, painter, x: int, bottom: int, text: str, colors) -> int:
+        """Draw a pill badge whose bottom edge sits at bottom; returns its width."""
+        text_color, background, border = colors
+        metrics = QFontMetrics(_BADGE_FONT)
+        height = metrics.height() + 8
+        rect = QRect(x, bottom - height + 1, metrics.horizontalAdvance(text) + 16, height)
+        
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, height / 2, height / 2)
+        
+        painter.setFont(_BADGE_FONT)
+        painter.setPen(text_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        
+        return rect.width()
 
 
 class LaunchProgressWidget(QWidget):
     """Widget to show launch progress."""
     
+    # Log entry markup; only the (escaped) message is substituted
+    _OK_SPAN = '<span style="color: green;">✓ {}</span>'
+    _FAIL_SPAN = '<span style="color: red;">✗ {}</span>'
+    
     def __init__(self):
         super().__init__()
+        
+        # Latest progress state, applied once per event-loop pass
+        self._pending_value = None
+        self._pending_status = None
+        self._log_buffer = []
+        self._flush_pending = False
+        
+        # Last values applied to the widgets, to skip no-op updates
+        self._last_progress_value = -1
+        self._last_status = None
+        
         self.setup_ui()
     
     def setup_ui(self):
         """Set up the UI."""
         layout = QVBoxLayout()
-        layout.setSpacing(12)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        # All progress widgets live in one container that is shown and hidden
+        # as a unit: one layout pass instead of one per child
+        self._progress_container = QFrame()
+        self._progress_container.setVisible(False)
+        container_layout = QVBoxLayout(self._progress_container)
+        container_layout.setSpacing(12)
         
         # Progress bar with better styling
         self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
+        self.progress_bar.setObjectName("launch-progress-bar")
         self.progress_bar.setMinimumHeight(24)  # Better touch target
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #d1d5da;
-                border-radius: 12px;
-                background-color: #f6f8fa;
-                text-align: center;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QProgressBar::chunk {
-                background-color: #28a745;
-                border-radius: 10px;
-                margin: 1px;
-            }
-        """)
-        layout.addWidget(self.progress_bar)
+        container_layout.addWidget(self.progress_bar)
         
         # Status text with better visibility
         self.status_label = QLabel()
-        self.status_label.setVisible(False)
+        self.status_label.setObjectName("launch-status")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #24292e;
-                font-size: 13px;
-                font-weight: 500;
-                padding: 8px;
-                background-color: #f1f8ff;
-                border: 1px solid #c8e1ff;
-                border-radius: 6px;
-                margin: 4px 0;
-            }
-        """)
-        layout.addWidget(self.status_label)
+        container_layout.addWidget(self.status_label)
         
         # Launch log with improved readability
         self.log_text = QTextEdit()
-        self.log_text.setVisible(False)
+        self.log_text.setObjectName("launch-log")
         self.log_text.setMaximumHeight(120)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                font-family: 'SF Mono', Monaco, 'Cascadia Code', 'Roboto Mono', Consolas, monospace;
-                font-size: 11px;
-                line-height: 1.4;
-                background-color: #f6f8fa;
-                border: 2px solid #d1d5da;
-                border-radius: 8px;
-                padding: 8px;
-                color: #24292e;
-            }
-            QTextEdit:focus {
-                border-color: #0366d6;
-                outline: none;
-            }
-        """)
-        layout.addWidget(self.log_text)
+        container_layout.addWidget(self.log_text)
         
+        layout.addWidget(self._progress_container)
         self.setLayout(layout)
     
     def show_progress(self):
         """Show progress widgets."""
-        self.progress_bar.setVisible(True)
-        self.status_label.setVisible(True)
-        self.log_text.setVisible(True)
+        self._progress_container.setVisible(True)
         self.log_text.clear()
+        self._log_buffer.clear()
+        self._schedule_flush()
     
     def hide_progress(self):
         """Hide progress widgets."""
-        self.progress_bar.setVisible(False)
-        self.status_label.setVisible(False)
-        self.log_text.setVisible(False)
+        self._progress_container.setVisible(False)
     
     def update_progress(self, value: int, status: str):
-        """Update progress."""
-        self.progress_bar.setValue(value)
-        self.status_label.setText(status)
+        """Update progress (coalesced until the event loop is idle)."""
+        self._pending_value = value
+        self._pending_status = status
+        if not self._is_offscreen():
+            self._schedule_flush()
+    
+    def _is_offscreen(self) -> bool:
+        """Check whether updates would be painted at all."""
+        return not self.isVisible() or self.window().isMinimized()
+    
+    def showEvent(self, event):
+        """Apply anything buffered while hidden."""
+        super().showEvent(event)
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Schedule a single flush of pending state."""
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(0, self._flush)
+    
+    def _flush(self):
+        """Apply the latest pending progress state."""
+        self._flush_pending = False
+        
+        if self._pending_value is not None:
+            if self._pending_value != self._last_progress_value:
+                self.progress_bar.setValue(self._pending_value)
+                self._last_progress_value = self._pending_value
+            if self._pending_status != self._last_status:
+                self.status_label.setText(self._pending_status)
+                self._last_status = self._pending_status
+            self._pending_value = None
+            self._pending_status = None
+            
+        self._flush_log()
+    
+    def _flush_log(self):
+        """Append all buffered log entries in a single document update."""
+        if self._log_buffer:
+            self.log_text.append("<br>".join(self._log_buffer))
+            self._log_buffer.clear()
     
     def add_log_entry(self, message: str, success: bool = True):
         """Add entry to launch log."""
-        color = "green" if success else "red"
-        symbol = "✓" if success else "✗"
-        self.log_text.append(f'<span style="color: {color};">{symbol} {message}</span>')
+        template = self._OK_SPAN if success else self._FAIL_SPAN
+        self._log_buffer.append(template.format(html.escape(message)))
+        
+        # Entries are appended in one batch per event-loop pass, and not at
+        # all while nobody can see them
+        if not self._is_offscreen():
+            self._schedule_flush()
 
 
 class EnvironmentSelector(QWidget):
     """Main environment selector window."""
     
     settings_requested = pyqtSignal()
+    launch_all_result = pyqtSignal(str, bool, str)  # environment_name, success, error
+    
+    # Heavy windows, resolved lazily on first use and shared by all instances
+    _dashboard_cls = None
+    _settings_dialog_cls = None
     
     def __init__(self, controller: EnhancedAppController):
         super().__init__()
         self.controller = controller
         self.current_environment = None
         
+        # Launch-all tallies the controller's launch futures as they resolve
+        self._launch_all_total = 0
+        self._launch_all_done = 0
+        self._launch_all_success = 0
+        self.launch_all_result.connect(self.on_launch_all_result)
+        
+        # Launcher progress is applied at most every 33 ms (~30 Hz)
+        self._latest_progress = (0, "")
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # id(environment) -> rendered details HTML, cleared on reload
+        self._details_cache: Dict[int, str] = {}
+        
         self.setup_ui()
         self.setup_connections()
         self.load_environments()
         
-        # Connect controller signals
-        self.controller.launcher.launch_started.connect(self.on_launch_started)
-        self.controller.launcher.progress_updated.connect(self.on_progress_updated)
-        self.controller.launcher.item_launched.connect(self.on_item_launched)
-        self.controller.launcher.launch_completed.connect(self.on_launch_completed)
-        self.controller.launcher.error_occurred.connect(self.on_launch_error)
+        # Connect controller signals; unique so a re-bound controller never
+        # ends up calling the same slot twice per emit. PyQt6 connection types
+        # are plain enums and can't be OR'd, so progress is queued only.
+        launcher = self.controller.launcher
+        unique = Qt.ConnectionType.UniqueConnection
+        connections = (
+            (launcher.launch_started, self.on_launch_started, unique),
+            (launcher.progress_updated, self.on_progress_updated,
+             Qt.ConnectionType.QueuedConnection),
+            (launcher.item_launched, self.on_item_launched, unique),
+            (launcher.launch_completed, self.on_launch_completed, unique),
+            (launcher.error_occurred, self.on_launch_error, unique),
+        )
+        for signal, slot, connection_type in connections:
+            try:
+                signal.connect(slot, connection_type)
+            except TypeError:
+                pass  # Already connected
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -234,20 +313,19 @@ class EnvironmentSelector(QWidget):
         self.setMinimumSize(900, 650)  # Larger for better accessibility
         self.resize(1000, 750)
         
-        # Apply EnvStarter icon
-        from src.envstarter.utils.icons import apply_icon_to_widget
-        apply_icon_to_widget(self)
+        # One stylesheet for the whole window, matched by object name
+        self.setStyleSheet(STYLESHEET)
         
         # Main layout with better spacing
         main_layout = QVBoxLayout()
         main_layout.setSpacing(20)  # More breathing room
         main_layout.setContentsMargins(30, 30, 30, 30)
+        self.main_layout = main_layout
         
-        # Environment Status Bar
-        from src.envstarter.gui.environment_status_widget import EnvironmentStatusWidget
-        self.env_status_widget = EnvironmentStatusWidget()
-        self.env_status_widget.switch_requested.connect(self.switch_to_environment)
+        # Environment Status Bar; placeholder until the first paint is done
+        self.env_status_widget = QWidget()
         main_layout.addWidget(self.env_status_widget)
+        QTimer.singleShot(0, self._init_deferred_widgets)
         
         # Header with improved accessibility
         header_layout = QVBoxLayout()
@@ -255,30 +333,12 @@ class EnvironmentSelector(QWidget):
         
         title_label = QLabel("EnvStarter")
         title_label.setObjectName("main-title")  # For accessibility
-        title_font = QFont()
-        title_font.setPointSize(28)  # Larger for better readability
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_TITLE_FONT)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel#main-title {
-                color: #24292e;
-                margin-bottom: 8px;
-                letter-spacing: -0.5px;
-            }
-        """)
         header_layout.addWidget(title_label)
         
         subtitle_label = QLabel("Start your perfect work environment with one click")
         subtitle_label.setObjectName("subtitle")
-        subtitle_label.setStyleSheet("""
-            QLabel#subtitle {
-                color: #586069; 
-                font-size: 16px;
-                font-weight: 400;
-                letter-spacing: 0.1px;
-            }
-        """)  # WCAG AA compliant contrast
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(subtitle_label)
         
@@ -295,56 +355,17 @@ class EnvironmentSelector(QWidget):
         
         list_header = QLabel("Select Environment:")
         list_header.setObjectName("section-header")
-        list_header.setStyleSheet("""
-            QLabel#section-header {
-                font-weight: 600; 
-                font-size: 16px; 
-                color: #24292e;
-                margin-bottom: 8px;
-                padding: 4px 0;
-            }
-        """)  # Better contrast and sizing
         left_layout.addWidget(list_header)
         
         # Add keyboard navigation hint
         nav_hint = QLabel("Use ↑↓ arrow keys to navigate, Enter to select")
-        nav_hint.setStyleSheet("""
-            color: #6a737d;
-            font-size: 12px;
-            font-style: italic;
-            margin-bottom: 8px;
-        """)
+        nav_hint.setObjectName("nav-hint")
         left_layout.addWidget(nav_hint)
         
         self.environment_list = QListWidget()
         self.environment_list.setObjectName("environment-list")
-        # WCAG compliant list styling with better focus indicators
-        self.environment_list.setStyleSheet("""
-            QListWidget#environment-list {
-                border: 2px solid #d1d5da;
-                border-radius: 8px;
-                background-color: #fafbfc;
-                padding: 8px;
-                outline: none;
-            }
-            QListWidget#environment-list:focus {
-                border-color: #0366d6;
-                border-width: 3px;
-            }
-            QListWidget#environment-list::item {
-                border: none;
-                padding: 0px;
-                margin: 4px;
-                border-radius: 6px;
-            }
-            QListWidget#environment-list::item:selected {
-                background-color: transparent;
-            }
-            QListWidget#environment-list::item:focus {
-                outline: 2px solid #0366d6;
-                outline-offset: 2px;
-            }
-        """)
+        self.environment_list.setItemDelegate(EnvironmentDelegate(self.environment_list))
+        self.environment_list.setMouseTracking(True)  # Hover highlight
         left_layout.addWidget(self.environment_list)
         
         # Buttons with improved accessibility
@@ -355,32 +376,6 @@ class EnvironmentSelector(QWidget):
         self.launch_button = QPushButton("🚀 Launch Environment")
         self.launch_button.setObjectName("primary-button")
         self.launch_button.setMinimumHeight(44)  # WCAG minimum touch target
-        self.launch_button.setStyleSheet("""
-            QPushButton#primary-button {
-                background-color: #28a745;
-                color: white;
-                border: 2px solid #28a745;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                min-width: 160px;
-            }
-            QPushButton#primary-button:hover {
-                background-color: #218838;
-                border-color: #1e7e34;
-                border-width: 3px;
-            }
-            QPushButton#primary-button:focus {
-                outline: 3px solid #28a745;
-                outline-offset: 2px;
-            }
-            QPushButton#primary-button:disabled {
-                background-color: #e9ecef;
-                border-color: #dee2e6;
-                color: #6c757d;
-            }
-        """)
         self.launch_button.setEnabled(False)
         self.launch_button.setToolTip("Launch the selected environment (Ctrl+Enter)")
         button_layout.addWidget(self.launch_button)
@@ -388,27 +383,6 @@ class EnvironmentSelector(QWidget):
         self.settings_button = QPushButton("⚙️ Settings")
         self.settings_button.setObjectName("secondary-button")
         self.settings_button.setMinimumHeight(44)  # WCAG minimum touch target
-        self.settings_button.setStyleSheet("""
-            QPushButton#secondary-button {
-                background-color: #0366d6;
-                color: white;
-                border: 2px solid #0366d6;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 120px;
-            }
-            QPushButton#secondary-button:hover {
-                background-color: #0256cc;
-                border-color: #0256cc;
-                border-width: 3px;
-            }
-            QPushButton#secondary-button:focus {
-                outline: 3px solid #0366d6;
-                outline-offset: 2px;
-            }
-        """)
         self.settings_button.setToolTip("Open settings to manage environments (Ctrl+,)")
         button_layout.addWidget(self.settings_button)
         
@@ -417,62 +391,20 @@ class EnvironmentSelector(QWidget):
         enhanced_layout.setSpacing(8)
         
         self.launch_all_button = QPushButton("🚀 Launch All")
+        self.launch_all_button.setObjectName("launch-all-button")
         self.launch_all_button.setMinimumHeight(36)
-        self.launch_all_button.setStyleSheet("""
-            QPushButton {
-                background-color: #fd7e14;
-                color: white;
-                border: 2px solid #fd7e14;
-                border-radius: 6px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #e8590c;
-                border-color: #e8590c;
-            }
-        """)
         self.launch_all_button.clicked.connect(self.launch_all_environments)
         enhanced_layout.addWidget(self.launch_all_button)
         
         self.stop_all_button = QPushButton("🛑 Stop All")
+        self.stop_all_button.setObjectName("stop-all-button")
         self.stop_all_button.setMinimumHeight(36)
-        self.stop_all_button.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: 2px solid #dc3545;
-                border-radius: 6px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-                border-color: #c82333;
-            }
-        """)
         self.stop_all_button.clicked.connect(self.stop_all_containers)
         enhanced_layout.addWidget(self.stop_all_button)
         
         self.dashboard_button = QPushButton("🎮 Dashboard")
+        self.dashboard_button.setObjectName("dashboard-button")
         self.dashboard_button.setMinimumHeight(36)
-        self.dashboard_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6f42c1;
-                color: white;
-                border: 2px solid #6f42c1;
-                border-radius: 6px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #5a32a3;
-                border-color: #5a32a3;
-            }
-        """)
         self.dashboard_button.clicked.connect(self.show_dashboard)
         enhanced_layout.addWidget(self.dashboard_button)
         
@@ -489,53 +421,21 @@ class EnvironmentSelector(QWidget):
         # Environment details
         details_header = QLabel("Environment Details:")
         details_header.setObjectName("section-header")
-        details_header.setStyleSheet("""
-            QLabel#section-header {
-                font-weight: 600; 
-                font-size: 16px; 
-                color: #24292e;
-                margin-bottom: 8px;
-                padding: 4px 0;
-            }
-        """)
         right_layout.addWidget(details_header)
         
-        self.details_text = QTextEdit()
+        # Read-only rich text: a label avoids QTextEdit's editor machinery
+        self.details_text = QLabel()
         self.details_text.setObjectName("details-text")
-        self.details_text.setReadOnly(True)
+        self.details_text.setTextFormat(Qt.TextFormat.RichText)
+        self.details_text.setWordWrap(True)
+        self.details_text.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.details_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.details_text.setMaximumHeight(220)
-        # Improved readability and WCAG compliance
-        self.details_text.setStyleSheet("""
-            QTextEdit#details-text {
-                border: 2px solid #d1d5da;
-                border-radius: 8px;
-                background-color: #f6f8fa;
-                padding: 12px;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                font-size: 13px;
-                line-height: 1.5;
-                color: #24292e;
-            }
-            QTextEdit#details-text:focus {
-                border-color: #0366d6;
-                outline: none;
-                border-width: 3px;
-            }
-        """)
         right_layout.addWidget(self.details_text)
         
         # Launch progress
         progress_header = QLabel("Launch Progress:")
         progress_header.setObjectName("section-header")
-        progress_header.setStyleSheet("""
-            QLabel#section-header {
-                font-weight: 600; 
-                font-size: 16px; 
-                color: #24292e;
-                margin-bottom: 8px;
-                padding: 4px 0;
-            }
-        """)
         right_layout.addWidget(progress_header)
         
         self.progress_widget = LaunchProgressWidget()
@@ -560,52 +460,12 @@ class EnvironmentSelector(QWidget):
         self.minimize_button = QPushButton("↓ Minimize to Tray")
         self.minimize_button.setObjectName("tertiary-button")
         self.minimize_button.setMinimumHeight(36)
-        self.minimize_button.setStyleSheet("""
-            QPushButton#tertiary-button {
-                background-color: #ffeaa7;
-                color: #2d3436;
-                border: 2px solid #fdcb6e;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QPushButton#tertiary-button:hover {
-                background-color: #fdcb6e;
-                border-color: #e17055;
-                border-width: 3px;
-            }
-            QPushButton#tertiary-button:focus {
-                outline: 3px solid #fdcb6e;
-                outline-offset: 2px;
-            }
-        """)
         self.minimize_button.setToolTip("Minimize to system tray (Ctrl+M)")
         bottom_layout.addWidget(self.minimize_button)
         
         self.exit_button = QPushButton("❌ Exit")
         self.exit_button.setObjectName("danger-button")
         self.exit_button.setMinimumHeight(36)
-        self.exit_button.setStyleSheet("""
-            QPushButton#danger-button {
-                background-color: #fff5f5;
-                color: #dc3545;
-                border: 2px solid #dc3545;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QPushButton#danger-button:hover {
-                background-color: #dc3545;
-                color: white;
-                border-width: 3px;
-            }
-            QPushButton#danger-button:focus {
-                outline: 3px solid #dc3545;
-                outline-offset: 2px;
-            }
-        """)
         self.exit_button.setToolTip("Exit EnvStarter completely (Ctrl+Q)")
         bottom_layout.addWidget(self.exit_button)
         
@@ -613,6 +473,21 @@ class EnvironmentSelector(QWidget):
         
         self.setLayout(main_layout)
     
+    def _init_deferred_widgets(self):
+        """Build the icon and status bar once the window has painted."""
+        # Apply EnvStarter icon
+        from src.envstarter.utils.icons import apply_icon_to_widget
+        apply_icon_to_widget(self)
+        
+        from src.envstarter.gui.environment_status_widget import EnvironmentStatusWidget
+        status_widget = EnvironmentStatusWidget()
+        status_widget.switch_requested.connect(self.switch_to_environment)
+        
+        placeholder = self.env_status_widget
+        self.main_layout.replaceWidget(placeholder, status_widget)
+        placeholder.deleteLater()
+        self.env_status_widget = status_widget
+    
     def setup_connections(self):
         """Set up signal connections."""
         self.environment_list.itemClicked.connect(self.on_environment_selected)
@@ -623,48 +498,44 @@ class EnvironmentSelector(QWidget):
         self.exit_button.clicked.connect(self.controller.quit_application)
         
         # Add keyboard shortcuts for accessibility
-        from PyQt6.QtGui import QShortcut, QKeySequence
-        from PyQt6.QtCore import Qt
-        
-        # Ctrl+Enter to launch environment
-        launch_shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
-        launch_shortcut.activated.connect(self.on_launch_clicked)
-        
-        # Enter key to launch environment
-        enter_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Return), self)
-        enter_shortcut.activated.connect(self.on_launch_clicked)
-        
-        # Ctrl+, to open settings
-        settings_shortcut = QShortcut(QKeySequence("Ctrl+,"), self)
-        settings_shortcut.activated.connect(self.settings_requested.emit)
-        
-        # Ctrl+M to minimize
-        minimize_shortcut = QShortcut(QKeySequence("Ctrl+M"), self)
-        minimize_shortcut.activated.connect(self.hide)
-        
-        # Ctrl+Q to quit
-        quit_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
-        quit_shortcut.activated.connect(self.controller.quit_application)
-        
-        # Escape key to minimize
-        escape_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
-        escape_shortcut.activated.connect(self.hide)
+        shortcuts = (
+            ("Ctrl+Return", self.on_launch_clicked),       # Launch environment
+            (Qt.Key.Key_Return, self.on_launch_clicked),   # Enter also launches
+            ("Ctrl+,", self.settings_requested),           # Open settings
+            ("Ctrl+M", self.hide),                         # Minimize
+            ("Ctrl+Q", self.controller.quit_application),  # Quit
+            (Qt.Key.Key_Escape, self.hide),                # Escape minimizes
+        )
+        for key, slot in shortcuts:
+            action = QAction(self)
+            action.setShortcut(QKeySequence(key))
+            action.triggered.connect(slot)
+            self.addAction(action)
     
     def load_environments(self):
         """Load environments into the list."""
-        self.environment_list.clear()
         environments = self.controller.get_environments()
+        self._details_cache.clear()
         
-        for env in environments:
-            item = QListWidgetItem()
-            widget = EnvironmentListItem(env)
-            item.setSizeHint(widget.sizeHint())
-            
-            self.environment_list.addItem(item)
-            self.environment_list.setItemWidget(item, widget)
+        # Populate in one batch: one layout and paint pass instead of one per row
+        self.environment_list.setUpdatesEnabled(False)
+        self.environment_list.blockSignals(True)
+        try:
+            self.environment_list.clear()
+            for env in environments:
+                # Text keeps type-to-search working; the delegate paints the row
+                item = QListWidgetItem(env.name)
+                item.setData(Qt.ItemDataRole.UserRole, env)
+                self.environment_list.addItem(item)
+        finally:
+            self.environment_list.blockSignals(False)
+            self.environment_list.setUpdatesEnabled(True)
+            self.environment_list.updateGeometry()
         
         if environments:
-            self.environment_list.setCurrentRow(0)
+            # Select silently, then render the details exactly once
+            with QSignalBlocker(self.environment_list):
+                self.environment_list.setCurrentRow(0)
             self.on_environment_selected(self.environment_list.item(0))
     
     def on_environment_selected(self, item):
@@ -672,9 +543,9 @@ class EnvironmentSelector(QWidget):
         if not item:
             return
         
-        widget = self.environment_list.itemWidget(item)
-        if widget:
-            self.current_environment = widget.environment
+        environment = item.data(Qt.ItemDataRole.UserRole)
+        if environment:
+            self.current_environment = environment
             self.launch_button.setEnabled(True)
             self.update_environment_details()
     
@@ -686,30 +557,35 @@ class EnvironmentSelector(QWidget):
     
     def update_environment_details(self):
         """Update environment details display."""
-        if not self.current_environment:
+        env = self.current_environment
+        if not env:
             self.details_text.clear()
             return
         
-        details = []
-        details.append(f"<b>Name:</b> {self.current_environment.name}")
-        
-        if self.current_environment.description:
-            details.append(f"<b>Description:</b> {self.current_environment.description}")
-        
-        if self.current_environment.applications:
-            details.append(f"<b>Applications ({len(self.current_environment.applications)}):</b>")
-            for app in self.current_environment.applications:
-                details.append(f"  • {app.name}")
-        
-        if self.current_environment.websites:
-            details.append(f"<b>Websites ({len(self.current_environment.websites)}):</b>")
-            for website in self.current_environment.websites:
-                details.append(f"  • {website.name} ({website.url})")
-        
-        if self.current_environment.startup_delay > 0:
-            details.append(f"<b>Startup Delay:</b> {self.current_environment.startup_delay} seconds")
+        key = id(env)
+        details = self._details_cache.get(key)
+        if details is None:
+            details = self._render_environment_details(env)
+            self._details_cache[key] = details
         
-        self.details_text.setHtml("<br>".join(details))
+        self.details_text.setText(details)
+    
+    def _render_environment_details(self, env: Environment) -> str:
+        """Render the details HTML for an environment."""
+        description = f"<br><b>Description:</b> {html.escape(env.description)}" if env.description else ""
+        applications = (
+            f"<br><b>Applications ({env.app_count}):</b>"
+            + "".join(f"<br>  • {html.escape(app.name)}" for app in env.applications)
+        ) if env.applications else ""
+        websites = (
+            f"<br><b>Websites ({env.website_count}):</b>"
+            + "".join(f"<br>  • {html.escape(website.name)} ({html.escape(website.url)})" for website in env.websites)
+        ) if env.websites else ""
+        delay = (
+            f"<br><b>Startup Delay:</b> {env.startup_delay} seconds"
+        ) if env.startup_delay > 0 else ""
+        
+        return f"<b>Name:</b> {html.escape(env.name)}{description}{applications}{websites}{delay}"
     
     def on_launch_clicked(self):
         """Handle launch button click."""
@@ -734,11 +610,23 @@ class EnvironmentSelector(QWidget):
     
     def on_launch_started(self, environment_name: str):
         """Handle launch started."""
+        self._cancel_pending_progress()
         self.progress_widget.update_progress(0, f"Starting {environment_name}...")
     
     def on_progress_updated(self, progress: int, status: str):
-        """Handle progress update."""
-        self.progress_widget.update_progress(progress, status)
+        """Handle progress update; keeps only the latest value until the next flush."""
+        self._latest_progress = (progress, status)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the latest launcher progress."""
+        self.progress_widget.update_progress(*self._latest_progress)
+    
+    def _cancel_pending_progress(self):
+        """Drop a throttled progress value so it cannot overwrite a newer status."""
+        self._progress_timer.stop()
+        self._latest_progress = (0, "")
     
     def on_item_launched(self, item_name: str, success: bool):
         """Handle item launched."""
@@ -746,6 +634,7 @@ class EnvironmentSelector(QWidget):
     
     def on_launch_completed(self, environment_name: str, success: bool):
         """Handle launch completed."""
+        self._cancel_pending_progress()
         self.launch_button.setEnabled(True)
         
         if success:
@@ -760,11 +649,16 @@ class EnvironmentSelector(QWidget):
     
     def on_launch_error(self, error_message: str):
         """Handle launch error."""
+        self._cancel_pending_progress()
         self.launch_button.setEnabled(True)
         self.progress_widget.add_log_entry(f"Error: {error_message}", False)
     
     def launch_all_environments(self):
         """Launch all available environments."""
+        if self._launch_all_done < self._launch_all_total:
+            # The previous batch is still reporting back
+            return
+        
         environments = self.controller.get_environments()
         
         if not environments:
@@ -779,29 +673,53 @@ class EnvironmentSelector(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            from src.envstarter.core.concurrent_launcher import LaunchMode
+            # Each launch runs on the controller's loop; its future reports
+            # back to the GUI thread through launch_all_result (queued
+            # across threads)
+            self._launch_all_total = len(environments)
+            self._launch_all_done = 0
+            self._launch_all_success = 0
+            self.launch_all_button.setEnabled(False)
             
-            # Use concurrent launch mode for maximum speed
-            success_count = 0
             for env in environments:
-                try:
-                    if self.controller.launch_environment_quick(env):
-                        success_count += 1
-                        self.progress_widget.add_log_entry(f"Launched: {env.name}", True)
-                    else:
-                        self.progress_widget.add_log_entry(f"Failed to launch: {env.name}", False)
-                except Exception as e:
-                    self.progress_widget.add_log_entry(f"Error launching {env.name}: {str(e)}", False)
-            
+                future = self.controller.launch_environment_quick(env)
+                future.add_done_callback(
+                    lambda f, name=env.name: self._emit_launch_all_result(name, f)
+                )
+    
+    def _emit_launch_all_result(self, environment_name: str, future: Future):
+        """Report a finished launch from the controller's loop to the GUI thread."""
+        if future.cancelled():
+            self.launch_all_result.emit(environment_name, False, "launch was cancelled")
+            return
+        error = future.exception()
+        if error is not None:
+            self.launch_all_result.emit(environment_name, False, str(error))
+        elif not future.result():
+            self.launch_all_result.emit(environment_name, False, "environment did not start")
+        else:
+            self.launch_all_result.emit(environment_name, True, "")
+    
+    def on_launch_all_result(self, environment_name: str, success: bool, error: str):
+        """Log one launch-all result and summarize once every launch is back."""
+        self._launch_all_done += 1
+        if success:
+            self._launch_all_success += 1
+            self.progress_widget.add_log_entry(f"Launched: {environment_name}", True)
+        else:
+            self.progress_widget.add_log_entry(f"Error launching {environment_name}: {error}", False)
+        
+        if self._launch_all_done == self._launch_all_total:
+            self.launch_all_button.setEnabled(True)
             QMessageBox.information(
                 self, "Launch All Complete",
-                f"Launch completed!\n{success_count}/{len(environments)} environments started successfully."
+                f"Launch completed!\n{self._launch_all_success}/{self._launch_all_total} environments started successfully."
             )
     
     def stop_all_containers(self):
         """Stop all running containers."""
-        containers = self.controller.manager.get_all_containers()
-        running = [cid for cid, info in containers.items() if info["state"] == "running"]
+        # Ids only; no need to build every container's info dict
+        running = self.controller.manager.get_running_containers()
         
         if not running:
             QMessageBox.information(self, "No Containers", "No running containers to stop.")
@@ -822,11 +740,13 @@ class EnvironmentSelector(QWidget):
     def show_dashboard(self):
         """Show the multi-environment dashboard."""
         try:
-            from src.envstarter.gui.multi_environment_dashboard import MultiEnvironmentDashboard
-            
-            # Create or show dashboard
+            # Create or show dashboard; its module is imported on first use only
             if not hasattr(self, 'dashboard') or not self.dashboard:
-                self.dashboard = MultiEnvironmentDashboard()
+                cls = type(self)
+                if cls._dashboard_cls is None:
+                    from src.envstarter.gui.multi_environment_dashboard import MultiEnvironmentDashboard
+                    cls._dashboard_cls = MultiEnvironmentDashboard
+                self.dashboard = cls._dashboard_cls()
             
             self.dashboard.show()
             self.dashboard.raise_()
@@ -841,11 +761,13 @@ class EnvironmentSelector(QWidget):
     def show_settings(self):
         """Show the enhanced settings dialog."""
         try:
-            from src.envstarter.gui.enhanced_settings_dialog import EnhancedSettingsDialog
-            
-            # Create or show settings dialog
+            # Create or show settings dialog; its module is imported on first use only
             if not hasattr(self, 'settings_dialog') or not self.settings_dialog:
-                self.settings_dialog = EnhancedSettingsDialog(self.controller)
+                cls = type(self)
+                if cls._settings_dialog_cls is None:
+                    from src.envstarter.gui.enhanced_settings_dialog import EnhancedSettingsDialog
+                    cls._settings_dialog_cls = EnhancedSettingsDialog
+                self.settings_dialog = cls._settings_dialog_cls(self.controller)
                 self.settings_dialog.environment_changed.connect(self.on_environments_changed)
             
             self.settings_dialog.show()
@@ -3,11 +3,24 @@
 Shows running environment info in application headers!
 """
 
-from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QLabel, QPushButton, 
+from PyQt6.QtWidgets import (QApplication, QWidget, QHBoxLayout, QLabel, QPushButton, 
                              QFrame, QVBoxLayout, QScrollArea)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
+from src.envstarter.utils.theme_manager import get_theme_manager
+
+
+# Shared fonts; one instance serves every label
+_BOLD_FONT = QFont()
+_BOLD_FONT.setBold(True)
+
+_HEADER_FONT = QFont()
+_HEADER_FONT.setBold(True)
+_HEADER_FONT.setPointSize(12)
 
 
 class EnvironmentStatusWidget(QWidget):
@@ -25,12 +38,10 @@ class EnvironmentStatusWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.containers_info = {}
+        self._env_widgets: Dict[str, Tuple[QLabel, QPushButton]] = {}  # container_id -> (separator, button)
+        self._last_struct_key: Tuple[str, ...] = ()  # running container ids at last rebuild
+        self._listening = False  # connected to manager updates (only while shown)
         self.setup_ui()
-        
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(2000)  # Update every 2 seconds
     
     def setup_ui(self):
         """Set up the status widget UI."""
@@ -45,30 +56,33 @@ class EnvironmentStatusWidget(QWidget):
         self.status_layout.setSpacing(6)
         
         # Apply theme-aware styling
-        from src.envstarter.utils.theme_manager import get_theme_manager
         theme = get_theme_manager()
         
-        bg_color = theme.get_color("surface")
-        text_color = theme.get_color("text_primary")
-        border_color = theme.get_color("border")
-        primary_color = theme.get_color("primary")
+        # Resolve colors and per-label styles once, not on every update
+        self._c_surface = theme.get_color("surface")
+        self._c_text = theme.get_color("text_primary")
+        self._c_border = theme.get_color("border")
+        self._c_primary = theme.get_color("primary")
+        self._c_muted = theme.get_color("text_muted")
+        self._separator_qss = f"color: {self._c_border};"
+        self._more_label_qss = f"color: {self._c_muted}; font-style: italic;"
         
         self.status_frame.setStyleSheet(f"""
             QFrame {{
-                background-color: {bg_color};
-                border: 1px solid {border_color};
+                background-color: {self._c_surface};
+                border: 1px solid {self._c_border};
                 border-radius: 6px;
                 padding: 2px;
             }}
             QLabel {{
                 background: transparent;
-                color: {text_color};
+                color: {self._c_text};
                 font-size: 11px;
                 font-weight: 600;
                 padding: 2px 4px;
             }}
             QPushButton {{
-                background-color: {primary_color};
+                background-color: {self._c_primary};
                 color: white;
                 border: none;
                 border-radius: 3px;
@@ -85,9 +99,19 @@ class EnvironmentStatusWidget(QWidget):
         
         # Default message
         self.default_label = QLabel("No environments running")
-        self.default_label.setStyleSheet(f"color: {theme.get_color('text_muted')}; font-style: italic;")
+        self.default_label.setStyleSheet(self._more_label_qss)
         self.status_layout.addWidget(self.default_label)
         
+        # Persistent chrome around the per-environment entries
+        self.active_label = QLabel("🎯 Active:")
+        self.active_label.hide()
+        self.status_layout.addWidget(self.active_label)
+        
+        self.more_label = QLabel()
+        self.more_label.setStyleSheet(self._more_label_qss)
+        self.more_label.hide()
+        self.status_layout.addWidget(self.more_label)
+        
         self.status_frame.setLayout(self.status_layout)
         layout.addWidget(self.status_frame)
         
@@ -97,77 +121,152 @@ class EnvironmentStatusWidget(QWidget):
         self.setMaximumHeight(32)
     
     def update_status(self):
-        """Update the environment status display."""
+        """Update the environment status display, touching only what changed."""
         try:
-            from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
             manager = get_multi_environment_manager()
             
             containers = manager.get_all_containers()
-            running_containers = {
-                cid: info for cid, info in containers.items()
+            running_items = [
+                (cid, info) for cid, info in containers.items()
                 if info.get("state") == "running"
-            }
+            ]
+            
+            # Limit to 4 environments to avoid overcrowding
+            shown = running_items[:4]
             
-            # Clear existing widgets
-            for i in reversed(range(self.status_layout.count())):
-                child = self.status_layout.itemAt(i).widget()
-                if child:
-                    child.deleteLater()
+            # Same running set as last time: only the numbers can differ
+            struct_key = tuple(cid for cid, _ in running_items)
+            if struct_key == self._last_struct_key:
+                for container_id, info in shown:
+                    self._refresh_stats_only(container_id, info.get("stats", {}))
+                return
+            self._last_struct_key = struct_key
             
-            if not running_containers:
-                # No environments running
-                self.default_label = QLabel("No environments running")
-                from src.envstarter.utils.theme_manager import get_theme_manager
-                theme = get_theme_manager()
-                self.default_label.setStyleSheet(f"color: {theme.get_color('text_muted')}; font-style: italic;")
-                self.status_layout.addWidget(self.default_label)
-            else:
-                # Show running environments
-                self.status_layout.addWidget(QLabel("🎯 Active:"))
+            # Batch the changes: one layout pass and repaint instead of one per widget
+            self.status_frame.setUpdatesEnabled(False)
+            self.status_layout.setEnabled(False)
+            try:
+                shown_ids = {cid for cid, _ in shown}
                 
-                for i, (container_id, info) in enumerate(running_containers.items()):
-                    if i > 0:
-                        # Add separator
-                        separator = QLabel("|")
-                        from src.envstarter.utils.theme_manager import get_theme_manager
-                        theme = get_theme_manager()
-                        separator.setStyleSheet(f"color: {theme.get_color('border')};")
-                        self.status_layout.addWidget(separator)
-                    
-                    # Environment button
+                # Drop entries for environments that are gone
+                for container_id in [cid for cid in self._env_widgets if cid not in shown_ids]:
+                    for widget in self._env_widgets.pop(container_id):
+                        self.status_layout.removeWidget(widget)
+                        widget.deleteLater()
+                
+                # Create new entries and keep layout order in step with `shown`
+                position = self.status_layout.indexOf(self.active_label) + 1
+                for i, (container_id, info) in enumerate(shown):
                     env_name = info.get("environment_name", "Unknown")
                     stats = info.get("stats", {})
-                    process_count = stats.get("total_processes", 0)
-                    memory_mb = stats.get("total_memory_mb", 0)
-                    
-                    # Create clickable environment button
-                    env_btn = QPushButton(f"{env_name} ({process_count} apps)")
-                    env_btn.setToolTip(f"Environment: {env_name}\n"
-                                     f"Applications: {process_count}\n"
-                                     f"Memory: {memory_mb:.0f}MB\n"
-                                     f"Click to switch")
                     
-                    # Connect switch signal
-                    env_btn.clicked.connect(lambda checked, cid=container_id: self.switch_requested.emit(cid))
+                    entry = self._env_widgets.get(container_id)
+                    if entry is None:
+                        entry = self._create_env_entry(container_id, env_name)
+                        self._env_widgets[container_id] = entry
                     
-                    self.status_layout.addWidget(env_btn)
+                    separator, env_btn = entry
+                    separator.setVisible(i > 0)
+                    self._set_button_stats(env_btn, env_name,
+                                           stats.get("total_processes", 0),
+                                           stats.get("total_memory_mb", 0))
                     
-                    # Limit to 4 environments to avoid overcrowding
-                    if i >= 3:
-                        if len(running_containers) > 4:
-                            more_label = QLabel(f"... +{len(running_containers) - 4} more")
-                            from src.envstarter.utils.theme_manager import get_theme_manager
-                            theme = get_theme_manager()
-                            more_label.setStyleSheet(f"color: {theme.get_color('text_muted')}; font-style: italic;")
-                            self.status_layout.addWidget(more_label)
-                        break
+                    for widget in entry:
+                        if self.status_layout.indexOf(widget) != position:
+                            self.status_layout.removeWidget(widget)
+                            self.status_layout.insertWidget(position, widget)
+                        position += 1
+                
+                self.default_label.setVisible(not running_items)
+                self.active_label.setVisible(bool(running_items))
+                
+                hidden_count = len(running_items) - len(shown)
+                if hidden_count > 0:
+                    self.more_label.setText(f"... +{hidden_count} more")
+                self.more_label.setVisible(hidden_count > 0)
+            finally:
+                self.status_layout.setEnabled(True)
+                self.status_frame.setUpdatesEnabled(True)
+                self.status_frame.updateGeometry()
             
         except Exception as e:
             print(f"⚠️ Error updating environment status widget: {e}")
     
+    def _create_env_entry(self, container_id: str, env_name: str) -> Tuple[QLabel, QPushButton]:
+        """Create the separator and switch button for one environment."""
+        separator = QLabel("|")
+        separator.setStyleSheet(self._separator_qss)
+        
+        # Create clickable environment button
+        env_btn = QPushButton()
+        env_btn.setProperty("env_name", env_name)
+        env_btn.setProperty("container_id", container_id)
+        
+        # Connect switch signal
+        env_btn.clicked.connect(self._on_switch_clicked)
+        
+        return separator, env_btn
+    
+    def _on_switch_clicked(self):
+        """Shared slot for every environment button."""
+        self.switch_requested.emit(self.sender().property("container_id"))
+    
+    def _set_button_stats(self, env_btn: QPushButton, env_name: str,
+                          process_count: int, memory_mb: float):
+        """Write an environment's stats into its button text and tooltip."""
+        env_btn.setText(f"{env_name} ({process_count} apps)")
+        env_btn.setToolTip(f"Environment: {env_name}\n"
+                           f"Applications: {process_count}\n"
+                           f"Memory: {memory_mb:.0f}MB\n"
+                           f"Click to switch")
+    
+    def _refresh_stats_only(self, container_id: str, stats: Dict):
+        """Update one environment's stats without rebuilding the widgets."""
+        entry = self._env_widgets.get(container_id)
+        if entry is None:
+            return
+        
+        env_btn = entry[1]
+        self._set_button_stats(env_btn, env_btn.property("env_name"),
+                               stats.get("total_processes", 0),
+                               stats.get("total_memory_mb", 0))
+    
+    def _set_listening(self, listening: bool):
+        """Connect to or disconnect from the manager's update signals."""
+        if listening == self._listening:
+            return
+        self._listening = listening
+        
+        # Event-driven updates: rebuild on state changes and on containers
+        # joining or leaving the registry (a "stopped" state change fires
+        # before the container is removed), retext on stats
+        manager = get_multi_environment_manager()
+        rebuild_signals = (manager.container_state_changed,
+                           manager.container_started,
+                           manager.container_stopped)
+        if listening:
+            for signal in rebuild_signals:
+                signal.connect(self.update_status)
+            manager.stats_updated.connect(self._refresh_stats_only)
+        else:
+            for signal in rebuild_signals:
+                signal.disconnect(self.update_status)
+            manager.stats_updated.disconnect(self._refresh_stats_only)
+    
+    def showEvent(self, event):
+        """Resume updates and catch up on anything missed while hidden."""
+        super().showEvent(event)
+        self._set_listening(True)
+        self.update_status()
+    
+    def hideEvent(self, event):
+        """Stop updating while nothing can be seen."""
+        super().hideEvent(event)
+        self._set_listening(False)
+    
     def closeEvent(self, event):
         """Clean up when widget is closed."""
-        self.update_timer.stop()
+        self._set_listening(False)
         event.accept()
 
 
@@ -180,15 +279,53 @@ class EnvironmentStatusBar(QWidget):
     
     switch_requested = pyqtSignal(str)  # container_id
     stop_requested = pyqtSignal(str)    # container_id
+    fetch_requested = pyqtSignal()      # ask the stats worker for a snapshot
+    
+    _STATE_ICONS = {"running": "🟢", "paused": "⏸️", "stopped": "🔴"}
+    _STATS_FMT = "📱 %d apps | 💾 %.0fMB | ⚡ %.1f%%"
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._env_widgets: Dict[str, QFrame] = {}  # container_id -> row
+        self._env_labels: Dict[str, Tuple[QLabel, QLabel]] = {}  # container_id -> (name, stats)
+        self._switch_buttons: Dict[str, QPushButton] = {}  # container_id -> switch button
+        self._last_struct_key: Tuple[Tuple[str, str], ...] = ()  # (container_id, state) at last rebuild
+        self._listening = False  # connected to manager updates (only while shown and expanded)
         self.setup_ui()
-        
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_environments)
-        self.update_timer.start(1500)  # Update every 1.5 seconds
+        self._setup_stats_worker()
+    
+    def _setup_stats_worker(self):
+        """Start the background thread that gathers container snapshots."""
+        from src.envstarter.gui.environment_header_widget import ContainerStatsWorker
+        
+        self._worker_thread = QThread()
+        self._worker = ContainerStatsWorker(get_multi_environment_manager().get_all_containers)
+        self._worker.moveToThread(self._worker_thread)
+        
+        self.fetch_requested.connect(self._worker.fetch, Qt.ConnectionType.QueuedConnection)
+        self._worker.containers_ready.connect(
+            self.update_environments, Qt.ConnectionType.QueuedConnection
+        )
+        
+        # Bound to the thread, not the widget, so it still runs from destroyed
+        stop = partial(self._quit_thread, self._worker_thread)
+        self.destroyed.connect(stop)
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(stop)
+        
+        self._worker_thread.start()
+    
+    @staticmethod
+    def _quit_thread(thread: QThread):
+        """Stop a worker thread and wait for it to finish."""
+        if thread.isRunning():
+            thread.quit()
+            thread.wait()
+    
+    def request_update(self):
+        """Refresh from a snapshot gathered off the GUI thread."""
+        self.fetch_requested.emit()
     
     def setup_ui(self):
         """Set up the status bar UI."""
@@ -199,10 +336,7 @@ class EnvironmentStatusBar(QWidget):
         # Header
         header_layout = QHBoxLayout()
         header_label = QLabel("🎯 Running Environments")
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(12)
-        header_label.setFont(header_font)
+        header_label.setFont(_HEADER_FONT)
         header_layout.addWidget(header_label)
         
         header_layout.addStretch()
@@ -226,28 +360,57 @@ class EnvironmentStatusBar(QWidget):
         self.environments_layout.setSpacing(4)
         self.environments_widget.setLayout(self.environments_layout)
         
+        self.no_env_label = QLabel("No environments running")
+        self.environments_layout.addWidget(self.no_env_label)
+        
         self.scroll_area.setWidget(self.environments_widget)
         layout.addWidget(self.scroll_area)
         
         # Apply styling
-        from src.envstarter.utils.theme_manager import get_theme_manager
         theme = get_theme_manager()
         
-        bg_color = theme.get_color("surface")
-        text_color = theme.get_color("text_primary")
-        border_color = theme.get_color("border")
+        # Resolve colors and per-row styles once, not on every update
+        self._c_surface = theme.get_color("surface")
+        self._c_text = theme.get_color("text_primary")
+        self._c_border = theme.get_color("border")
+        self._c_muted = theme.get_color("text_muted")
+        self._c_secondary = theme.get_color("text_secondary")
+        self._c_hover = theme.get_color("hover")
+        self._stats_label_qss = f"color: {self._c_secondary}; font-size: 10px;"
+        self._env_frame_qss = f"""
+            QFrame {{
+                border: 1px solid {self._c_border};
+                border-radius: 6px;
+                background-color: transparent;
+                padding: 2px;
+            }}
+            QFrame:hover {{
+                background-color: {self._c_hover};
+            }}
+            QPushButton {{
+                padding: 4px 8px;
+                font-size: 9px;
+                min-height: 20px;
+                max-height: 20px;
+            }}
+        """
+        
+        self.no_env_label.setStyleSheet(f"color: {self._c_muted}; font-style: italic; padding: 12px;")
         
         self.setStyleSheet(f"""
             QWidget {{
-                background-color: {bg_color};
-                color: {text_color};
+                background-color: {self._c_surface};
+                color: {self._c_text};
                 font-family: 'Segoe UI', Arial, sans-serif;
             }}
             QScrollArea {{
-                border: 1px solid {border_color};
+                border: 1px solid {self._c_border};
                 border-radius: 6px;
-                background-color: {bg_color};
+                background-color: {self._c_surface};
             }}
+            QLabel[state="running"] {{ color: #3fb950; }}
+            QLabel[state="paused"] {{ color: #d29922; }}
+            QLabel[state="stopped"] {{ color: #f85149; }}
         """)
         
         self.setLayout(layout)
@@ -262,35 +425,59 @@ class EnvironmentStatusBar(QWidget):
             self.scroll_area.hide()
             self.toggle_btn.setText("+")
             self.setMaximumHeight(50)
+            self._set_listening(False)
         else:
             self.scroll_area.show()
             self.toggle_btn.setText("−")
             self.setMaximumHeight(250)
+            self._set_listening(True)
+            self.request_update()
     
-    def update_environments(self):
-        """Update the environments display."""
+    def update_environments(self, containers: Optional[Dict[str, Dict]] = None):
+        """
+        Update the environments display, touching only what changed.
+        
+        Normally called with a snapshot from the stats worker; without one
+        the containers are fetched synchronously.
+        """
         try:
-            from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
-            manager = get_multi_environment_manager()
-            
-            containers = manager.get_all_containers()
+            if containers is None:
+                containers = get_multi_environment_manager().get_all_containers()
             
-            # Clear existing widgets
-            for i in reversed(range(self.environments_layout.count())):
-                child = self.environments_layout.itemAt(i).widget()
-                if child:
-                    child.deleteLater()
+            # Same containers in the same states: only the stats can differ
+            struct_key = tuple((cid, info.get("state")) for cid, info in containers.items())
+            if struct_key == self._last_struct_key:
+                for container_id, info in containers.items():
+                    self._refresh_stats_only(container_id, info.get("stats", {}))
+                return
+            self._last_struct_key = struct_key
             
-            if not containers:
-                no_env_label = QLabel("No environments running")
-                from src.envstarter.utils.theme_manager import get_theme_manager
-                theme = get_theme_manager()
-                no_env_label.setStyleSheet(f"color: {theme.get_color('text_muted')}; font-style: italic; padding: 12px;")
-                self.environments_layout.addWidget(no_env_label)
-            else:
+            # Batch the changes: one layout pass and repaint instead of one per row
+            self.environments_widget.setUpdatesEnabled(False)
+            self.environments_layout.setEnabled(False)
+            try:
+                # Drop rows for environments that are gone
+                for container_id in [cid for cid in self._env_widgets if cid not in containers]:
+                    widget = self._env_widgets.pop(container_id)
+                    self.environments_layout.removeWidget(widget)
+                    widget.deleteLater()
+                    self._env_labels.pop(container_id, None)
+                    self._switch_buttons.pop(container_id, None)
+                
+                # Add rows for new environments, refresh the ones we already have
                 for container_id, info in containers.items():
-                    env_widget = self.create_environment_widget(container_id, info)
-                    self.environments_layout.addWidget(env_widget)
+                    if container_id not in self._env_widgets:
+                        env_widget = self.create_environment_widget(container_id, info)
+                        self._env_widgets[container_id] = env_widget
+                        self.environments_layout.addWidget(env_widget)
+                    else:
+                        self._update_environment_widget(container_id, info)
+                
+                self.no_env_label.setVisible(not containers)
+            finally:
+                self.environments_layout.setEnabled(True)
+                self.environments_widget.setUpdatesEnabled(True)
+                self.environments_widget.updateGeometry()
         
         except Exception as e:
             print(f"⚠️ Error updating environment status bar: {e}")
@@ -302,74 +489,114 @@ class EnvironmentStatusBar(QWidget):
         layout.setContentsMargins(8, 6, 8, 6)
         layout.setSpacing(8)
         
-        # Environment info
-        env_name = info.get("environment_name", "Unknown")
-        state = info.get("state", "unknown")
-        stats = info.get("stats", {})
-        
-        process_count = stats.get("total_processes", 0)
-        memory_mb = stats.get("total_memory_mb", 0)
-        cpu_percent = stats.get("total_cpu_percent", 0)
-        
-        # Status indicator
-        if state == "running":
-            status_icon = "🟢"
-            status_color = "#3fb950"
-        elif state == "paused":
-            status_icon = "⏸️"
-            status_color = "#d29922"
-        else:
-            status_icon = "🔴"
-            status_color = "#f85149"
-        
         # Environment name and status
-        env_label = QLabel(f"{status_icon} {env_name}")
-        env_font = QFont()
-        env_font.setBold(True)
-        env_label.setFont(env_font)
-        env_label.setStyleSheet(f"color: {status_color};")
+        env_label = QLabel()
+        env_label.setFont(_BOLD_FONT)
         layout.addWidget(env_label)
         
         # Stats
-        stats_label = QLabel(f"📱 {process_count} apps | 💾 {memory_mb:.0f}MB | ⚡ {cpu_percent:.1f}%")
-        from src.envstarter.utils.theme_manager import get_theme_manager
-        theme = get_theme_manager()
-        stats_label.setStyleSheet(f"color: {theme.get_color('text_secondary')}; font-size: 10px;")
+        stats_label = QLabel()
+        stats_label.setStyleSheet(self._stats_label_qss)
         layout.addWidget(stats_label)
         
         layout.addStretch()
         
-        # Action buttons
-        if state == "running":
-            switch_btn = QPushButton("🔄 Switch")
-            switch_btn.clicked.connect(lambda: self.switch_requested.emit(container_id))
-            layout.addWidget(switch_btn)
+        # Action buttons; switching is only offered while running
+        switch_btn = QPushButton("🔄 Switch")
+        switch_btn.setProperty("container_id", container_id)
+        switch_btn.clicked.connect(self._on_switch_clicked)
+        layout.addWidget(switch_btn)
         
         stop_btn = QPushButton("🛑 Stop")
-        stop_btn.clicked.connect(lambda: self.stop_requested.emit(container_id))
+        stop_btn.setProperty("container_id", container_id)
+        stop_btn.clicked.connect(self._on_stop_clicked)
         layout.addWidget(stop_btn)
         
         # Styling
-        border_color = theme.get_color("border")
-        hover_color = theme.get_color("hover")
-        
-        widget.setStyleSheet(f"""
-            QFrame {{
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                background-color: transparent;
-                padding: 2px;
-            }}
-            QFrame:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton {{
-                padding: 4px 8px;
-                font-size: 9px;
-                min-height: 20px;
-                max-height: 20px;
-            }}
-        """)
+        widget.setStyleSheet(self._env_frame_qss)
         
         widget.setLayout(layout)
-        return widget
\ No newline at end of file
+        
+        self._env_labels[container_id] = (env_label, stats_label)
+        self._switch_buttons[container_id] = switch_btn
+        self._update_environment_widget(container_id, info)
+        return widget
+    
+    def _update_environment_widget(self, container_id: str, info: Dict):
+        """Refresh an existing environment row in place."""
+        env_label, stats_label = self._env_labels[container_id]
+        
+        env_name = info.get("environment_name", "Unknown")
+        state = info.get("state", "unknown")
+        stats = info.get("stats", {})
+        
+        # Status indicator; the color comes from the bar's [state=...] rules
+        style_state = state if state in self._STATE_ICONS else "stopped"
+        
+        env_label.setText(f"{self._STATE_ICONS[style_state]} {env_name}")
+        if env_label.property("state") != style_state:
+            env_label.setProperty("state", style_state)
+            env_label.style().unpolish(env_label)
+            env_label.style().polish(env_label)
+        
+        self._switch_buttons[container_id].setVisible(state == "running")
+        self._refresh_stats_only(container_id, stats)
+    
+    def _on_switch_clicked(self):
+        """Shared slot for every row's switch button."""
+        self.switch_requested.emit(self.sender().property("container_id"))
+    
+    def _on_stop_clicked(self):
+        """Shared slot for every row's stop button."""
+        self.stop_requested.emit(self.sender().property("container_id"))
+    
+    def _refresh_stats_only(self, container_id: str, stats: Dict):
+        """Update one environment's stats line without rebuilding the rows."""
+        labels = self._env_labels.get(container_id)
+        if labels is None:
+            return
+        
+        labels[1].setText(self._STATS_FMT % (stats.get("total_processes", 0),
+                                             stats.get("total_memory_mb", 0),
+                                             stats.get("total_cpu_percent", 0)))
+    
+    def _set_listening(self, listening: bool):
+        """Connect to or disconnect from the manager's update signals."""
+        if listening == self._listening:
+            return
+        self._listening = listening
+        
+        # Event-driven updates: rebuild on state changes and on containers
+        # joining or leaving the registry (a "stopped" state change fires
+        # before the container is removed), retext on stats
+        manager = get_multi_environment_manager()
+        rebuild_signals = (manager.container_state_changed,
+                           manager.container_started,
+                           manager.container_stopped)
+        if listening:
+            for signal in rebuild_signals:
+                signal.connect(self.request_update)
+            manager.stats_updated.connect(self._refresh_stats_only)
+        else:
+            for signal in rebuild_signals:
+                signal.disconnect(self.request_update)
+            manager.stats_updated.disconnect(self._refresh_stats_only)
+    
+    def showEvent(self, event):
+        """Resume updates and catch up on anything missed while hidden."""
+        super().showEvent(event)
+        if not self._worker_thread.isRunning():
+            self._worker_thread.start()
+        if not self.is_minimized:
+            self._set_listening(True)
+            self.request_update()
+    
+    def hideEvent(self, event):
+        """Stop updating while nothing can be seen."""
+        super().hideEvent(event)
+        self._set_listening(False)
+    
+    def closeEvent(self, event):
+        """Clean up when widget is closed."""
+        self._set_listening(False)
+        event.accept()
@@ -9,22 +9,204 @@ like a hypervisor admin console!
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QTableWidget, QTableWidgetItem, QProgressBar, QTabWidget,
-    QGroupBox, QListWidget, QListWidgetItem, QTextEdit,
-    QSplitter, QFrame, QGridLayout, QComboBox, QSpinBox,
-    QCheckBox, QSlider, QMessageBox, QScrollArea, QDialog
+    QProgressBar, QTabWidget, QGroupBox, QListWidget, QListWidgetItem,
+    QFrame, QGridLayout, QComboBox, QSpinBox,
+    QMessageBox, QScrollArea, QDialog, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread
-from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread, QRectF
+from PyQt6.QtGui import QFont, QFontMetrics, QGuiApplication, QPalette, QColor, QPixmap, QPainter
 import asyncio
-import threading
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import logging
+from collections import deque
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.envstarter.core.models import Environment
+from src.envstarter.core.storage import ConfigManager
 from src.envstarter.core.multi_environment_manager import get_multi_environment_manager
-from src.envstarter.core.concurrent_launcher import get_concurrent_launcher, LaunchMode, LaunchThread
-from src.envstarter.core.simple_environment_container import EnvironmentState
+from src.envstarter.core.concurrent_launcher import get_concurrent_launcher, LaunchMode
+from src.envstarter.core.enhanced_app_controller import submit as submit_on_controller_loop
+from src.envstarter.core.simple_environment_container import EnvironmentState, ContainerView
+from src.envstarter.gui.environment_header_widget import ContainerStatsWorker
+from src.envstarter.gui.styles import DASHBOARD_STYLESHEET
+
+
+logger = logging.getLogger(__name__)
+
+# Launch modes bound once at import
+_LM_CONCURRENT = LaunchMode.CONCURRENT
+_LM_SEQUENTIAL = LaunchMode.SEQUENTIAL
+_LM_BATCHED = LaunchMode.BATCHED
+_LM_STAGGERED = LaunchMode.STAGGERED
+
+# Launch mode combo box text -> launch mode
+_MODE_MAP = {
+    "Concurrent": _LM_CONCURRENT,
+    "Sequential": _LM_SEQUENTIAL,
+    "Batched": _LM_BATCHED,
+    "Staggered": _LM_STAGGERED
+}
+
+# Shared fonts; one instance serves every card and header
+_NAME_FONT = QFont()
+_NAME_FONT.setBold(True)
+_NAME_FONT.setPointSize(14)
+
+# Section headers use the same bold 14pt face as card names
+_HEADER_FONT = _NAME_FONT
+
+_TITLE_FONT = QFont()
+_TITLE_FONT.setBold(True)
+_TITLE_FONT.setPointSize(20)
+
+_BOLD_FONT = QFont()
+_BOLD_FONT.setBold(True)
+
+_BADGE_FONT = QFont()
+_BADGE_FONT.setBold(True)
+_BADGE_FONT.setPixelSize(10)
+
+# At most this many removed cards are kept for reuse by new containers
+_CARD_POOL_LIMIT = 32
+
+# Status badge colors per container state: (background, text color, label)
+_STATUS_COLORS = {
+    "running": ("#28a745", "white", "🟢 RUNNING"),
+    "paused": ("#ffc107", "#212529", "⏸️ PAUSED"),
+    "starting": ("#17a2b8", "white", "🚀 STARTING"),
+    "stopping": ("#fd7e14", "white", "🛑 STOPPING"),
+    "stopped": ("#6c757d", "white", "⭕ STOPPED"),
+    "error": ("#dc3545", "white", "❌ ERROR")
+}
+
+
+def _status_colors(state: str) -> Tuple[str, str, str]:
+    """Return (background, text color, label) for a state, memoizing unknown states."""
+    colors = _STATUS_COLORS.get(state)
+    if colors is None:
+        colors = _STATUS_COLORS.setdefault(state, ("#6c757d", "white", f"❓ {state.upper()}"))
+    return colors
+
+
+# Card button states per container state:
+# (switch enabled, pause enabled, resume enabled, stop enabled, paused)
+_BUTTON_STATES = {
+    state: (state == "running", state == "running", state == "paused",
+            state not in ("stopped", "error"), state == "paused")
+    for state in _STATUS_COLORS
+}
+_DEFAULT_BUTTON_STATE = (False, False, False, True, False)
+
+# Uptime labels for the first minute, shown before uptime rounds to minutes
+_SECOND_STR = [f"{i}s" for i in range(60)]
+
+
+def _uptime_bucket(seconds: int) -> int:
+    """Uptime as displayed: exact for the first minute, then whole minutes."""
+    return seconds if seconds < 60 else seconds - seconds % 60
+
+
+@lru_cache(maxsize=1024)
+def _format_uptime_minutes(minutes: int) -> str:
+    """Format an uptime of at least one minute; cards at the same minute share the string."""
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m"
+
+
+# Badge pixmaps per state, rendered on first use (QPixmap needs a QApplication)
+_BADGE_PIXMAPS: Dict[str, QPixmap] = {}
+
+
+def _badge_pixmap(state: str) -> QPixmap:
+    """Return the status badge pill for a state, rendering it once."""
+    pixmap = _BADGE_PIXMAPS.get(state)
+    if pixmap is not None:
+        return pixmap
+    
+    bg, fg, text = _status_colors(state)
+    metrics = QFontMetrics(_BADGE_FONT)
+    width = metrics.horizontalAdvance(text) + 16
+    height = 20
+    
+    screen = QGuiApplication.primaryScreen()
+    ratio = screen.devicePixelRatio() if screen else 1.0
+    pixmap = QPixmap(int(width * ratio), int(height * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(bg))
+    painter.drawRoundedRect(QRectF(0, 0, width, height), 10, 10)
+    painter.setFont(_BADGE_FONT)
+    painter.setPen(QColor(fg))
+    painter.drawText(QRectF(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    
+    _BADGE_PIXMAPS[state] = pixmap
+    return pixmap
+
+
+class ContainerStatsPanel(QWidget):
+    """Painted 2x2 grid of container stats.
+
+    Draws the captions and values directly instead of holding a frame,
+    a grid layout and eight labels per card.
+    """
+    
+    # (key, caption, value color, row, column)
+    _CELLS = (
+        ("processes", "Processes:", QColor("#0366d6"), 0, 0),
+        ("memory", "Memory:", QColor("#28a745"), 1, 0),
+        ("cpu", "CPU:", QColor("#fd7e14"), 0, 1),
+        ("desktop", "Desktop:", QColor("#6f42c1"), 1, 1),
+    )
+    _BACKGROUND = QColor("#f6f8fa")
+    _BORDER = QColor("#d1d5da")
+    _PADDING = 8
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._values: Dict[str, str] = {key: "" for key, *_rest in self._CELLS}
+        self.setMinimumHeight(60)
+    
+    def set_value(self, key: str, text: str):
+        """Set one stat's text, repainting only if it changed."""
+        if self._values[key] != text:
+            self._values[key] = text
+            self.update()
+    
+    def paintEvent(self, event):
+        """Draw the panel background and the stat cells."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        frame = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(self._BORDER)
+        painter.setBrush(self._BACKGROUND)
+        painter.drawRoundedRect(frame, 6, 6)
+        
+        inner = frame.adjusted(self._PADDING, self._PADDING, -self._PADDING, -self._PADDING)
+        cell_w = inner.width() / 2
+        cell_h = inner.height() / 2
+        caption_w = cell_w * 0.55
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        caption_color = self.palette().color(QPalette.ColorRole.WindowText)
+        
+        for key, caption, color, row, col in self._CELLS:
+            x = inner.left() + col * cell_w
+            y = inner.top() + row * cell_h
+            
+            painter.setFont(self.font())
+            painter.setPen(caption_color)
+            painter.drawText(QRectF(x, y, caption_w, cell_h), align, caption)
+            
+            painter.setFont(_BOLD_FONT)
+            painter.setPen(color)
+            painter.drawText(QRectF(x + caption_w, y, cell_w - caption_w, cell_h), align, self._values[key])
+        
+        painter.end()
 
 
 class ContainerStatusCard(QFrame):
@@ -35,10 +217,11 @@ class ContainerStatusCard(QFrame):
     pause_requested = pyqtSignal(str)  # container_id
     resume_requested = pyqtSignal(str) # container_id
     
-    def __init__(self, container_id: str, container_info: Dict):
+    def __init__(self, container_id: str, container_info: ContainerView):
         super().__init__()
         self.container_id = container_id
         self.container_info = container_info
+        self._reset_display_cache()
         self.setup_ui()
         self.update_info(container_info)
     
@@ -48,21 +231,6 @@ class ContainerStatusCard(QFrame):
         self.setMinimumSize(320, 180)
         self.setMaximumSize(400, 220)
         
-        # Dynamic styling based on state
-        self.setStyleSheet("""
-            ContainerStatusCard {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8f9fa);
-                border: 2px solid #e1e4e8;
-                border-radius: 12px;
-                margin: 8px;
-                padding: 12px;
-            }
-            ContainerStatusCard:hover {
-                border-color: #0366d6;
-                box-shadow: 0 4px 8px rgba(3, 102, 214, 0.1);
-            }
-        """)
         
         layout = QVBoxLayout()
         layout.setSpacing(8)
@@ -72,24 +240,12 @@ class ContainerStatusCard(QFrame):
         header_layout = QHBoxLayout()
         
         self.name_label = QLabel()
-        name_font = QFont()
-        name_font.setBold(True)
-        name_font.setPointSize(14)
-        self.name_label.setFont(name_font)
+        self.name_label.setFont(_NAME_FONT)
         header_layout.addWidget(self.name_label)
         
         header_layout.addStretch()
         
         self.status_badge = QLabel()
-        self.status_badge.setStyleSheet("""
-            QLabel {
-                padding: 4px 8px;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-                text-align: center;
-            }
-        """)
         header_layout.addWidget(self.status_badge)
         
         layout.addLayout(header_layout)
@@ -97,129 +253,41 @@ class ContainerStatusCard(QFrame):
         # Desktop info
         desktop_layout = QHBoxLayout()
         self.desktop_label = QLabel()
-        self.desktop_label.setStyleSheet("color: #586069; font-size: 12px;")
+        self.desktop_label.setObjectName("card-meta")
         desktop_layout.addWidget(self.desktop_label)
         desktop_layout.addStretch()
         
         self.uptime_label = QLabel()
-        self.uptime_label.setStyleSheet("color: #586069; font-size: 12px;")
+        self.uptime_label.setObjectName("card-meta")
         desktop_layout.addWidget(self.uptime_label)
         
         layout.addLayout(desktop_layout)
         
         # Resource stats
-        stats_frame = QFrame()
-        stats_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f6f8fa;
-                border: 1px solid #d1d5da;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
-        stats_layout = QGridLayout()
-        stats_layout.setSpacing(4)
-        
-        # Processes
-        stats_layout.addWidget(QLabel("Processes:"), 0, 0)
-        self.processes_label = QLabel()
-        self.processes_label.setStyleSheet("font-weight: bold; color: #0366d6;")
-        stats_layout.addWidget(self.processes_label, 0, 1)
-        
-        # Memory
-        stats_layout.addWidget(QLabel("Memory:"), 1, 0)
-        self.memory_label = QLabel()
-        self.memory_label.setStyleSheet("font-weight: bold; color: #28a745;")
-        stats_layout.addWidget(self.memory_label, 1, 1)
-        
-        # CPU
-        stats_layout.addWidget(QLabel("CPU:"), 0, 2)
-        self.cpu_label = QLabel()
-        self.cpu_label.setStyleSheet("font-weight: bold; color: #fd7e14;")
-        stats_layout.addWidget(self.cpu_label, 0, 3)
-        
-        # Desktop
-        stats_layout.addWidget(QLabel("Desktop:"), 1, 2)
-        self.desktop_idx_label = QLabel()
-        self.desktop_idx_label.setStyleSheet("font-weight: bold; color: #6f42c1;")
-        stats_layout.addWidget(self.desktop_idx_label, 1, 3)
-        
-        stats_frame.setLayout(stats_layout)
-        layout.addWidget(stats_frame)
+        self.stats_panel = ContainerStatsPanel()
+        layout.addWidget(self.stats_panel)
         
         # Action buttons
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(8)
         
         self.switch_btn = QPushButton("🔄 Switch")
-        self.switch_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0366d6;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #0256cc;
-            }
-        """)
+        self.switch_btn.setObjectName("card-switch-button")
         self.switch_btn.clicked.connect(lambda: self.switch_requested.emit(self.container_id))
         buttons_layout.addWidget(self.switch_btn)
         
         self.pause_btn = QPushButton("⏸️ Pause")
-        self.pause_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffc107;
-                color: #212529;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #e0a800;
-            }
-        """)
+        self.pause_btn.setObjectName("card-pause-button")
         self.pause_btn.clicked.connect(lambda: self.pause_requested.emit(self.container_id))
         buttons_layout.addWidget(self.pause_btn)
         
         self.resume_btn = QPushButton("▶️ Resume")
-        self.resume_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        self.resume_btn.setObjectName("card-resume-button")
         self.resume_btn.clicked.connect(lambda: self.resume_requested.emit(self.container_id))
         buttons_layout.addWidget(self.resume_btn)
         
         self.stop_btn = QPushButton("🛑 Stop")
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
+        self.stop_btn.setObjectName("card-stop-button")
         self.stop_btn.clicked.connect(lambda: self.stop_requested.emit(self.container_id))
         buttons_layout.addWidget(self.stop_btn)
         
@@ -227,80 +295,95 @@ class ContainerStatusCard(QFrame):
         
         self.setLayout(layout)
     
-    def update_info(self, container_info: Dict):
-        """Update container information display."""
+    def update_info(self, container_info: ContainerView):
+        """Update container information display, touching only what changed."""
         self.container_info = container_info
         
-        # Update labels
-        env_name = container_info.get("environment_name", "Unknown")
-        self.name_label.setText(f"🎯 {env_name}")
-        
-        state = container_info.get("state", "unknown")
-        
-        # Update status badge with color
-        status_colors = {
-            "running": ("#28a745", "white", "🟢 RUNNING"),
-            "paused": ("#ffc107", "#212529", "⏸️ PAUSED"),
-            "starting": ("#17a2b8", "white", "🚀 STARTING"),
-            "stopping": ("#fd7e14", "white", "🛑 STOPPING"),
-            "stopped": ("#6c757d", "white", "⭕ STOPPED"),
-            "error": ("#dc3545", "white", "❌ ERROR")
-        }
-        
-        bg_color, text_color, text = status_colors.get(state, ("#6c757d", "white", f"❓ {state.upper()}"))
-        self.status_badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {text_color};
-                padding: 4px 8px;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-            }}
-        """)
-        self.status_badge.setText(text)
+        env_name = container_info.environment_name
+        state = container_info.state
+        desktop_idx = container_info.desktop_index
+        
+        # Between ticks usually only the stats move
+        if (state == self._prev_state and desktop_idx == self._prev_desktop_idx
+                and env_name == self._prev_name):
+            self._update_stats_only(container_info)
+        else:
+            self._update_all(env_name, state, desktop_idx, container_info)
+    
+    def _update_all(self, env_name: str, state: str, desktop_idx: int, stats: ContainerView):
+        """Update the name, badge, buttons and desktop, then the stats."""
+        if env_name != self._prev_name:
+            self._prev_name = env_name
+            self.name_label.setText(f"🎯 {env_name}")
+        
+        # Update status badge and button states only when the state moves
+        if state != self._prev_state:
+            self._prev_state = state
+            self.status_badge.setPixmap(_badge_pixmap(state))
+            
+            can_switch, can_pause, can_resume, can_stop, is_paused = _BUTTON_STATES.get(
+                state, _DEFAULT_BUTTON_STATE
+            )
+            self.switch_btn.setEnabled(can_switch)
+            self.pause_btn.setEnabled(can_pause)
+            self.resume_btn.setEnabled(can_resume)
+            self.stop_btn.setEnabled(can_stop)
+            
+            # Hide resume button if not paused
+            self.resume_btn.setVisible(is_paused)
+            self.pause_btn.setVisible(not is_paused)
         
         # Update desktop info
-        desktop_idx = container_info.get("desktop_index", -1)
-        desktop_name = f"Desktop {desktop_idx}" if desktop_idx > 0 else "Default Desktop"
-        self.desktop_label.setText(f"🖥️ {desktop_name}")
-        
-        # Update uptime
-        uptime = container_info.get("uptime", 0)
-        uptime_str = self.format_uptime(uptime)
-        self.uptime_label.setText(f"⏱️ {uptime_str}")
-        
-        # Update stats
-        stats = container_info.get("stats", {})
-        self.processes_label.setText(str(stats.get("total_processes", 0)))
-        self.memory_label.setText(f"{stats.get('total_memory_mb', 0):.1f} MB")
-        self.cpu_label.setText(f"{stats.get('total_cpu_percent', 0):.1f}%")
-        self.desktop_idx_label.setText(f"#{desktop_idx}" if desktop_idx > 0 else "N/A")
-        
-        # Update button states
-        is_running = state == "running"
-        is_paused = state == "paused"
-        is_stopped = state in ["stopped", "error"]
-        
-        self.switch_btn.setEnabled(is_running)
-        self.pause_btn.setEnabled(is_running)
-        self.resume_btn.setEnabled(is_paused)
-        self.stop_btn.setEnabled(not is_stopped)
-        
-        # Hide resume button if not paused
-        self.resume_btn.setVisible(is_paused)
-        self.pause_btn.setVisible(not is_paused)
+        if desktop_idx != self._prev_desktop_idx:
+            self._prev_desktop_idx = desktop_idx
+            desktop_name = f"Desktop {desktop_idx}" if desktop_idx > 0 else "Default Desktop"
+            self.desktop_label.setText(f"🖥️ {desktop_name}")
+            self.stats_panel.set_value("desktop", f"#{desktop_idx}" if desktop_idx > 0 else "N/A")
+        
+        self._update_stats_only(stats)
+    
+    def _update_stats_only(self, stats: ContainerView):
+        """Update the uptime and resource stats."""
+        # Past the first minute uptime only changes once a minute
+        uptime = stats.uptime_seconds
+        if self._changed("uptime", _uptime_bucket(uptime)):
+            self.uptime_label.setText(f"⏱️ {self.format_uptime(uptime)}")
+        
+        processes = stats.total_processes
+        if self._changed("processes", processes):
+            self.stats_panel.set_value("processes", str(processes))
+        memory_text = f"{stats.total_memory_mb:.1f} MB"
+        if self._changed("memory", memory_text):
+            self.stats_panel.set_value("memory", memory_text)
+        cpu_text = f"{stats.total_cpu_percent:.1f}%"
+        if self._changed("cpu", cpu_text):
+            self.stats_panel.set_value("cpu", cpu_text)
+    
+    def _changed(self, field: str, value) -> bool:
+        """Remember value for field; return True if it differs from what is shown."""
+        if field in self._shown and self._shown[field] == value:
+            return False
+        self._shown[field] = value
+        return True
+    
+    def rebind(self, container_id: str, container_info: ContainerView):
+        """Reuse this card for another container."""
+        self.container_id = container_id
+        self._reset_display_cache()
+        self.update_info(container_info)
+    
+    def _reset_display_cache(self):
+        """Forget what is displayed so the next update_info redraws everything."""
+        self._prev_name: Optional[str] = None
+        self._prev_state: Optional[str] = None
+        self._prev_desktop_idx: Optional[int] = None
+        self._shown: Dict[str, object] = {}
     
     def format_uptime(self, seconds: int) -> str:
         """Format uptime in human readable format."""
         if seconds < 60:
-            return f"{seconds}s"
-        elif seconds < 3600:
-            return f"{seconds // 60}m {seconds % 60}s"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
+            return _SECOND_STR[seconds]
+        return _format_uptime_minutes(seconds // 60)
 
 
 class SystemResourcesWidget(QWidget):
@@ -308,6 +391,8 @@ class SystemResourcesWidget(QWidget):
     
     def __init__(self):
         super().__init__()
+        self._shown: Dict[str, str] = {}
+        self._desktops_key: Optional[tuple] = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -317,10 +402,7 @@ class SystemResourcesWidget(QWidget):
         
         # Header
         header_label = QLabel("🖥️ System Resources")
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(14)
-        header_label.setFont(header_font)
+        header_label.setFont(_HEADER_FONT)
         layout.addWidget(header_label)
         
         # Resource grid
@@ -329,25 +411,25 @@ class SystemResourcesWidget(QWidget):
         # Containers overview
         grid_layout.addWidget(QLabel("Containers:"), 0, 0)
         self.containers_label = QLabel("0 total, 0 running")
-        self.containers_label.setStyleSheet("font-weight: bold; color: #0366d6;")
+        self.containers_label.setObjectName("resource-containers")
         grid_layout.addWidget(self.containers_label, 0, 1)
         
         # Total processes
         grid_layout.addWidget(QLabel("Total Processes:"), 1, 0)
         self.processes_label = QLabel("0")
-        self.processes_label.setStyleSheet("font-weight: bold; color: #28a745;")
+        self.processes_label.setObjectName("resource-processes")
         grid_layout.addWidget(self.processes_label, 1, 1)
         
         # Total memory
         grid_layout.addWidget(QLabel("Total Memory:"), 0, 2)
         self.memory_label = QLabel("0.0 MB")
-        self.memory_label.setStyleSheet("font-weight: bold; color: #fd7e14;")
+        self.memory_label.setObjectName("resource-memory")
         grid_layout.addWidget(self.memory_label, 0, 3)
         
         # Total CPU
         grid_layout.addWidget(QLabel("Total CPU:"), 1, 2)
         self.cpu_label = QLabel("0.0%")
-        self.cpu_label.setStyleSheet("font-weight: bold; color: #dc3545;")
+        self.cpu_label.setObjectName("resource-cpu")
         grid_layout.addWidget(self.cpu_label, 1, 3)
         
         layout.addLayout(grid_layout)
@@ -367,7 +449,7 @@ class SystemResourcesWidget(QWidget):
         
         # Active desktops
         self.desktops_label = QLabel("Active Desktops: None")
-        self.desktops_label.setStyleSheet("color: #586069; font-size: 12px;")
+        self.desktops_label.setObjectName("card-meta")
         layout.addWidget(self.desktops_label)
         
         self.setLayout(layout)
@@ -376,11 +458,11 @@ class SystemResourcesWidget(QWidget):
         """Update system resource display."""
         total_containers = resources.get("total_containers", 0)
         running_containers = resources.get("running_containers", 0)
-        self.containers_label.setText(f"{total_containers} total, {running_containers} running")
+        self._set_text("containers", self.containers_label, f"{total_containers} total, {running_containers} running")
         
-        self.processes_label.setText(str(resources.get("total_processes", 0)))
-        self.memory_label.setText(f"{resources.get('total_memory_mb', 0):.1f} MB")
-        self.cpu_label.setText(f"{resources.get('total_cpu_percent', 0):.1f}%")
+        self._set_text("processes", self.processes_label, str(resources.get("total_processes", 0)))
+        self._set_text("memory", self.memory_label, f"{resources.get('total_memory_mb', 0):.1f} MB")
+        self._set_text("cpu", self.cpu_label, f"{resources.get('total_cpu_percent', 0):.1f}%")
         
         # Update progress bars (assuming 8GB RAM and 100% CPU as max)
         memory_percent = min(resources.get("total_memory_mb", 0) / 8192 * 100, 100)
@@ -389,13 +471,21 @@ class SystemResourcesWidget(QWidget):
         cpu_percent = min(resources.get("total_cpu_percent", 0), 100)
         self.cpu_bar.setValue(int(cpu_percent))
         
-        # Update active desktops
-        active_desktops = resources.get("active_desktops", [])
-        if active_desktops:
-            desktop_str = ", ".join([f"#{d}" for d in sorted(active_desktops)])
-            self.desktops_label.setText(f"Active Desktops: {desktop_str}")
-        else:
-            self.desktops_label.setText("Active Desktops: None")
+        # Update active desktops; the list is only re-sorted and re-joined when it changes
+        desktops_key = tuple(resources.get("active_desktops", ()))
+        if desktops_key != self._desktops_key:
+            self._desktops_key = desktops_key
+            if desktops_key:
+                desktop_str = ", ".join(f"#{d}" for d in sorted(desktops_key))
+                self._set_text("desktops", self.desktops_label, f"Active Desktops: {desktop_str}")
+            else:
+                self._set_text("desktops", self.desktops_label, "Active Desktops: None")
+    
+    def _set_text(self, key: str, label: QLabel, text: str):
+        """Set a label's text unless it already shows it."""
+        if self._shown.get(key) != text:
+            self._shown[key] = text
+            label.setText(text)
 
 
 class MultiEnvironmentDashboard(QWidget):
@@ -410,6 +500,15 @@ class MultiEnvironmentDashboard(QWidget):
     - VM-like management interface
     """
     
+    # Emitted from the background loop; delivered queued on the GUI thread
+    refresh_requested = pyqtSignal()
+    # Asks the poll worker for a container snapshot
+    fetch_requested = pyqtSignal()
+    # Number of containers stopped by "Stop All", or -1 if it failed
+    stop_all_finished = pyqtSignal(int)
+    # Error message when a queue launch raises
+    queue_launch_failed = pyqtSignal(str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -423,10 +522,67 @@ class MultiEnvironmentDashboard(QWidget):
         
         # UI state
         self.container_cards: Dict[str, ContainerStatusCard] = {}
+        self._last_hash: Dict[str, int] = {}
+        self._card_pool: List[ContainerStatusCard] = []
+        # Grid cell each card currently occupies
+        self._card_positions: Dict[str, Tuple[int, int]] = {}
+        
+        # The Resources and Launch Queue tabs are built on first use
+        self._resources_tab_built = False
+        self._queue_tab_built = False
+        self._latest_resources: Optional[Dict] = None
+        self._queue_size = 0
+        
+        # Launch-started entries waiting to be added to the queue list
+        self._pending_queue_items: List[str] = []
+        self._queue_flush_timer = QTimer()
+        self._queue_flush_timer.setSingleShot(True)
+        self._queue_flush_timer.setInterval(50)
+        self._queue_flush_timer.timeout.connect(self._flush_queue_items)
+        
+        # Trailing-edge timer so a run of queue size changes sets the label once
+        self._queue_status_timer = QTimer()
+        self._queue_status_timer.setSingleShot(True)
+        self._queue_status_timer.setInterval(100)
+        self._queue_status_timer.timeout.connect(self._update_queue_status_label)
+        
+        # Notice box shared by the dashboard's warnings and status messages
+        self._info_box = QMessageBox(self)
+        self._info_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        # Notices raised while the box is open, shown in order once it closes
+        self._pending_notices: deque = deque()
+        
+        # Batch launch dialog, built on first use and reused
+        self._batch_dialog: Optional[QDialog] = None
+        # Environments ticked in the batch dialog, keyed by environment id
+        self._checked_envs: Dict[str, Environment] = {}
+        
+        # Saved environments, re-read only when the file changes or settings edit them
+        self._config_manager = ConfigManager()
+        self._env_cache: Optional[List[Environment]] = None
+        self._env_cache_mtime: Optional[float] = None
+        
+        # Full refresh, polled only when a manager signal marked the cards dirty
+        # and the dashboard is visible; paused while a queue launch is running
+        self._refresh_interval_ms = 1000
+        self._dirty = True
         self.refresh_timer = QTimer()
         
+        # One snapshot fetch in flight at a time; requests made meanwhile
+        # collapse into a single follow-up fetch
+        self._fetch_inflight = False
+        self._fetch_again = False
+        
+        # Coalesces bursts of per-container events, e.g. during batch launches
+        self._pending_refresh_ids: Set[str] = set()
+        self._refresh_throttle = QTimer()
+        self._refresh_throttle.setSingleShot(True)
+        self._refresh_throttle.setInterval(150)
+        self._refresh_throttle.timeout.connect(self._on_refresh_throttle_timeout)
+        
         self.setup_ui()
         self.setup_connections()
+        self._setup_poll_worker()
         self.setup_auto_refresh()
         
         # Initial load
@@ -437,6 +593,9 @@ class MultiEnvironmentDashboard(QWidget):
         self.setWindowTitle("🎮 Multi-Environment Dashboard")
         self.setMinimumSize(1200, 800)
         
+        # One stylesheet for the window; container cards match it by class and object name
+        self.setStyleSheet(DASHBOARD_STYLESHEET)
+        
         # Apply EnvStarter icon
         from src.envstarter.utils.icons import apply_icon_to_widget
         apply_icon_to_widget(self)
@@ -456,10 +615,7 @@ class MultiEnvironmentDashboard(QWidget):
         header_layout = QHBoxLayout()
         
         title_label = QLabel("🎮 Multi-Environment Dashboard")
-        title_font = QFont()
-        title_font.setPointSize(20)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_TITLE_FONT)
         header_layout.addWidget(title_label)
         
         header_layout.addStretch()
@@ -471,21 +627,7 @@ class MultiEnvironmentDashboard(QWidget):
         
         self.settings_btn = QPushButton("⚙️ Settings")
         self.settings_btn.clicked.connect(self.show_settings)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0366d6;
-                color: white;
-                border: 2px solid #0366d6;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #0256cc;
-                border-color: #0256cc;
-            }
-        """)
+        self.settings_btn.setObjectName("dashboard-settings-button")
         header_layout.addWidget(self.settings_btn)
         
         self.quick_launch_btn = QPushButton("⚡ Quick Launch")
@@ -513,26 +655,61 @@ class MultiEnvironmentDashboard(QWidget):
         containers_tab = self.create_containers_tab()
         self.tab_widget.addTab(containers_tab, "🎯 Containers")
         
-        # Tab 2: System Resources
-        resources_tab = self.create_resources_tab()
-        self.tab_widget.addTab(resources_tab, "📊 Resources")
+        # Tab 2: System Resources (built on first visit)
+        self._resources_tab = self._create_lazy_tab()
+        self.tab_widget.addTab(self._resources_tab, "📊 Resources")
         
         # Tab 3: Quick Launch
         quick_launch_tab = self.create_quick_launch_tab()
         self.tab_widget.addTab(quick_launch_tab, "⚡ Quick Launch")
         
-        # Tab 4: Launch Queue
-        queue_tab = self.create_queue_tab()
-        self.tab_widget.addTab(queue_tab, "📋 Launch Queue")
+        # Tab 4: Launch Queue (built on first visit)
+        self._queue_tab = self._create_lazy_tab()
+        self.tab_widget.addTab(self._queue_tab, "📋 Launch Queue")
         
         # Tab 5: Batch Operations
         batch_tab = self.create_batch_operations_tab()
         self.tab_widget.addTab(batch_tab, "🚀 Batch Operations")
         
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         main_layout.addWidget(self.tab_widget)
         
         self.setLayout(main_layout)
     
+    def _create_lazy_tab(self) -> QWidget:
+        """Create an empty tab page whose contents are added later."""
+        tab = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        tab.setLayout(layout)
+        return tab
+    
+    def _on_tab_changed(self, index: int):
+        """Build a lazy tab the first time it is shown."""
+        tab = self.tab_widget.widget(index)
+        if tab is self._resources_tab:
+            self._ensure_resources_tab()
+        elif tab is self._queue_tab:
+            self._ensure_queue_tab()
+    
+    def _ensure_resources_tab(self):
+        """Build the Resources tab contents if not done yet."""
+        if self._resources_tab_built:
+            return
+        self._resources_tab_built = True
+        self._resources_tab.layout().addWidget(self.create_resources_tab())
+        if self._latest_resources is not None:
+            self.system_resources.update_resources(self._latest_resources)
+    
+    def _ensure_queue_tab(self):
+        """Build the Launch Queue tab contents if not done yet."""
+        if self._queue_tab_built:
+            return
+        self._queue_tab_built = True
+        self._queue_tab.layout().addWidget(self.create_queue_tab())
+        self._update_queue_status_label()
+        self._flush_queue_items()
+    
     def create_containers_tab(self) -> QWidget:
         """Create the containers overview tab."""
         tab = QWidget()
@@ -553,16 +730,7 @@ class MultiEnvironmentDashboard(QWidget):
         
         # Status area
         self.status_label = QLabel("No containers running")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                border: 1px solid #e1e4e8;
-                border-radius: 6px;
-                padding: 12px;
-                color: #586069;
-                font-size: 14px;
-            }
-        """)
+        self.status_label.setObjectName("dashboard-status")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
         
@@ -578,26 +746,30 @@ class MultiEnvironmentDashboard(QWidget):
         self.system_resources = SystemResourcesWidget()
         layout.addWidget(self.system_resources)
         
-        # Resource history chart (placeholder)
-        chart_label = QLabel("📈 Resource History (Coming Soon)")
-        chart_label.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                border: 2px dashed #d1d5da;
-                border-radius: 8px;
-                padding: 40px;
-                color: #586069;
-                font-size: 16px;
-            }
-        """)
-        chart_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        chart_label.setMinimumHeight(300)
-        layout.addWidget(chart_label)
+        # Resource history chart
+        layout.addWidget(self._make_chart_widget())
         
         layout.addStretch()
         tab.setLayout(layout)
         return tab
     
+    def _make_chart_widget(self) -> QWidget:
+        """Create the resource history chart widget.
+
+        A GPU-drawn chart must not be a QOpenGLWidget embedded in this
+        layout: that switches the whole window to composited rendering and
+        slows every card refresh. Host it as a native window instead,
+        e.g. QWidget.createWindowContainer(QOpenGLWindow()), or in its own
+        top-level window. Card hover/fade effects likewise use QColor alpha,
+        never a partially transparent QGraphicsOpacityEffect.
+        """
+        # Placeholder until the chart exists
+        chart_label = QLabel("📈 Resource History (Coming Soon)")
+        chart_label.setObjectName("chart-placeholder")
+        chart_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        chart_label.setMinimumHeight(300)
+        return chart_label
+    
     def create_queue_tab(self) -> QWidget:
         """Create the launch queue tab."""
         tab = QWidget()
@@ -649,58 +821,202 @@ class MultiEnvironmentDashboard(QWidget):
     
     def setup_connections(self):
         """Set up signal connections."""
+        self.refresh_requested.connect(self.refresh_containers)
+        self.stop_all_finished.connect(self.on_stop_all_finished)
+        self.queue_launch_failed.connect(self.on_queue_launch_failed)
+        
         # Manager signals
         self.manager.container_started.connect(self.on_container_started)
         self.manager.container_stopped.connect(self.on_container_stopped)
         self.manager.container_switched.connect(self.on_container_switched)
         self.manager.resources_updated.connect(self.on_resources_updated)
+        self.manager.container_state_changed.connect(self.on_container_state_changed)
+        self.manager.stats_updated.connect(self.on_container_stats_updated)
         
         # Launcher signals
         self.launcher.queue_updated.connect(self.on_queue_updated)
         self.launcher.launch_started.connect(self.on_launch_started)
         self.launcher.launch_completed.connect(self.on_launch_completed)
+        self.launcher.launch_counts_updated.connect(self.on_launch_counts_updated)
         self.launcher.all_launches_completed.connect(self.on_all_launches_completed)
     
     def setup_auto_refresh(self):
-        """Set up automatic refresh timer."""
-        self.refresh_timer.timeout.connect(self.refresh_containers)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
+        """Set up the refresh timer.
+
+        Cards are kept current by the manager's container signals, which
+        also mark the dashboard dirty; each tick does a full poll only if
+        something is dirty and the dashboard is on screen.
+        """
+        self.refresh_timer.timeout.connect(self._on_refresh_tick)
+        self.refresh_timer.start(self._refresh_interval_ms)
+    
+    def _on_refresh_tick(self):
+        """Poll the containers if anything changed since the last poll."""
+        if not self._dirty or not self.isVisible():
+            return
+        # Cleared before the fetch so changes during it mark the next tick
+        self._dirty = False
+        self._request_fetch()
+    
+    def _request_fetch(self):
+        """Ask the poll worker for a snapshot unless one is already on its way."""
+        if self._fetch_inflight:
+            self._fetch_again = True
+            return
+        self._fetch_inflight = True
+        self.fetch_requested.emit()
+    
+    def _setup_poll_worker(self):
+        """Start the background thread that gathers container snapshots."""
+        self._poll_thread = QThread()
+        self._poll_worker = ContainerStatsWorker(self.manager.get_container_views)
+        self._poll_worker.moveToThread(self._poll_thread)
+        
+        self.fetch_requested.connect(self._poll_worker.fetch, Qt.ConnectionType.QueuedConnection)
+        self._poll_worker.containers_ready.connect(
+            self.on_containers_polled, Qt.ConnectionType.QueuedConnection
+        )
+        self._poll_worker.fetch_failed.connect(
+            self.on_poll_failed, Qt.ConnectionType.QueuedConnection
+        )
+        
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._stop_poll_worker)
+        
+        self._poll_thread.start()
+    
+    def _stop_poll_worker(self):
+        """Stop the poll worker thread."""
+        if self._poll_thread.isRunning():
+            self._poll_thread.quit()
+            self._poll_thread.wait()
+    
+    def on_containers_polled(self, containers: Dict[str, ContainerView]):
+        """Apply a container snapshot gathered off the GUI thread."""
+        self._fetch_inflight = False
+        total_count, running_count = self.update_container_cards(containers)
+        self._update_status_label(total_count, running_count)
+        
+        if self._fetch_again:
+            self._fetch_again = False
+            self._request_fetch()
+    
+    def on_poll_failed(self):
+        """Keep the current cards and retry the failed poll on the next tick."""
+        self._fetch_inflight = False
+        self._dirty = True
+        
+        if self._fetch_again:
+            self._fetch_again = False
+            self._request_fetch()
     
     def refresh_containers(self):
-        """Refresh container display."""
+        """Refresh container display from a snapshot gathered off the GUI thread."""
+        self._dirty = False
+        self._request_fetch()
+    
+    def refresh_container(self, container_id: str):
+        """Refresh the card for a single container.
+
+        The first event refreshes at once; events arriving within the
+        following window are coalesced into one refresh at its end.
+        """
+        self._pending_refresh_ids.add(container_id)
+        if not self._refresh_throttle.isActive():
+            self._flush_container_refreshes()
+            self._refresh_throttle.start()
+    
+    def _on_refresh_throttle_timeout(self):
+        """Apply refreshes that arrived during the throttle window."""
+        if self._pending_refresh_ids:
+            self._flush_container_refreshes()
+            self._refresh_throttle.start()
+    
+    def _flush_container_refreshes(self):
+        """Refresh the cards of all pending containers at once."""
+        pending = self._pending_refresh_ids
+        self._pending_refresh_ids = set()
+        
+        containers = self.manager.get_containers()
+        if any((cid in containers) != (cid in self.container_cards) for cid in pending):
+            # Cards come or go: one diff over a full snapshot from the poll worker
+            self._request_fetch()
+            return
+        
+        for container_id in pending:
+            if container_id in containers:
+                self._upsert_card(container_id, containers[container_id].get_container_view())
+        self._update_status_label()
+    
+    def _update_status_label(self, total_count: Optional[int] = None, running_count: Optional[int] = None):
+        """Show the container totals in the status label, counting them if not given."""
+        if total_count is None:
+            # A locked copy; the loop thread adds and removes containers
+            containers = self.manager.get_containers()
+            total_count = len(containers)
+            running_count = sum(1 for c in containers.values() if c.state == EnvironmentState.RUNNING)
+        if total_count:
+            self.status_label.setText(f"💼 {total_count} containers total, {running_count} running")
+        else:
+            self.status_label.setText("No containers running")
+    
+    def update_container_cards(self, containers: Dict[str, ContainerView]) -> Tuple[int, int]:
+        """Update container status cards; return the (total, running) container counts."""
+        removed = [cid for cid in self.container_cards if cid not in containers]
+        added = [cid for cid in containers if cid not in self.container_cards]
+        running_count = 0
+        
+        if not removed and not added:
+            # Same set of cards: just refresh the ones whose info changed
+            for container_id, container_info in containers.items():
+                self._upsert_card(container_id, container_info)
+                running_count += container_info.state == "running"
+            return len(containers), running_count
+        
+        # Batch the changes: one layout pass and repaint instead of one per card
+        surplus_cards = []
+        self.containers_widget.setUpdatesEnabled(False)
+        self.containers_layout.setEnabled(False)
         try:
-            containers = self.manager.get_all_containers()
-            self.update_container_cards(containers)
+            # Remove cards for containers that no longer exist, keeping spares
+            for container_id in removed:
+                card = self._remove_card(container_id)
+                if len(self._card_pool) < _CARD_POOL_LIMIT:
+                    self._card_pool.append(card)
+                else:
+                    surplus_cards.append(card)
             
-            # Update status
-            if containers:
-                running_count = len([c for c in containers.values() if c["state"] == "running"])
-                total_count = len(containers)
-                self.status_label.setText(f"💼 {total_count} containers total, {running_count} running")
-            else:
-                self.status_label.setText("No containers running")
-                
-        except Exception as e:
-            print(f"Error refreshing containers: {e}")
-    
-    def update_container_cards(self, containers: Dict[str, Dict]):
-        """Update container status cards."""
-        # Remove cards for containers that no longer exist
-        for container_id in list(self.container_cards.keys()):
-            if container_id not in containers:
-                card = self.container_cards[container_id]
-                self.containers_layout.removeWidget(card)
-                card.deleteLater()
-                del self.container_cards[container_id]
-        
-        # Update or create cards for existing containers
-        row, col = 0, 0
-        max_cols = 3  # 3 cards per row
+            # Update or create cards for existing containers
+            for container_id, container_info in containers.items():
+                self._upsert_card(container_id, container_info)
+                running_count += container_info.state == "running"
+            
+            self._relayout_cards()
+        finally:
+            self.containers_layout.setEnabled(True)
+            self.containers_widget.setUpdatesEnabled(True)
+            self.containers_widget.updateGeometry()
         
-        for container_id, container_info in containers.items():
-            if container_id in self.container_cards:
-                # Update existing card
+        # Dispose of cards the pool has no room for once the layout is settled
+        for card in surplus_cards:
+            card.deleteLater()
+        
+        return len(containers), running_count
+    
+    def _upsert_card(self, container_id: str, container_info: ContainerView):
+        """Update a container's card, creating it if needed."""
+        info_hash = self._container_hash(container_info)
+        if container_id in self.container_cards:
+            # Update existing card, skipping it entirely when nothing changed
+            if info_hash != self._last_hash.get(container_id):
                 self.container_cards[container_id].update_info(container_info)
+        else:
+            if self._card_pool:
+                # Recycle a spare card; its signals already carry its current id
+                card = self._card_pool.pop()
+                card.rebind(container_id, container_info)
+                card.show()
             else:
                 # Create new card
                 card = ContainerStatusCard(container_id, container_info)
@@ -710,112 +1026,165 @@ class MultiEnvironmentDashboard(QWidget):
                 card.stop_requested.connect(self.stop_container)
                 card.pause_requested.connect(self.pause_container)
                 card.resume_requested.connect(self.resume_container)
-                
-                self.container_cards[container_id] = card
             
-            # Position the card
-            self.containers_layout.addWidget(self.container_cards[container_id], row, col)
+            self.container_cards[container_id] = card
+        
+        self._last_hash[container_id] = info_hash
+    
+    def _remove_card(self, container_id: str) -> ContainerStatusCard:
+        """Take a container's card out of the grid and return it."""
+        card = self.container_cards.pop(container_id)
+        self._last_hash.pop(container_id, None)
+        self._card_positions.pop(container_id, None)
+        self.containers_layout.removeWidget(card)
+        card.hide()
+        return card
+    
+    def _relayout_cards(self):
+        """Position the cards in the grid, moving only those whose cell changed.
+
+        Runs only when cards come or go. The manager caps the number of
+        containers, so the grid holds a handful of pooled card widgets;
+        a model/view list with a painting delegate would not pay off here.
+        """
+        row, col = 0, 0
+        max_cols = 3  # 3 cards per row
+        
+        for container_id, card in self.container_cards.items():
+            previous = self._card_positions.get(container_id)
+            if previous != (row, col):
+                if previous is not None:
+                    self.containers_layout.removeWidget(card)
+                self.containers_layout.addWidget(card, row, col)
+                self._card_positions[container_id] = (row, col)
             
             col += 1
             if col >= max_cols:
                 col = 0
                 row += 1
     
+    @staticmethod
+    def _container_hash(container_info: ContainerView) -> int:
+        """Hash the container fields a status card displays."""
+        return hash((
+            container_info.environment_name,
+            container_info.state,
+            container_info.total_processes,
+            round(container_info.total_memory_mb, 1),
+            round(container_info.total_cpu_percent, 1),
+            container_info.desktop_index,
+            _uptime_bucket(container_info.uptime_seconds),
+        ))
+    
+    def _show(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a modal notice, reusing the dashboard's message box."""
+        self._pending_notices.append((icon, title, text))
+        if self._info_box.isVisible():
+            # Another notice is still open; the outer call shows this one next
+            return
+        while self._pending_notices:
+            icon, title, text = self._pending_notices.popleft()
+            self._info_box.setIcon(icon)
+            self._info_box.setWindowTitle(title)
+            self._info_box.setText(text)
+            self._info_box.exec()
+    
+    def _confirm(self, title: str, text: str, on_yes):
+        """Ask a Yes/No question without blocking; call on_yes if confirmed."""
+        box = QMessageBox(
+            QMessageBox.Icon.Question, title, text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(partial(self._on_confirm_finished, box, on_yes))
+        box.open()
+    
+    @staticmethod
+    def _on_confirm_finished(box: QMessageBox, on_yes, _result: int):
+        """Run a confirmed action once its question box closes."""
+        if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes:
+            on_yes()
+    
+    def _submit(self, coro):
+        """Schedule a coroutine on the controller's background event loop.
+
+        Sharing that loop keeps every action on the manager on one thread.
+        """
+        return submit_on_controller_loop(coro)
+    
     def switch_to_container(self, container_id: str):
         """Switch to a container."""
-        print(f"🔄 Switching to container: {container_id}")
-        
-        def switch_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(self.manager.switch_to_container(container_id))
-            loop.close()
-            return success
-        
-        # Run in thread to avoid blocking UI
-        thread = threading.Thread(target=switch_async)
-        thread.daemon = True
-        thread.start()
+        logger.info("🔄 Switching to container: %s", container_id)
+        self._submit(self.manager.switch_to_container(container_id))
     
     def stop_container(self, container_id: str):
-        """Stop a container."""
-        reply = QMessageBox.question(
-            self, "Stop Container", 
-            f"Stop container '{container_id}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        """Stop a container once the user confirms."""
+        self._confirm(
+            "Stop Container", f"Stop container '{container_id}'?",
+            partial(self._do_stop_container, container_id)
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            print(f"🛑 Stopping container: {container_id}")
-            
-            def stop_async():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(self.manager.stop_environment_container(container_id))
-                loop.close()
-                return success
-            
-            thread = threading.Thread(target=stop_async)
-            thread.daemon = True
-            thread.start()
+    
+    def _do_stop_container(self, container_id: str):
+        """Stop a container on the background loop."""
+        logger.info("🛑 Stopping container: %s", container_id)
+        self._submit(self.manager.stop_environment_container(container_id))
     
     def pause_container(self, container_id: str):
         """Pause a container."""
-        def pause_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(self.manager.pause_container(container_id))
-            loop.close()
-            return success
-        
-        thread = threading.Thread(target=pause_async)
-        thread.daemon = True
-        thread.start()
+        self._submit(self.manager.pause_container(container_id))
     
     def resume_container(self, container_id: str):
         """Resume a container."""
-        def resume_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(self.manager.resume_container(container_id))
-            loop.close()
-            return success
-        
-        thread = threading.Thread(target=resume_async)
-        thread.daemon = True
-        thread.start()
+        self._submit(self.manager.resume_container(container_id))
     
     def stop_all_containers(self):
-        """Stop all containers."""
-        containers = self.manager.get_all_containers()
+        """Stop all containers once the user confirms."""
+        count = len(self.manager.get_containers())
         
-        if not containers:
+        if not count:
             return
         
-        reply = QMessageBox.question(
-            self, "Stop All Containers", 
-            f"Stop all {len(containers)} containers?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        self._confirm(
+            "Stop All Containers", f"Stop all {count} containers?",
+            partial(self._do_stop_all_containers, count)
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            print("🛑 Stopping all containers...")
-            
-            def stop_all_async():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                count = loop.run_until_complete(self.manager.stop_all_containers())
-                loop.close()
-                print(f"✅ Stopped {count} containers")
-            
-            thread = threading.Thread(target=stop_all_async)
-            thread.daemon = True
-            thread.start()
+    
+    def _do_stop_all_containers(self, count: int):
+        """Stop every container on the background loop."""
+        logger.info("🛑 Stopping all containers...")
+        self.status_label.setText(f"🛑 Stopping {count} containers...")
+        
+        # The manager stops them concurrently; report back on the GUI thread
+        future = self._submit(self.manager.stop_all_containers())
+        future.add_done_callback(self._emit_stop_all_finished)
+    
+    def _emit_stop_all_finished(self, future):
+        """Forward the "Stop All" result from the background loop thread."""
+        try:
+            count = future.result()
+        except Exception as e:
+            logger.error("❌ Stop all error: %s", e)
+            count = -1
+        self.stop_all_finished.emit(count)
+    
+    def on_stop_all_finished(self, count: int):
+        """Handle "Stop All" completing."""
+        if count < 0:
+            self.status_label.setText("❌ Failed to stop all containers")
+            return
+        logger.info("✅ Stopped %s containers", count)
+        self.refresh_containers()
     
     def show_batch_launch_dialog(self):
         """Show dialog for batch launching environments."""
-        from src.envstarter.core.storage import ConfigManager
-        
+        if self._batch_dialog is None:
+            self._batch_dialog = self._create_batch_dialog()
+        self._populate_batch_dialog()
+        # Non-blocking; the launch happens in _on_batch_dialog_finished
+        self._batch_dialog.open()
+    
+    def _create_batch_dialog(self) -> QDialog:
+        """Build the batch launch dialog once; its environment list is refilled per show."""
         dialog = QDialog(self)
         dialog.setWindowTitle("🚀 Batch Launch Environments")
         dialog.setMinimumSize(500, 400)
@@ -826,20 +1195,13 @@ class MultiEnvironmentDashboard(QWidget):
         instructions = QLabel("Select environments to launch simultaneously:")
         layout.addWidget(instructions)
         
-        # Environment checkboxes
-        config_manager = ConfigManager()
-        environments = config_manager.get_environments()
+        # Environment list with a check box per item
+        self._batch_env_list = QListWidget()
+        self._batch_env_list.itemChanged.connect(self._on_batch_item_changed)
+        layout.addWidget(self._batch_env_list)
         
-        self.env_checkboxes = {}
-        
-        for env in environments:
-            checkbox = QCheckBox(f"{env.name} ({len(env.applications)} apps, {len(env.websites)} sites)")
-            self.env_checkboxes[env.name] = (checkbox, env)
-            layout.addWidget(checkbox)
-        
-        if not environments:
-            no_envs_label = QLabel("No environments available. Create some environments first!")
-            layout.addWidget(no_envs_label)
+        self._batch_no_envs_label = QLabel("No environments available. Create some environments first!")
+        layout.addWidget(self._batch_no_envs_label)
         
         # Launch mode selection
         mode_layout = QHBoxLayout()
@@ -854,7 +1216,7 @@ class MultiEnvironmentDashboard(QWidget):
         button_layout = QHBoxLayout()
         
         launch_btn = QPushButton("🚀 Launch Selected")
-        launch_btn.clicked.connect(lambda: self.batch_launch_selected(dialog, mode_combo.currentText()))
+        launch_btn.clicked.connect(partial(self._on_batch_launch_clicked, dialog, mode_combo))
         button_layout.addWidget(launch_btn)
         
         cancel_btn = QPushButton("❌ Cancel")
@@ -864,30 +1226,79 @@ class MultiEnvironmentDashboard(QWidget):
         layout.addLayout(button_layout)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        dialog.finished.connect(partial(self._on_batch_dialog_finished, dialog, mode_combo))
+        return dialog
+    
+    def _get_environments(self) -> List[Environment]:
+        """Return the saved environments, reloading them only if the file changed."""
+        try:
+            mtime = self._config_manager.environments_file.stat().st_mtime
+        except OSError:
+            mtime = None
+        
+        if self._env_cache is None or mtime != self._env_cache_mtime:
+            self._env_cache = self._config_manager.get_environments()
+            self._env_cache_mtime = mtime
+        return self._env_cache
+    
+    def _invalidate_env_cache(self):
+        """Force the next _get_environments call to reload from disk."""
+        self._env_cache = None
+    
+    def _populate_batch_dialog(self):
+        """Refill the batch launch dialog's environment list."""
+        environments = self._get_environments()
+        
+        self._batch_env_list.clear()
+        self._checked_envs.clear()
+        for env in environments:
+            item = QListWidgetItem(f"{env.name} ({len(env.applications)} apps, {len(env.websites)} sites)")
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            item.setData(Qt.ItemDataRole.UserRole, env)
+            self._batch_env_list.addItem(item)
+        
+        self._batch_env_list.setVisible(bool(environments))
+        self._batch_no_envs_label.setVisible(not environments)
+    
+    def _on_batch_item_changed(self, item: QListWidgetItem):
+        """Keep the checked-environment set in step with the batch dialog's check boxes."""
+        env = item.data(Qt.ItemDataRole.UserRole)
+        if env is None:
+            return
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked_envs[env.id] = env
+        else:
+            self._checked_envs.pop(env.id, None)
+    
+    def _on_batch_launch_clicked(self, dialog: QDialog, mode_combo: QComboBox, _checked: bool = False):
+        """Handle the batch dialog's launch button."""
+        if not self._checked_envs:
+            self._show(QMessageBox.Icon.Warning, "No Selection", "Please select at least one environment to launch.")
+            return
+        dialog.accept()
+    
+    def _on_batch_dialog_finished(self, dialog: QDialog, mode_combo: QComboBox, result: int):
+        """Launch the checked environments once the batch dialog is accepted."""
+        if result == QDialog.DialogCode.Accepted:
+            self.batch_launch_selected(dialog, mode_combo.currentText())
     
     def batch_launch_selected(self, dialog, mode_str: str):
         """Launch selected environments as isolated VMs."""
-        selected_envs = []
-        
-        for checkbox, env in self.env_checkboxes.values():
-            if checkbox.isChecked():
-                selected_envs.append(env)
+        selected_envs = list(self._checked_envs.values())
         
         if not selected_envs:
-            QMessageBox.warning(self, "No Selection", "Please select at least one environment to launch.")
+            self._show(QMessageBox.Icon.Warning, "No Selection", "Please select at least one environment to launch.")
             return
         
-        dialog.accept()
-        
-        print(f"💻 Launching {len(selected_envs)} environments as isolated VMs")
+        logger.info("💻 Launching %s environments as isolated VMs", len(selected_envs))
         
         # Launch environments as VM containers
         self.launch_environments(selected_envs)
         
         # Show success message
-        QMessageBox.information(
-            self, "VM Launch Started", 
+        self._show(
+            QMessageBox.Icon.Information, "VM Launch Started",
             f"🚀 Started creating {len(selected_envs)} VM environments!\n\n"
             "Each environment will run on its own virtual desktop.\n"
             "You can switch between them like switching VMs."
@@ -896,33 +1307,37 @@ class MultiEnvironmentDashboard(QWidget):
     def launch_queue(self):
         """Launch all items in the queue."""
         if self.launcher.is_launching:
-            QMessageBox.warning(self, "Launch In Progress", "A launch is already in progress.")
+            self._show(QMessageBox.Icon.Warning, "Launch In Progress", "A launch is already in progress.")
             return
         
-        mode_str = self.launch_mode_combo.currentText()
-        mode_map = {
-            "Concurrent": LaunchMode.CONCURRENT,
-            "Sequential": LaunchMode.SEQUENTIAL, 
-            "Batched": LaunchMode.BATCHED,
-            "Staggered": LaunchMode.STAGGERED
-        }
+        if not self.launcher.launch_queue:
+            self._show(QMessageBox.Icon.Information, "Queue Empty", "There are no environments in the launch queue.")
+            return
         
-        launch_mode = mode_map.get(mode_str, LaunchMode.CONCURRENT)
+        mode_str = self.launch_mode_combo.currentText()
+        launch_mode = _MODE_MAP.get(mode_str, _LM_CONCURRENT)
         
         # Update launcher settings
         self.launcher.max_concurrent_launches = self.max_concurrent_spin.value()
         
-        # Start launch in thread
-        self.launch_thread = LaunchThread(self.launcher, launch_mode)
-        self.launch_thread.finished_signal.connect(self.on_launch_thread_finished)
-        self.launch_thread.error_signal.connect(self.on_launch_thread_error)
-        self.launch_thread.start()
+        # Sized before submitting; the loop thread drains the queue as it launches
+        total = len(self.launcher.launch_queue)
+        
+        # Run the launch on the background loop; results arrive through
+        # the launcher's all_launches_completed signal
+        future = self._submit(self.launcher.launch_all_queued(launch_mode))
+        future.add_done_callback(self._emit_queue_launch_failed)
+        
+        # The launch ends with its own refresh in on_all_launches_completed
+        self.refresh_timer.stop()
         
         # Show progress
+        self.queue_progress.setRange(0, total)
+        self.queue_progress.setValue(0)
         self.queue_progress.setVisible(True)
         self.launch_queue_btn.setEnabled(False)
         
-        print(f"🚀 Starting queue launch with mode: {launch_mode.value}")
+        logger.info("🚀 Starting queue launch with mode: %s", launch_mode.value)
     
     def clear_queue(self):
         """Clear the launch queue."""
@@ -931,61 +1346,106 @@ class MultiEnvironmentDashboard(QWidget):
     
     def on_container_started(self, container_id: str):
         """Handle container started event."""
-        print(f"✅ Container started: {container_id}")
-        self.refresh_containers()
+        logger.debug("✅ Container started: %s", container_id)
+        self._dirty = True
+        if not self.launcher.is_launching:
+            self.refresh_container(container_id)
     
     def on_container_stopped(self, container_id: str):
         """Handle container stopped event."""
-        print(f"🛑 Container stopped: {container_id}")
-        self.refresh_containers()
+        logger.debug("🛑 Container stopped: %s", container_id)
+        self._dirty = True
+        if not self.launcher.is_launching:
+            self.refresh_container(container_id)
     
     def on_container_switched(self, container_id: str):
         """Handle container switched event."""
-        print(f"🔄 Switched to container: {container_id}")
+        logger.debug("🔄 Switched to container: %s", container_id)
+        self._dirty = True
+        self.refresh_container(container_id)
+    
+    def on_container_state_changed(self, container_id: str, state: str):
+        """Handle a container state change."""
+        self.refresh_container(container_id)
+    
+    def on_container_stats_updated(self, container_id: str, stats: Dict):
+        """Handle fresh stats for a container."""
+        self.refresh_container(container_id)
     
     def on_resources_updated(self, resources: Dict):
         """Handle system resources update."""
-        self.system_resources.update_resources(resources)
+        self._dirty = True
+        self._latest_resources = resources
+        if self._resources_tab_built:
+            self.system_resources.update_resources(resources)
     
     def on_queue_updated(self, queue_size: int):
         """Handle queue update."""
-        self.queue_status_label.setText(f"Queue: {queue_size} items")
+        self._queue_size = queue_size
+        if self._queue_tab_built and not self._queue_status_timer.isActive():
+            self._queue_status_timer.start()
+    
+    def _update_queue_status_label(self):
+        """Show the latest queue size."""
+        self.queue_status_label.setText(f"Queue: {self._queue_size} items")
     
     def on_launch_started(self, container_id: str, environment_name: str):
         """Handle launch started."""
-        item = QListWidgetItem(f"🚀 Launching: {environment_name}")
-        self.queue_list.addItem(item)
+        self._pending_queue_items.append(f"🚀 Launching: {environment_name}")
+        if not self._queue_flush_timer.isActive():
+            self._queue_flush_timer.start()
+    
+    def _flush_queue_items(self):
+        """Add the launches started since the last flush to the queue list in one go."""
+        if not self._queue_tab_built:
+            # Keep buffering; the tab adds these when it is first shown
+            return
+        self.queue_list.setUpdatesEnabled(False)
+        try:
+            self.queue_list.addItems(self._pending_queue_items)
+        finally:
+            self.queue_list.setUpdatesEnabled(True)
+        self._pending_queue_items.clear()
     
     def on_launch_completed(self, container_id: str, success: bool):
         """Handle launch completed."""
         status = "✅" if success else "❌"
-        # Update the list item if needed
+        logger.info("%s Launch completed: %s", status, container_id)
         
-    def on_all_launches_completed(self, results: List[Dict]):
+    def on_launch_counts_updated(self, successful: int, completed: int):
+        """Advance the queue progress bar as launches finish."""
+        if self._queue_tab_built:
+            self.queue_progress.setValue(completed)
+    
+    def on_all_launches_completed(self, successful: int, total: int):
         """Handle all launches completed."""
-        self.queue_progress.setVisible(False)
-        self.launch_queue_btn.setEnabled(True)
-        
-        successful = len([r for r in results if r["success"]])
-        total = len(results)
-        
-        QMessageBox.information(
-            self, "Launch Complete",
-            f"Batch launch completed!\n{successful}/{total} environments started successfully."
-        )
+        if self._queue_tab_built:
+            self.queue_progress.setVisible(False)
+            self.launch_queue_btn.setEnabled(True)
         
+        # Request the refresh first; the snapshot lands even while the box is open
         self.refresh_containers()
+        self.refresh_timer.start(self._refresh_interval_ms)
+        
+        message = f"Batch launch completed!\n{successful}/{total} environments started successfully."
+        QTimer.singleShot(0, partial(self._show, QMessageBox.Icon.Information, "Launch Complete", message))
     
-    def on_launch_thread_finished(self, results: List[Dict]):
-        """Handle launch thread finished."""
-        self.on_all_launches_completed(results)
+    def _emit_queue_launch_failed(self, future):
+        """Forward a queue launch error from the background loop thread."""
+        if future.cancelled():
+            self.queue_launch_failed.emit("launch was cancelled")
+            return
+        error = future.exception()
+        if error is not None:
+            self.queue_launch_failed.emit(str(error))
     
-    def on_launch_thread_error(self, error_message: str):
-        """Handle launch thread error."""
+    def on_queue_launch_failed(self, error_message: str):
+        """Handle a queue launch error."""
         self.queue_progress.setVisible(False)
         self.launch_queue_btn.setEnabled(True)
+        self.refresh_timer.start(self._refresh_interval_ms)
         
-        QMessageBox.critical(self, "Launch Error", f"Launch failed: {error_message}")
+        self._show(QMessageBox.Icon.Critical, "Launch Error", f"Launch failed: {error_message}")
     
     def create_quick_launch_tab(self) -> QWidget:
         """Create the quick launch tab with all environments."""
@@ -1127,16 +1587,11 @@ class MultiEnvironmentDashboard(QWidget):
     
     def load_quick_launch_environments(self):
         """Load environments into quick launch list."""
-        from src.envstarter.core.enhanced_app_controller import EnhancedAppController
-        from src.envstarter.core.storage import ConfigManager
-        
-        config_manager = ConfigManager()
-        environments = config_manager.get_environments()
+        environments = self._get_environments()
         
         self.quick_launch_list.clear()
         
         for env in environments:
-            from PyQt6.QtCore import Qt
             item = QListWidgetItem(f"🎯 {env.name}")
             item.setData(Qt.ItemDataRole.UserRole, env)
             item.setCheckState(Qt.CheckState.Unchecked)
@@ -1171,7 +1626,7 @@ class MultiEnvironmentDashboard(QWidget):
                 selected_envs.append(env)
         
         if not selected_envs:
-            QMessageBox.warning(self, "No Selection", "Please select environments to launch.")
+            self._show(QMessageBox.Icon.Warning, "No Selection", "Please select environments to launch.")
             return
         
         # Launch selected environments
@@ -1192,13 +1647,10 @@ class MultiEnvironmentDashboard(QWidget):
     
     def launch_all_environments(self):
         """Launch all available environments."""
-        from src.envstarter.core.storage import ConfigManager
-        
-        config_manager = ConfigManager()
-        environments = config_manager.get_environments()
+        environments = self._get_environments()
         
         if not environments:
-            QMessageBox.warning(self, "No Environments", "No environments available to launch.")
+            self._show(QMessageBox.Icon.Warning, "No Environments", "No environments available to launch.")
             return
         
         reply = QMessageBox.question(
@@ -1212,7 +1664,7 @@ class MultiEnvironmentDashboard(QWidget):
     
     def launch_environments(self, environments: List):
         """Launch multiple environments as isolated VM-like containers."""
-        print(f"💻 Launching {len(environments)} environments as isolated VMs")
+        logger.info("💻 Launching %s environments as isolated VMs", len(environments))
         
         # Import VM manager
         from src.envstarter.core.vm_environment_manager import get_vm_environment_manager
@@ -1229,13 +1681,13 @@ class MultiEnvironmentDashboard(QWidget):
             
             for i, env in enumerate(environments):
                 try:
-                    print(f"💻 Creating VM environment {i+1}/{len(environments)}: {env.name}")
+                    logger.debug("💻 Creating VM environment %s/%s: %s", i + 1, len(environments), env.name)
                     
                     # Create VM environment with complete isolation
                     vm_env = await vm_manager.create_vm_environment(env)
                     
                     if vm_env:
-                        print(f"✅ VM environment created: {env.name} (Desktop: {vm_env.desktop_id})")
+                        logger.debug("✅ VM environment created: %s (Desktop: %s)", env.name, vm_env.desktop_id)
                         successful_launches += 1
                         
                         # Emit container started signal for UI updates
@@ -1245,48 +1697,26 @@ class MultiEnvironmentDashboard(QWidget):
                         if len(environments) > 1 and i < len(environments) - 1:
                             await asyncio.sleep(delay_ms / 1000.0)
                     else:
-                        print(f"❌ Failed to create VM environment: {env.name}")
+                        logger.warning("❌ Failed to create VM environment: %s", env.name)
                         
                 except Exception as e:
-                    print(f"❌ Error creating VM environment {env.name}: {e}")
+                    logger.error("❌ Error creating VM environment %s: %s", env.name, e)
             
-            print(f"✅ VM launch completed: {successful_launches}/{len(environments)} environments created")
+            logger.info("✅ VM launch completed: %s/%s environments created", successful_launches, len(environments))
             
-            # Refresh containers display
-            self.refresh_containers()
-        
-        # Run in thread to avoid blocking UI
-        def run_vm_launch():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(launch_vm_environments())
-            finally:
-                loop.close()
-        
-        # Start VM launch thread
-        import threading
-        launch_thread = threading.Thread(target=run_vm_launch)
-        launch_thread.daemon = True
-        launch_thread.start()
-            
-            # Update UI
-            QMessageBox.information(
-                self, "Launch Started",
-                f"Started launching {len(environments)} environments in {mode.value} mode."
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Launch Error", f"Failed to start launch: {str(e)}")
-            print(f"❌ Launch error: {e}")
+            # Refresh containers display on the GUI thread
+            self.refresh_requested.emit()
+        
+        # Run on the background loop to avoid blocking UI
+        self._submit(launch_vm_environments())
     
     def pause_all_containers(self):
         """Pause all running containers."""
-        containers = self.manager.get_all_containers()
-        running = [cid for cid, info in containers.items() if info["state"] == "running"]
+        containers = self.manager.get_container_views()
+        running = [cid for cid, view in containers.items() if view.state == "running"]
         
         if not running:
-            QMessageBox.information(self, "No Containers", "No running containers to pause.")
+            self._show(QMessageBox.Icon.Information, "No Containers", "No running containers to pause.")
             return
         
         reply = QMessageBox.question(
@@ -1297,21 +1727,18 @@ class MultiEnvironmentDashboard(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             for container_id in running:
-                try:
-                    asyncio.create_task(self.manager.pause_container(container_id))
-                except Exception as e:
-                    print(f"Failed to pause container {container_id}: {e}")
+                self._submit(self.manager.pause_container(container_id))
             
-            QMessageBox.information(self, "Containers Paused", f"Paused {len(running)} containers.")
+            self._show(QMessageBox.Icon.Information, "Containers Paused", f"Paused {len(running)} containers.")
             QTimer.singleShot(2000, self.refresh_containers)
     
     def resume_all_containers(self):
         """Resume all paused containers."""
-        containers = self.manager.get_all_containers()
-        paused = [cid for cid, info in containers.items() if info["state"] == "paused"]
+        containers = self.manager.get_container_views()
+        paused = [cid for cid, view in containers.items() if view.state == "paused"]
         
         if not paused:
-            QMessageBox.information(self, "No Containers", "No paused containers to resume.")
+            self._show(QMessageBox.Icon.Information, "No Containers", "No paused containers to resume.")
             return
         
         reply = QMessageBox.question(
@@ -1322,21 +1749,9 @@ class MultiEnvironmentDashboard(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             for container_id in paused:
-                try:
-                    def resume_async():
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(self.manager.resume_container(container_id))
-                        finally:
-                            loop.close()
-                    
-                    thread = threading.Thread(target=resume_async, daemon=True)
-                    thread.start()
-                except Exception as e:
-                    print(f"Failed to resume container {container_id}: {e}")
+                self._submit(self.manager.resume_container(container_id))
             
-            QMessageBox.information(self, "Containers Resumed", f"Resumed {len(paused)} containers.")
+            self._show(QMessageBox.Icon.Information, "Containers Resumed", f"Resumed {len(paused)} containers.")
             QTimer.singleShot(2000, self.refresh_containers)
     
     def show_settings(self):
@@ -1344,7 +1759,6 @@ class MultiEnvironmentDashboard(QWidget):
         try:
             from src.envstarter.gui.enhanced_settings_dialog import EnhancedSettingsDialog
             from src.envstarter.core.enhanced_app_controller import EnhancedAppController
-            from src.envstarter.core.storage import ConfigManager
             
             # Create a temporary controller for settings if needed
             if not hasattr(self, 'controller'):
@@ -1360,11 +1774,11 @@ class MultiEnvironmentDashboard(QWidget):
             self.settings_dialog.activateWindow()
             
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Settings Error", f"Failed to open settings: {str(e)}")
+            self._show(QMessageBox.Icon.Warning, "Settings Error", f"Failed to open settings: {str(e)}")
     
     def on_environments_changed(self):
         """Handle environment changes."""
+        self._invalidate_env_cache()
         # Refresh the quick launch list and containers
         if hasattr(self, 'quick_launch_list'):
             self.load_quick_launch_environments()
@@ -1380,20 +1794,18 @@ class MultiEnvironmentDashboard(QWidget):
             success = vm_manager.switch_to_vm_environment(container_id)
             
             if success:
-                print(f"💻 Successfully switched to VM environment: {container_id}")
+                logger.debug("💻 Successfully switched to VM environment: %s", container_id)
                 # Also update multi-environment manager tracking
                 from src.envstarter.core.enhanced_app_controller import EnhancedAppController
                 controller = EnhancedAppController()
                 controller.switch_to_container(container_id)
             else:
-                print(f"⚠️ Failed to switch to VM environment: {container_id}")
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "Switch Error", f"Failed to switch to VM environment: {container_id}")
+                logger.warning("⚠️ Failed to switch to VM environment: %s", container_id)
+                self._show(QMessageBox.Icon.Warning, "Switch Error", f"Failed to switch to VM environment: {container_id}")
                 
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Switch Error", f"Failed to switch to environment: {str(e)}")
-            print(f"❌ Error switching to environment: {e}")
+            self._show(QMessageBox.Icon.Warning, "Switch Error", f"Failed to switch to environment: {str(e)}")
+            logger.error("❌ Error switching to environment: %s", e)
     
     def show_quick_launch_dialog(self):
         """Show quick launch dialog."""
@@ -1403,6 +1815,13 @@ class MultiEnvironmentDashboard(QWidget):
                 self.tab_widget.setCurrentIndex(i)
                 break
     
+    def showEvent(self, event):
+        """Refresh on the next tick whenever the dashboard is shown again."""
+        super().showEvent(event)
+        self._dirty = True
+        if not self.launcher.is_launching:
+            self.refresh_timer.start(self._refresh_interval_ms)
+    
     def closeEvent(self, event):
         """Handle window close event."""
         self.refresh_timer.stop()
@@ -564,7 +564,7 @@ class EnvironmentEditDialog(QDialog):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             app = edit_widget.get_application()
             if app.name and app.path:
-                self.environment.applications.append(app)
+                self.environment.add_application(app)
                 self.populate_applications_table()
     
     def edit_application(self, row: int):
@@ -615,7 +615,7 @@ class EnvironmentEditDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.environment.applications.pop(row)
+            self.environment.remove_application(row)
             self.populate_applications_table()
     
     def add_website(self):
@@ -644,7 +644,7 @@ class EnvironmentEditDialog(QDialog):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             website = edit_widget.get_website()
             if website.name and website.url:
-                self.environment.websites.append(website)
+                self.environment.add_website(website)
                 self.populate_websites_table()
     
     def edit_website(self, row: int):
@@ -695,7 +695,7 @@ class EnvironmentEditDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.environment.websites.pop(row)
+            self.environment.remove_website(row)
             self.populate_websites_table()
     
     def save_environment(self):
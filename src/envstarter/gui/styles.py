@@ -0,0 +1,344 @@
+"""
+Shared stylesheets for EnvStarter windows.
+
+Qt parses a stylesheet every time one is set on a widget. Keeping the
+rules for a window in one sheet, set once on the top-level widget and
+matched by object name or class, means the CSS is parsed once instead
+of once per child widget.
+"""
+
+# Environment selector window (EnvironmentSelector and its children).
+# WCAG AA compliant colors and improved accessibility.
+STYLESHEET = """
+    /* Launch progress */
+    QProgressBar#launch-progress-bar {
+        border: 2px solid #d1d5da;
+        border-radius: 12px;
+        background-color: #f6f8fa;
+        text-align: center;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    QProgressBar#launch-progress-bar::chunk {
+        background-color: #28a745;
+        border-radius: 10px;
+        margin: 1px;
+    }
+    QLabel#launch-status {
+        color: #24292e;
+        font-size: 13px;
+        font-weight: 500;
+        padding: 8px;
+        background-color: #f1f8ff;
+        border: 1px solid #c8e1ff;
+        border-radius: 6px;
+        margin: 4px 0;
+    }
+    QTextEdit#launch-log {
+        font-family: 'SF Mono', Monaco, 'Cascadia Code', 'Roboto Mono', Consolas, monospace;
+        font-size: 11px;
+        line-height: 1.4;
+        background-color: #f6f8fa;
+        border: 2px solid #d1d5da;
+        border-radius: 8px;
+        padding: 8px;
+        color: #24292e;
+    }
+    QTextEdit#launch-log:focus {
+        border-color: #0366d6;
+        outline: none;
+    }
+
+    /* Header */
+    QLabel#main-title {
+        color: #24292e;
+        margin-bottom: 8px;
+        letter-spacing: -0.5px;
+    }
+    QLabel#subtitle {
+        color: #586069;
+        font-size: 16px;
+        font-weight: 400;
+        letter-spacing: 0.1px;
+    }
+    QLabel#section-header {
+        font-weight: 600;
+        font-size: 16px;
+        color: #24292e;
+        margin-bottom: 8px;
+        padding: 4px 0;
+    }
+    QLabel#nav-hint {
+        color: #6a737d;
+        font-size: 12px;
+        font-style: italic;
+        margin-bottom: 8px;
+    }
+
+    /* Environment list */
+    QListWidget#environment-list {
+        border: 2px solid #d1d5da;
+        border-radius: 8px;
+        background-color: #fafbfc;
+        padding: 8px;
+        outline: none;
+    }
+    QListWidget#environment-list:focus {
+        border-color: #0366d6;
+        border-width: 3px;
+    }
+    QListWidget#environment-list::item {
+        border: none;
+        padding: 0px;
+        margin: 4px;
+        border-radius: 6px;
+    }
+    QListWidget#environment-list::item:selected {
+        background-color: transparent;
+    }
+    QListWidget#environment-list::item:focus {
+        outline: 2px solid #0366d6;
+        outline-offset: 2px;
+    }
+
+    /* Details */
+    QLabel#details-text {
+        border: 2px solid #d1d5da;
+        border-radius: 8px;
+        background-color: #f6f8fa;
+        padding: 12px;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        font-size: 13px;
+        line-height: 1.5;
+        color: #24292e;
+    }
+
+    /* Buttons */
+    QPushButton#primary-button {
+        background-color: #28a745;
+        color: white;
+        border: 2px solid #28a745;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: 600;
+        min-width: 160px;
+    }
+    QPushButton#primary-button:hover {
+        background-color: #218838;
+        border-color: #1e7e34;
+        border-width: 3px;
+    }
+    QPushButton#primary-button:focus {
+        outline: 3px solid #28a745;
+        outline-offset: 2px;
+    }
+    QPushButton#primary-button:disabled {
+        background-color: #e9ecef;
+        border-color: #dee2e6;
+        color: #6c757d;
+    }
+    QPushButton#secondary-button {
+        background-color: #0366d6;
+        color: white;
+        border: 2px solid #0366d6;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: 500;
+        min-width: 120px;
+    }
+    QPushButton#secondary-button:hover {
+        background-color: #0256cc;
+        border-color: #0256cc;
+        border-width: 3px;
+    }
+    QPushButton#secondary-button:focus {
+        outline: 3px solid #0366d6;
+        outline-offset: 2px;
+    }
+    QPushButton#launch-all-button {
+        background-color: #fd7e14;
+        color: white;
+        border: 2px solid #fd7e14;
+        border-radius: 6px;
+        padding: 4px 12px;
+        font-size: 11px;
+        font-weight: 600;
+    }
+    QPushButton#launch-all-button:hover {
+        background-color: #e8590c;
+        border-color: #e8590c;
+    }
+    QPushButton#stop-all-button {
+        background-color: #dc3545;
+        color: white;
+        border: 2px solid #dc3545;
+        border-radius: 6px;
+        padding: 4px 12px;
+        font-size: 11px;
+        font-weight: 600;
+    }
+    QPushButton#stop-all-button:hover {
+        background-color: #c82333;
+        border-color: #c82333;
+    }
+    QPushButton#dashboard-button {
+        background-color: #6f42c1;
+        color: white;
+        border: 2px solid #6f42c1;
+        border-radius: 6px;
+        padding: 4px 12px;
+        font-size: 11px;
+        font-weight: 600;
+    }
+    QPushButton#dashboard-button:hover {
+        background-color: #5a32a3;
+        border-color: #5a32a3;
+    }
+    QPushButton#tertiary-button {
+        background-color: #ffeaa7;
+        color: #2d3436;
+        border: 2px solid #fdcb6e;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    QPushButton#tertiary-button:hover {
+        background-color: #fdcb6e;
+        border-color: #e17055;
+        border-width: 3px;
+    }
+    QPushButton#tertiary-button:focus {
+        outline: 3px solid #fdcb6e;
+        outline-offset: 2px;
+    }
+    QPushButton#danger-button {
+        background-color: #fff5f5;
+        color: #dc3545;
+        border: 2px solid #dc3545;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    QPushButton#danger-button:hover {
+        background-color: #dc3545;
+        color: white;
+        border-width: 3px;
+    }
+    QPushButton#danger-button:focus {
+        outline: 3px solid #dc3545;
+        outline-offset: 2px;
+    }
+"""
+
+# Multi-environment dashboard (MultiEnvironmentDashboard and its container cards).
+DASHBOARD_STYLESHEET = """
+    /* Container cards */
+    ContainerStatusCard {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8f9fa);
+        border: 2px solid #e1e4e8;
+        border-radius: 12px;
+        margin: 8px;
+        padding: 12px;
+    }
+    ContainerStatusCard:hover {
+        border-color: #0366d6;
+    }
+    QLabel#card-meta {
+        color: #586069;
+        font-size: 12px;
+    }
+
+    /* Header and status */
+    QPushButton#dashboard-settings-button {
+        background-color: #0366d6;
+        color: white;
+        border: 2px solid #0366d6;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    QPushButton#dashboard-settings-button:hover {
+        background-color: #0256cc;
+        border-color: #0256cc;
+    }
+    QLabel#dashboard-status {
+        background-color: #f8f9fa;
+        border: 1px solid #e1e4e8;
+        border-radius: 6px;
+        padding: 12px;
+        color: #586069;
+        font-size: 14px;
+    }
+
+    /* Resources tab */
+    QLabel#resource-containers {
+        font-weight: bold;
+        color: #0366d6;
+    }
+    QLabel#resource-processes {
+        font-weight: bold;
+        color: #28a745;
+    }
+    QLabel#resource-memory {
+        font-weight: bold;
+        color: #fd7e14;
+    }
+    QLabel#resource-cpu {
+        font-weight: bold;
+        color: #dc3545;
+    }
+    QLabel#chart-placeholder {
+        background-color: #f8f9fa;
+        border: 2px dashed #d1d5da;
+        border-radius: 8px;
+        padding: 40px;
+        color: #586069;
+        font-size: 16px;
+    }
+
+    /* Card action buttons */
+    QPushButton#card-switch-button,
+    QPushButton#card-pause-button,
+    QPushButton#card-resume-button,
+    QPushButton#card-stop-button {
+        border: none;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-size: 11px;
+        font-weight: 500;
+    }
+    QPushButton#card-switch-button {
+        background-color: #0366d6;
+        color: white;
+    }
+    QPushButton#card-switch-button:hover {
+        background-color: #0256cc;
+    }
+    QPushButton#card-pause-button {
+        background-color: #ffc107;
+        color: #212529;
+    }
+    QPushButton#card-pause-button:hover {
+        background-color: #e0a800;
+    }
+    QPushButton#card-resume-button {
+        background-color: #28a745;
+        color: white;
+    }
+    QPushButton#card-resume-button:hover {
+        background-color: #218838;
+    }
+    QPushButton#card-stop-button {
+        background-color: #dc3545;
+        color: white;
+    }
+    QPushButton#card-stop-button:hover {
+        background-color: #c82333;
+    }
+"""